@@ -1,182 +1,90 @@
 # -*- coding: utf-8 -*-
 """
-📐 LUDARP Calculator v1.7
+📐 LUDARP Calculator v2.0
 Robust extraction + Unit Conversion + Math Operations.
 Fixed: Unit conversion now correctly respects selected target units.
+New: Level Table batch mode (sequential / pairwise differences in one run).
+New: Running Total session mode (keep picking, log once at the end).
+Fixed: Running Total brackets its expression where picks apply before precedence would, e.g. (A + B) × C.
+New: Custom formulas over picked values (see ludarp.expr).
+New: Cached formatters per (document units, unit, accuracy) with bulk formatting.
+Fixed: Formatting outside Revit's engine now uses the exact unit engine (ludarp.units),
+so Fractional Inches are no longer shown as decimal feet.
+New: Type-dispatched extraction with per-type parameter caching (ludarp.extract).
+New: Dimension Segments mode (sum / min / max / per-segment listing of dimension strings).
+Refactor: Formatting, extraction, history and pickers live in the shared ludarp library (lib/).
+New: Values and names of picked elements are cached per document (ludarp.extract), so repeat
+picks skip the API until the element changes.
 """
 __title__ = "Calculator"
 __author__ = "PRADUL P"
 
 import math
-import os
-import json
-import tempfile
-from datetime import datetime
 from pyrevit import revit, forms, script
-from Autodesk.Revit.DB import (
-    Level, LocationPoint, SpotDimension, Dimension, BuiltInParameter,
-    SpecTypeId, UnitTypeId, UnitFormatUtils, FormatOptions
-)
+from Autodesk.Revit.DB import Level, SpotDimension, Dimension, FilteredElementCollector
 from Autodesk.Revit.Exceptions import OperationCanceledException
-from Autodesk.Revit.UI.Selection import ObjectType
-
-# ---------- Configuration ----------
-UNITS = {
-    "m": {"label": "Meters", "id": UnitTypeId.Meters},
-    "cm": {"label": "Centimeters", "id": UnitTypeId.Centimeters},
-    "mm": {"label": "Millimeters", "id": UnitTypeId.Millimeters},
-    "ft": {"label": "Feet", "id": UnitTypeId.Feet},
-    "fi": {"label": "Fractional Inches", "id": UnitTypeId.FeetFractionalInches}
-}
-
-# ---------- Helpers ----------
-def detect_project_unit(doc):
-    try:
-        units = doc.GetUnits()
-        fmt = units.GetFormatOptions(SpecTypeId.Length)
-        uid = fmt.GetUnitTypeId()
-        
-        if uid == UnitTypeId.Meters: return "m"
-        if uid == UnitTypeId.Centimeters: return "cm"
-        if uid == UnitTypeId.Millimeters: return "mm"
-        if uid == UnitTypeId.Feet: return "ft"
-        if uid == UnitTypeId.FeetFractionalInches: return "fi"
-    except:
-        pass
-    return "m"
+from Autodesk.Revit.UI.Selection import ObjectType, ISelectionFilter
+from ludarp.extract import dimension_segments, get_ref_info, get_value_cache
+from ludarp.formatting import UNITS, detect_project_unit, get_formatters
+from ludarp.history import make_history_entry, append_history
+from ludarp.pickers import safe_pick_object, safe_pick_point
+from ludarp import metrics
 
-def format_value(doc, value_feet, unit_key):
-    """Format numeric value into a specific unit using Revit's engine."""
-    try:
-        # Create custom format options for the target unit
-        target_uid = UNITS.get(unit_key, {}).get("id", UnitTypeId.Meters)
-        fo = FormatOptions(target_uid)
-        
-        # Adjust accuracy based on unit
-        if unit_key == "m": fo.Accuracy = 0.001
-        elif unit_key in ["cm", "mm"]: fo.Accuracy = 1.0
-        
-        return UnitFormatUtils.Format(doc.GetUnits(), SpecTypeId.Length, value_feet, False, fo)
-    except Exception as e:
-        # Fallback manual conversion if Revit API fails
-        factors = {"m": 0.3048, "cm": 30.48, "mm": 304.8, "ft": 1.0, "fi": 1.0}
-        factor = factors.get(unit_key, 1.0)
-        val = value_feet * factor
-        return "{:.3f} {}".format(val, unit_key)
-
-def safe_pick_object(uidoc, prompt="🖱️ Pick element"):
-    try:
-        return uidoc.Selection.PickObject(ObjectType.Element, prompt)
-    except OperationCanceledException:
-        return None
-    except Exception as e:
-        forms.alert("Selection error:\n{}".format(e), title="Selection Error")
-        return None
+logger = script.get_logger()
 
-def safe_pick_point(uidoc, prompt="📍 Pick point"):
-    try:
-        return uidoc.Selection.PickPoint(prompt)
-    except OperationCanceledException:
-        return None
-    except Exception as e:
-        forms.alert("Point pick error:\n{}".format(e), title="Selection Error")
-        return None
-
-def get_ref_info(doc, ref):
-    """Resolve element category/type and name from selection reference."""
-    try:
-        el = doc.GetElement(ref)
-        if not el:
-            return "Manual Point"
-        el_type = el.GetType().Name
-        el_name = el.Name
-        if not el_name or el_name == el_type:
-            if hasattr(el, "Category") and el.Category:
-                return "{0} (ID: {1})".format(el.Category.Name, el.Id)
-        return "{0}: {1}".format(el_type, el_name)
-    except Exception:
-        return "Manual Point"
+# Binary math operations (labels are also what gets logged to history)
+OP_SUBTRACT = "➖ Subtraction (A-B)"
+OPS = {
+    "➕ Addition (A+B)": lambda a, b: a + b,
+    OP_SUBTRACT: lambda a, b: a - b,
+    "✖️ Multiplication (A*B)": lambda a, b: a * b,
+    "➗ Division (A/B)": lambda a, b: a / b if abs(b) > 1e-9 else None
+}
+FORMULA_OP = "🧮 Custom Formula (A, B)"
+FORMULA_PREFIX = "Formula: "
+OP_SYMBOLS = {
+    "➕ Addition (A+B)": "+",
+    OP_SUBTRACT: "−",
+    "✖️ Multiplication (A*B)": "×",
+    "➗ Division (A/B)": "÷"
+}
 
-def log_calculation(doc, ref_a, val_a_str, ref_b, val_b_str, op, res_val_str):
-    """Log the calculation to the system temp directory as JSON."""
+# ---------- Helpers ----------
+def log_calculation(doc, ref_a, val_a_str, ref_b, val_b_str, op, res_val_str,
+                    a_ft=None, b_ft=None, res_ft=None):
+    """Append the calculation to the history log in the system temp directory (JSON Lines)."""
     try:
-        temp_dir = tempfile.gettempdir()
-        log_path = os.path.join(temp_dir, "calculator_history.json")
-        
-        history = []
-        if os.path.exists(log_path):
-            with open(log_path, "r") as f:
-                try:
-                    history = json.load(f)
-                except Exception:
-                    pass
-        
-        a_info = get_ref_info(doc, ref_a)
-        b_info = get_ref_info(doc, ref_b)
-        
-        entry = {
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "element_a": a_info,
-            "value_a": val_a_str,
-            "element_b": b_info,
-            "value_b": val_b_str,
-            "operation": op,
-            "result": res_val_str
-        }
-        
-        history.append(entry)
-        # Keep only the last 100 entries
-        history = history[-100:]
-        
-        with open(log_path, "w") as f:
-            json.dump(history, f, indent=4)
+        entry = make_history_entry(
+            get_ref_info(doc, ref_a), val_a_str,
+            get_ref_info(doc, ref_b), val_b_str,
+            op, res_val_str, a_ft, b_ft, res_ft
+        )
     except Exception:
-        pass
+        return
+    # One appended line per calculation: no need to re-read the whole log
+    append_history([entry])
 
 # ---------- Extraction Logic ----------
-def extract_elevation(doc, reference):
+def extract_elevation(doc, reference, allow_fallback=True):
+    """
+    Extract a numeric value (decimal feet) from a picked reference or element id.
+    With allow_fallback=False (batch modes) no manual point is requested.
+    """
+    # 1-5. Type-dispatched strategies (Levels, Spots, Dimensions, points, parameters), cached
+    with metrics.phase("collect"):
+        value = get_value_cache(doc).value(doc, reference)
+    if value is not None:
+        return value
+
+    # 6. Fallback
+    if not allow_fallback:
+        return None
     try:
         el = doc.GetElement(reference)
     except:
         return None
-
-    # 1. Levels
-    if isinstance(el, Level):
-        return el.Elevation
-
-    # 2. Spot Dimensions
-    if isinstance(el, SpotDimension):
-        try:
-            if hasattr(el, "Origin"):
-                return el.Origin.Z
-        except:
-            pass
-        p = el.get_Parameter(BuiltInParameter.DIM_VALUE_LENGTH)
-        if p: return p.AsDouble()
-
-    # 3. Dimensions
-    if isinstance(el, Dimension):
-        try:
-            if el.Value is not None:
-                return el.Value
-            if hasattr(el, "Segments") and el.Segments.Size > 0:
-                return el.Segments.get_Item(0).Value
-        except:
-            pass
-
-    # 4. Elements with LocationPoint
-    loc = getattr(el, "Location", None)
-    if isinstance(loc, LocationPoint):
-        return loc.Point.Z
-
-    # 5. Parameter Search
-    params = ["Elevation", "Elevation from Level", "ELEVATION", "Offset"]
-    for p_name in params:
-        p = el.LookupParameter(p_name)
-        if p and p.StorageType.ToString() == "Double":
-            return p.AsDouble()
-
-    # 6. Fallback
+    if el is None:
+        return None
     choice = forms.alert(
         "Could not auto-extract value from '{}'.\nWould you like to pick a manual point?".format(el.Name),
         options=["Yes, pick point", "No, cancel"],
@@ -188,19 +96,46 @@ def extract_elevation(doc, reference):
 
     return None
 
+# ---------- Formulas ----------
+def ask_formula(default="A - B", variables=("A", "B")):
+    """Ask for a formula over the given variables and compile it (re-prompts on errors)."""
+    # The expression engine loads only for formula runs
+    from ludarp.expr import compile_expression, ExpressionError
+    source = default
+    while True:
+        source = forms.ask_for_string(
+            default=source,
+            prompt="🧮 Formula over {0} (use unit suffixes for lengths, e.g. max(A - B, 0) + 1200mm):".format(
+                ", ".join(variables)),
+            title="LUDARP: Custom Formula"
+        )
+        if not source:
+            return None
+        try:
+            expr = compile_expression(source)
+            unknown = [v for v in expr.variables if v not in variables]
+            if unknown:
+                raise ExpressionError("Unknown variable(s): {0}".format(", ".join(unknown)))
+            return expr
+        except ExpressionError as ex:
+            forms.alert("Invalid formula:\n{}".format(ex), title="Formula Error")
+
 # ---------- UI Loops ----------
-def conversion_loop(doc, value_feet):
+# Unit label -> key, built once for the conversion picker
+UNIT_CHOICES = {UNITS[k]["label"]: k for k in UNITS}
+UNIT_LABELS = sorted(UNIT_CHOICES.keys())
+
+def conversion_loop(formatters, value_feet):
     while True:
-        options = {UNITS[k]["label"]: k for k in UNITS}
         choice = forms.SelectFromList.show(
-            sorted(options.keys()), 
+            UNIT_LABELS, 
             title="🎯 Convert Result To", 
             multiselect=False
         )
         if not choice: return
 
-        unit_key = options[choice]
-        formatted = format_value(doc, value_feet, unit_key)
+        unit_key = UNIT_CHOICES[choice]
+        formatted = formatters.format(value_feet, unit_key)
         
         res = forms.alert(
             "💎 Converted Value:\n\n{0}".format(formatted),
@@ -215,11 +150,333 @@ def conversion_loop(doc, value_feet):
         if res == "❌ Close":
             return
 
-# ---------- Main Execution ----------
-def main():
-    doc = revit.doc
-    uidoc = revit.uidoc
+# ---------- Batch: Level Table ----------
+BATCH_SOURCES = ["🏢 All Levels in Project", "🖱️ Pick Levels / Spots / Dimensions"]
+BATCH_MODES = ["📶 Sequential (Floor-to-Floor)", "🔀 Pairwise (All Pairs)"]
+BATCH_OPERATIONS = ["➖ Difference (To - From)", "🧮 Custom Formula (A = To, B = From)"]
+TABLE_COLUMNS = ["#", "From", "From Value", "To", "To Value"]
+
+class ValueSourceFilter(ISelectionFilter):
+    """Selection filter allowing only elements with a directly readable value."""
+    def AllowElement(self, el):
+        return isinstance(el, (Level, SpotDimension, Dimension))
+
+    def AllowReference(self, ref, point):
+        return False
+
+def collect_batch_elements(doc, uidoc):
+    """Collect every Level in the project, or a multi-pick set of value elements."""
+    source = forms.CommandSwitchWindow.show(BATCH_SOURCES, message="🏢 Values to tabulate:")
+    if not source:
+        return None
+    if source == BATCH_SOURCES[0]:
+        with metrics.phase("collect"):
+            metrics.count("FilteredElementCollector")
+            return list(FilteredElementCollector(doc).OfClass(Level).ToElements())
+    try:
+        with metrics.phase("pick"):
+            refs = uidoc.Selection.PickObjects(
+                ObjectType.Element, ValueSourceFilter(),
+                "🖱️ Pick Levels, Spot Dimensions or Dimensions, then click Finish"
+            )
+    except OperationCanceledException:
+        return None
+    metrics.count("Document.GetElement", len(refs))
+    return [doc.GetElement(r) for r in refs]
+
+def extract_values(doc, elements):
+    """Extract values in one pass, sorted ascending. Elements without a value are skipped."""
+    with metrics.phase("collect"):
+        # Elements are already resolved: cached values or direct dispatch, no GetElement round-trip
+        values = get_value_cache(doc).values_of(elements)
+        items = [(el, val) for el, val in zip(elements, values) if val is not None]
+        items.sort(key=lambda it: it[1])
+    return items
+
+def pair_indices(count, pairwise=False):
+    """
+    Index pairs (i, j) over sorted values: neighbours for sequential (floor-to-floor),
+    every i < j for pairwise.
+    """
+    if pairwise:
+        return [(i, j) for i in range(count) for j in range(i + 1, count)]
+    return [(i - 1, i) for i in range(1, count)]
+
+def evaluate_pairs(values, pairs, expr=None):
+    """
+    Results for all pairs as one array: values[j] - values[i], or the compiled
+    formula with A = values[j] (To) and B = values[i] (From). Failed rows are None.
+    """
+    with metrics.phase("plan"):
+        if expr is None:
+            return [values[j] - values[i] for i, j in pairs]
+        from ludarp.expr import ExpressionError
+        results = []
+        for i, j in pairs:
+            try:
+                results.append(expr.evaluate({"A": values[j], "B": values[i]}))
+            except ExpressionError:
+                results.append(None)
+        return results
+
+def _csv_cell(value):
+    value = u"{}".format(value)
+    if any(c in value for c in u',"\r\n'):
+        return u'"' + value.replace(u'"', u'""') + u'"'
+    return value
+
+def export_table_csv(columns, rows, default_name):
+    """Save a result table to CSV (UTF-8, one encoding step per row)."""
+    dest_file = forms.save_file(file_ext="csv", default_name=default_name)
+    if not dest_file:
+        return
+    try:
+        with open(dest_file, "wb") as f:
+            for row in [columns] + rows:
+                f.write((u",".join(_csv_cell(v) for v in row) + u"\r\n").encode("utf-8"))
+        forms.toast("Table exported to CSV!")
+    except Exception as ex:
+        forms.alert("Error exporting CSV:\n{}".format(ex))
+
+def show_table(title, columns, rows, unit_label, csv_name, summary=None):
+    """
+    Print the table to the pyRevit output window and offer copy/export.
+    summary: optional (columns, rows) printed above the main table.
+    """
+    output = script.get_output()
+    output.print_md("## {}".format(title))
+    if summary:
+        output.print_table(table_data=summary[1], columns=summary[0], title="Summary")
+    output.print_table(table_data=rows, columns=columns, title="Units: {}".format(unit_label))
 
+    choice = forms.alert(
+        "{} row(s) calculated.\nSee the output window for the full table.".format(len(rows)),
+        title=title,
+        options=["📋 Copy Table", "💾 Export CSV", "❌ Close"]
+    )
+    if choice == "📋 Copy Table":
+        lines = ["\t".join(u"{}".format(v) for v in row) for row in [columns] + rows]
+        script.clipboard_copy("\n".join(lines))
+        forms.toast("Table copied to clipboard!")
+    elif choice == "💾 Export CSV":
+        export_table_csv(columns, rows, csv_name)
+
+def level_table_mode(doc, uidoc, formatters):
+    elements = collect_batch_elements(doc, uidoc)
+    if not elements: return
+
+    items = extract_values(doc, elements)
+    if len(items) < 2:
+        forms.alert("At least two elements with readable values are required.", title="Level Table")
+        return
+
+    mode = forms.CommandSwitchWindow.show(BATCH_MODES, message="📶 Pairs to compute:")
+    if not mode: return
+    operation = forms.CommandSwitchWindow.show(BATCH_OPERATIONS, message="🛠️ Value per pair:")
+    if not operation: return
+
+    expr = None
+    if operation == BATCH_OPERATIONS[1]:
+        expr = ask_formula()
+        if not expr: return
+
+    values = [v for _, v in items]
+    pairs = pair_indices(len(values), pairwise=(mode == BATCH_MODES[1]))
+    results = evaluate_pairs(values, pairs, expr)
+    op_name = FORMULA_PREFIX + expr.source if expr else OP_SUBTRACT
+
+    # Resolve units, names and formatted values once per element, in bulk
+    proj_unit = detect_project_unit(doc)
+    names = [get_ref_info(doc, el) for el, _ in items]
+    values_fmt = formatters.format_many(values, proj_unit)
+    results_fmt = formatters.format_many([r for r in results if r is not None], proj_unit)
+    results_fmt.reverse()
+
+    rows, entries = [], []
+    for n, ((i, j), res) in enumerate(zip(pairs, results), 1):
+        res_fmt = results_fmt.pop() if res is not None else "—"
+        rows.append([n, names[i], values_fmt[i], names[j], values_fmt[j], res_fmt])
+        if res is not None:
+            entries.append(make_history_entry(
+                names[j], values_fmt[j], names[i], values_fmt[i],
+                op_name, res_fmt, values[j], values[i], res
+            ))
+
+    # One history write for the whole table
+    append_history(entries)
+    columns = TABLE_COLUMNS + [expr.source if expr else "Difference (To - From)"]
+    show_table("📶 Level Table", columns, rows, UNITS[proj_unit]["label"], "LUDARP_Level_Table.csv")
+
+# ---------- Batch: Dimension Segments ----------
+SEGMENT_COLUMNS = ["#", "Dimension", "Segment", "Value"]
+SUMMARY_COLUMNS = ["Dimension", "Segments", "Sum", "Min", "Max"]
+OP_SEGMENT_SUM = "Σ Sum of Segments"
+
+class DimensionFilter(ISelectionFilter):
+    """Selection filter allowing only linear/angular dimensions (no spot dimensions)."""
+    def AllowElement(self, el):
+        return isinstance(el, Dimension) and not isinstance(el, SpotDimension)
+
+    def AllowReference(self, ref, point):
+        return False
+
+def dimension_segments_mode(doc, uidoc, formatters):
+    try:
+        refs = uidoc.Selection.PickObjects(
+            ObjectType.Element, DimensionFilter(),
+            "📏 Pick one or more Dimensions, then click Finish"
+        )
+    except OperationCanceledException:
+        return
+    dims = [doc.GetElement(r) for r in refs]
+
+    # One pass over each dimension's segment array
+    per_dim = []
+    for dim in dims:
+        segments = dimension_segments(dim)
+        if segments:
+            per_dim.append((get_ref_info(doc, dim), segments))
+    if not per_dim:
+        forms.alert("No dimension segment values found.", title="Dimension Segments")
+        return
+
+    all_values = [v for _, segments in per_dim for v in segments]
+    proj_unit = detect_project_unit(doc)
+    all_fmt = formatters.format_many(all_values, proj_unit)
+
+    rows, summary, entries = [], [], []
+    pos = 0
+    for info, segments in per_dim:
+        seg_fmt = all_fmt[pos:pos + len(segments)]
+        pos += len(segments)
+        for k, text in enumerate(seg_fmt, 1):
+            rows.append([len(rows) + 1, info, k, text])
+
+        total = sum(segments)
+        lo, hi = min(segments), max(segments)
+        total_fmt, lo_fmt, hi_fmt = formatters.format_many([total, lo, hi], proj_unit)
+        summary.append([info, len(segments), total_fmt, lo_fmt, hi_fmt])
+        entries.append(make_history_entry(
+            info, "{} segment(s)".format(len(segments)),
+            "Min / Max", "{} / {}".format(lo_fmt, hi_fmt),
+            OP_SEGMENT_SUM, total_fmt, None, None, total
+        ))
+
+    if len(per_dim) > 1:
+        total = sum(all_values)
+        total_fmt, lo_fmt, hi_fmt = formatters.format_many([total, min(all_values), max(all_values)], proj_unit)
+        summary.append(["Σ All Dimensions", len(all_values), total_fmt, lo_fmt, hi_fmt])
+
+    # One history write for all dimensions
+    append_history(entries)
+    show_table("📏 Dimension Segments", SEGMENT_COLUMNS, rows, UNITS[proj_unit]["label"],
+               "LUDARP_Dimension_Segments.csv", summary=(SUMMARY_COLUMNS, summary))
+
+# ---------- Session: Running Total ----------
+SESSION_OPS = [
+    ("➕ Add", "➕ Addition (A+B)"),
+    ("➖ Subtract", OP_SUBTRACT),
+    ("✖️ Multiply", "✖️ Multiplication (A*B)"),
+    ("➗ Divide", "➗ Division (A/B)")
+]
+SESSION_FINISH = "✅ Finish Session"
+# Binding strength of each operation, for bracketing the running expression
+OP_PRECEDENCE = {
+    "➕ Addition (A+B)": 1,
+    OP_SUBTRACT: 1,
+    "✖️ Multiplication (A*B)": 2,
+    "➗ Division (A/B)": 2
+}
+
+def term_label(index):
+    """Spreadsheet-style operand label: 0 -> A, 25 -> Z, 26 -> AA."""
+    label = ""
+    index += 1
+    while index:
+        index, rem = divmod(index - 1, 26)
+        label = chr(65 + rem) + label
+    return label
+
+def extend_expression(expr, last_op, op, label):
+    """
+    Append "op label" to a running expression evaluated left to right.
+    The expression so far is bracketed when op binds tighter than its last
+    operation, so (A + B) × C reads the way the running total computes it.
+    """
+    if last_op is not None and OP_PRECEDENCE[op] > OP_PRECEDENCE[last_op]:
+        expr = "({0})".format(expr)
+    return "{0} {1} {2}".format(expr, OP_SYMBOLS[op], label)
+
+def session_mode(doc, uidoc, formatters):
+    """
+    Keep picking elements into one running expression (A + B + C − D ...),
+    applied in the order picked. Units and the formatter are resolved once;
+    history is written once at the end.
+    """
+    proj_unit = detect_project_unit(doc)
+    fmt = formatters.formatter(proj_unit)
+    op_map = dict(SESSION_OPS)
+    choices = [label for label, _ in SESSION_OPS] + [SESSION_FINISH]
+
+    ref = safe_pick_object(uidoc, "1️⃣ Pick First Element (A)")
+    if not ref: return
+    total = extract_elevation(doc, ref)
+    if total is None: return
+
+    expr, last_op = "A", None
+    lines = ["🔹 A: {0} = {1}".format(get_ref_info(doc, ref), fmt(total))]
+    entries = []
+
+    while True:
+        total_fmt = fmt(total)
+        msg = "{0}\n\n🧾 {1}\n✅ Running Total: {2}\n\n🛠️ Next operation:".format(
+            "\n".join(lines[-8:]), expr, total_fmt)
+        choice = forms.CommandSwitchWindow.show(choices, message=msg)
+        if not choice or choice == SESSION_FINISH:
+            break
+
+        op = op_map[choice]
+        label = term_label(len(lines))
+        ref = safe_pick_object(uidoc, "🖱️ Pick Element {0} (Esc to go back)".format(label))
+        if not ref: continue
+        val = extract_elevation(doc, ref)
+        if val is None: continue
+
+        new_total = OPS[op](total, val)
+        if new_total is None:
+            forms.alert("Error: Division by zero!", title="Math Error")
+            continue
+
+        info, val_fmt, new_fmt = get_ref_info(doc, ref), fmt(val), fmt(new_total)
+        entries.append(make_history_entry(
+            "Σ ({0})".format(expr), total_fmt,
+            info, val_fmt, op, new_fmt, total, val, new_total
+        ))
+        expr, last_op = extend_expression(expr, last_op, op, label), op
+        lines.append("🔹 {0}: {1} = {2}".format(label, info, val_fmt))
+        total = new_total
+
+    if not entries:
+        return
+
+    # One history write for the whole session
+    append_history(entries)
+
+    R_fmt = fmt(total)
+    final_choice = forms.alert(
+        "🧾 {0}\n🏠 Detected Units: {1}\n\n✅ Result: {2}".format(
+            expr, UNITS[proj_unit]["label"], R_fmt),
+        title="LUDARP Calculator Session",
+        options=["📋 Copy Result", "🎯 Convert Units", "❌ Close"]
+    )
+    if final_choice == "📋 Copy Result":
+        script.clipboard_copy(R_fmt)
+        forms.toast("Result copied!")
+    elif final_choice == "🎯 Convert Units":
+        conversion_loop(formatters, total)
+
+# ---------- Single Calculation ----------
+def single_calculation(doc, uidoc, formatters):
     # Step 1: Pick Values
     refA = safe_pick_object(uidoc, "1️⃣ Pick First Element (Level/Spot/Dimension)")
     if not refA: return
@@ -234,29 +491,34 @@ def main():
     if B_ft is None: return
 
     # Step 2: Math Operation
-    ops = {
-        "➕ Addition (A+B)": lambda a, b: a + b,
-        "➖ Subtraction (A-B)": lambda a, b: a - b,
-        "✖️ Multiplication (A*B)": lambda a, b: a * b,
-        "➗ Division (A/B)": lambda a, b: a / b if abs(b) > 1e-9 else None
-    }
-    
-    op_choice = forms.CommandSwitchWindow.show(sorted(ops.keys()), message="🛠️ Choose Operation:")
+    op_choice = forms.CommandSwitchWindow.show(sorted(OPS.keys()) + [FORMULA_OP], message="🛠️ Choose Operation:")
     if not op_choice: return
 
-    res_ft = ops[op_choice](A_ft, B_ft)
+    if op_choice == FORMULA_OP:
+        expr = ask_formula()
+        if not expr: return
+        op_choice = FORMULA_PREFIX + expr.source
+        from ludarp.expr import ExpressionError
+        try:
+            res_ft = expr.evaluate({"A": A_ft, "B": B_ft})
+        except ExpressionError as ex:
+            forms.alert("Error: {}".format(ex), title="Math Error")
+            return
+    else:
+        res_ft = OPS[op_choice](A_ft, B_ft)
     if res_ft is None:
         forms.alert("Error: Division by zero!", title="Math Error")
         return
 
     # Step 3: Display & Log Results
     proj_unit = detect_project_unit(doc)
-    A_fmt = format_value(doc, A_ft, proj_unit)
-    B_fmt = format_value(doc, B_ft, proj_unit)
-    R_fmt = format_value(doc, res_ft, proj_unit)
+    fmt = formatters.formatter(proj_unit)
+    A_fmt = fmt(A_ft)
+    B_fmt = fmt(B_ft)
+    R_fmt = fmt(res_ft)
 
     # Automatically log the calculation to history
-    log_calculation(doc, refA, A_fmt, refB, B_fmt, op_choice, R_fmt)
+    log_calculation(doc, refA, A_fmt, refB, B_fmt, op_choice, R_fmt, A_ft, B_ft, res_ft)
 
     msg = (
         "📊 Operation: {op}\n"
@@ -276,8 +538,27 @@ def main():
         script.clipboard_copy(R_fmt)
         forms.toast("Result copied!")
     elif final_choice == "🎯 Convert Units":
-        conversion_loop(doc, res_ft)
+        conversion_loop(formatters, res_ft)
+
+# ---------- Main Execution ----------
+MODES = {
+    "🧮 Single Calculation": single_calculation,
+    "🏢 Level Table (Batch)": level_table_mode,
+    "🔁 Running Total (Session)": session_mode,
+    "📏 Dimension Segments (Sum / Min / Max)": dimension_segments_mode
+}
+
+def main():
+    mode = forms.CommandSwitchWindow.show(sorted(MODES.keys()), message="📐 Calculator Mode:")
+    if not mode: return
+    metrics.note("mode", mode)
+    # Project units are read once per run; every mode formats through this registry
+    formatters = get_formatters(revit.doc)
+    MODES[mode](revit.doc, revit.uidoc, formatters)
+    logger.debug("Formatter cache {}: {}".format(revit.doc.Title, formatters.stats()))
 
 if __name__ == "__main__":
-    main()
+    with metrics.run("Calculator", revit.doc):
+        main()
+    logger.debug("Value cache {}: {}".format(revit.doc.Title, get_value_cache(revit.doc).stats()))
 
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""
+🔢 LUDARP Diagnostics: Filter Usage
+Version: 1.0 | Author: PRADUL P
+
+Reports how many elements each filter applied to the picked views actually
+matches there (templates are counted over the views that use them), flagging
+filters that match nothing and filters heavy enough to slow regeneration.
+Filters hidden in a view are counted over the model and marked as hidden.
+Counts are cached per view for the session and refreshed when the model
+changes.
+"""
+__title__ = "Filter\nUsage"
+__author__ = "PRADUL P"
+__version__ = "1.0"
+
+from pyrevit import forms, script
+from ludarp.pickers import pick_views, filters_in_view
+from ludarp import metrics, matchcounts
+from ludarp.compat import id_value
+
+# Initialize the document
+doc = __revit__.ActiveUIDocument.Document
+
+OPT_REPORT = "📊 Usage Report for Views / Templates"
+OPT_CLEAR = "🧹 Clear Cached Counts"
+
+# ---------------------------------------------------------------------------------
+# MAIN SCRIPT EXECUTION
+# ---------------------------------------------------------------------------------
+
+def usage_report():
+    # 🟦 STEP 1: Views or templates to inspect
+    picked = pick_views(doc, "Pick Views or Templates to Inspect", multiselect=True)
+    if not picked:
+        script.exit()
+
+    # 🟩 COUNT: cached per (filter, view), templates over their views
+    cache = matchcounts.get_cache(doc)
+    rows = []
+    unused = {}
+    with forms.ProgressBar(title="Counting filter matches ({value} of {max_value})", cancellable=True) as pb:
+        for i, view in enumerate(picked):
+            if pb.cancelled:
+                break
+            pb.update_progress(i, len(picked))
+            filters = filters_in_view(doc, view)
+            totals, hidden, scanned = matchcounts.counts_for_view(doc, view, filters, cache)
+            scope = "{} view(s)".format(len(scanned)) if view.IsTemplate else "view"
+            for f in sorted(filters, key=lambda f: f.Name):
+                count = totals.get(id_value(f.Id))
+                is_hidden = id_value(f.Id) in hidden
+                rows.append([view.Name, scope, f.Name, matchcounts.describe(count, is_hidden)])
+                if count == 0 and not is_hidden:
+                    unused.setdefault(f.Name, []).append(view.Name)
+
+    # 📋 REPORT
+    output = script.get_output()
+    output.print_md("## 🔢 Filter Usage")
+    if not rows:
+        output.print_md("No filters are applied to the picked views.")
+        return
+    output.print_table(table_data=rows, columns=["View / Template", "Counted In", "Filter", "Elements"])
+    output.print_md("⚠️ matches nothing · 🐢 {:,}+ elements (slows regeneration when styled) · "
+                    "🙈 hidden in the view (counted over the model) · "
+                    "– not countable (template without views, schedule...)".format(matchcounts.HEAVY_COUNT))
+    if unused:
+        output.print_md("### ⚠️ Filters Matching Nothing")
+        output.print_table(table_data=[[name, ", ".join(views)] for name, views in sorted(unused.items())],
+                           columns=["Filter", "In"])
+
+def main():
+    mode = forms.CommandSwitchWindow.show([OPT_REPORT, OPT_CLEAR], message="Filter usage:")
+    if not mode:
+        script.exit()
+    if mode == OPT_CLEAR:
+        matchcounts.forget(doc)
+        forms.toast("Cached filter match counts cleared")
+    else:
+        usage_report()
+
+if __name__ == "__main__":
+    with metrics.run("Filter Usage", doc):
+        main()
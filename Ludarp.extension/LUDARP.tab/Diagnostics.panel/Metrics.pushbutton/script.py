@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""
+⏱️ LUDARP Diagnostics: Metrics
+Version: 1.0 | Author: PRADUL P
+
+Switches the opt-in run metrics on or off and reports the recorded runs:
+p50/p95 run time and per-phase time (collect, pick, plan, apply, commit) per
+tool, optionally per model, with the average Revit API calls per run.
+"""
+__title__ = "Metrics"
+__author__ = "PRADUL P"
+
+import os
+from pyrevit import forms, script
+from ludarp import metrics, metricsreport
+
+OPT_REPORT = "📊 Report per Tool"
+OPT_REPORT_MODEL = "🏢 Report per Tool & Model"
+OPT_ENABLE = "🟢 Enable Metrics"
+OPT_DISABLE = "⚪ Disable Metrics"
+OPT_CLEAR = "🧹 Clear Metrics Log"
+
+def _ms(value):
+    return "-" if value is None else "{:.1f}".format(value)
+
+def show_report(by_model):
+    rows = metricsreport.summarize(metricsreport.iter_records(), by_model=by_model)
+    if not rows:
+        forms.alert("No metrics recorded yet.\nEnable metrics and run a LUDARP tool first.",
+                    title="LUDARP: Metrics")
+        return
+
+    output = script.get_output()
+    output.print_md("## ⏱️ LUDARP Run Metrics")
+    output.print_md("Log: `{}`".format(metrics.METRICS_FILE))
+
+    columns = ["Tool"] + (["Model"] if by_model else []) + ["Runs", "p50 ms", "p95 ms"]
+    columns += ["{} p50/p95".format(p) for p in metrics.PHASES + ("other",)]
+    table = []
+    for r in rows:
+        row = [r["tool"]] + ([r["model"]] if by_model else []) + [r["runs"], _ms(r["p50_ms"]), _ms(r["p95_ms"])]
+        for p in metrics.PHASES + ("other",):
+            p50, p95 = r["phases"].get(p, (None, None))
+            row.append("{} / {}".format(_ms(p50), _ms(p95)) if p50 is not None else "-")
+        table.append(row)
+    output.print_table(table_data=table, columns=columns, title="Completed runs")
+
+    calls = []
+    for r in rows:
+        for kind, n in sorted(r["calls"].items()):
+            calls.append([r["tool"]] + ([r["model"]] if by_model else []) + [kind, n])
+    if calls:
+        output.print_table(
+            table_data=calls,
+            columns=["Tool"] + (["Model"] if by_model else []) + ["API Call", "Avg per Run"],
+            title="Revit API calls"
+        )
+
+def main():
+    options = [OPT_REPORT, OPT_REPORT_MODEL,
+               OPT_DISABLE if metrics.is_enabled() else OPT_ENABLE,
+               OPT_CLEAR]
+    state = "ON" if metrics.is_enabled() else "OFF"
+    choice = forms.CommandSwitchWindow.show(options, message="⏱️ Run metrics are {}:".format(state))
+    if not choice:
+        return
+
+    if choice == OPT_REPORT:
+        show_report(False)
+    elif choice == OPT_REPORT_MODEL:
+        show_report(True)
+    elif choice in (OPT_ENABLE, OPT_DISABLE):
+        metrics.set_enabled(choice == OPT_ENABLE)
+        forms.toast("Run metrics {}.".format("enabled" if choice == OPT_ENABLE else "disabled"))
+    elif choice == OPT_CLEAR:
+        if forms.alert("Delete all recorded run metrics?", yes=True, no=True, title="LUDARP: Metrics"):
+            if os.path.exists(metrics.METRICS_FILE):
+                os.remove(metrics.METRICS_FILE)
+            forms.toast("Metrics log cleared!")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+"""
+🗂️ LUDARP Filter Override: Batch Models
+Version: 1.0 | Author: PRADUL P
+
+Replays saved sync profiles (copy, reset, graphics standard) over a list or a
+folder of models: each model is opened in the background (detached when
+workshared), processed, saved and closed before the next one, and a
+consolidated per-model report with timings is printed and saved as CSV.
+"""
+__title__ = "Batch\nModels"
+__author__ = "PRADUL P"
+__version__ = "1.0"
+
+import os
+import tempfile
+from datetime import datetime
+from pyrevit import forms, script
+from ludarp import metrics, profiles, batch
+
+# Initialize the document (its saved profiles are the batch jobs)
+doc = __revit__.ActiveUIDocument.Document
+app = __revit__.Application
+
+OPT_FOLDER = "📂 All Models in a Folder"
+OPT_FILES = "📄 Pick Model Files"
+
+OPT_SAVE_COPIES = "💾 Save Copies to an Output Folder"
+OPT_SAVE_IN_PLACE = "💾 Save in Place (non-workshared models)"
+OPT_DRY_RUN = "🧪 Dry Run (do not save)"
+
+# ---------------------------------------------------------------------------------
+# HELPERS
+# ---------------------------------------------------------------------------------
+
+def pick_batch_profiles():
+    saved = profiles.ProfileStore(doc).load()
+    if not saved:
+        forms.alert("No sync profiles saved in this project.\n"
+                    "Create them with Sync Profiles first.", title="LUDARP: Batch Models")
+        return None
+    labels = ["{}  [{}]".format(p.get("name", "?"), profiles.OPERATIONS.get(p.get("operation"), "?"))
+              for p in saved]
+    picked = forms.SelectFromList.show(labels, title="1. Pick Profiles to Run in Every Model",
+                                       multiselect=True)
+    if not picked:
+        return None
+    return [saved[labels.index(label)] for label in picked]
+
+def pick_models():
+    mode = forms.CommandSwitchWindow.show([OPT_FOLDER, OPT_FILES], message="2. Models to process:")
+    if mode == OPT_FOLDER:
+        folder = forms.pick_folder(title="Pick Folder of Models")
+        return batch.collect_models([folder]) if folder else None
+    if mode == OPT_FILES:
+        paths = forms.pick_file(file_ext="rvt", multi_file=True, title="Pick Models")
+        return batch.collect_models(paths) if paths else None
+    return None
+
+def pick_output():
+    """(save, output folder) or None when cancelled."""
+    mode = forms.CommandSwitchWindow.show([OPT_SAVE_COPIES, OPT_SAVE_IN_PLACE, OPT_DRY_RUN],
+                                          message="3. Saving:")
+    if mode == OPT_SAVE_COPIES:
+        folder = forms.pick_folder(title="Pick Output Folder")
+        return (True, folder) if folder else None
+    if mode == OPT_SAVE_IN_PLACE:
+        return True, None
+    if mode == OPT_DRY_RUN:
+        return False, None
+    return None
+
+def print_report(results, report_path):
+    output = script.get_output()
+    output.print_md("## 🗂️ Batch Models")
+    icons = {"ok": "✅", "skipped": "⏭️", "error": "❌"}
+    table = []
+    for r in results:
+        done = sum(1 for p in r["profiles"] if p["status"] == "ok")
+        table.append([r["model"], "{} {}".format(icons.get(r["status"], ""), r["status"]),
+                      "{}/{}".format(done, len(r["profiles"])), r["open_ms"], r["run_ms"],
+                      r["save_ms"], r["total_ms"], r["message"]])
+    output.print_table(table_data=table, columns=["Model", "Status", "Profiles ok", "Open ms",
+                                                  "Run ms", "Save ms", "Total ms", "Message"])
+    failed = [(r["model"], p) for r in results for p in r["profiles"] if p["status"] == "error"]
+    if failed:
+        output.print_md("### ❌ Failed Profiles")
+        output.print_table(table_data=[[m, p["name"], p["message"]] for m, p in failed],
+                           columns=["Model", "Profile", "Message"])
+    output.print_md("Full report: `{}`".format(report_path))
+
+# ---------------------------------------------------------------------------------
+# MAIN SCRIPT EXECUTION
+# ---------------------------------------------------------------------------------
+
+def main():
+    # 🟦 STEP 1-3: Profiles, models and saving
+    chosen = pick_batch_profiles()
+    if not chosen:
+        script.exit()
+    models = pick_models()
+    if not models:
+        script.exit()
+    saving = pick_output()
+    if not saving:
+        script.exit()
+    save, output_folder = saving
+
+    if not forms.alert("Run {} profile(s) over {} model(s)?\nOpen models cannot be processed; "
+                       "close them first.".format(len(chosen), len(models)),
+                       yes=True, no=True, title="LUDARP: Batch Models"):
+        script.exit()
+
+    # 🟩 EXECUTE: One model open at a time
+    with forms.ProgressBar(title="Batch: model {value} of {max_value}", cancellable=True) as pb:
+        def progress(index, total, path):
+            pb.update_progress(index, total)
+            return not pb.cancelled
+        try:
+            results = batch.run_batch(app, models, chosen, output_folder=output_folder, save=save,
+                                      progress=progress)
+        except ValueError as e:
+            forms.alert("Profile problem:\n{}".format(e), title="LUDARP: Batch Models")
+            return
+
+    # 🎉 REPORT
+    name = "LUDARP Batch {}.csv".format(datetime.now().strftime("%Y-%m-%d %H%M%S"))
+    report_path = batch.write_report(results, os.path.join(output_folder or tempfile.gettempdir(), name))
+    print_report(results, report_path)
+    done = sum(1 for r in results if r["status"] == "ok")
+    forms.toast("Batch done: {} of {} model(s) ok".format(done, len(models)))
+
+if __name__ == "__main__":
+    with metrics.run("Batch Models", doc):
+        main()
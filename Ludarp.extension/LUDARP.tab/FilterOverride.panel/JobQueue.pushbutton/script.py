@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""
+⏳ LUDARP Filter Override: Job Queue
+Version: 1.0 | Author: PRADUL P
+
+Runs saved sync profiles in the background: the picked profiles are queued in
+a modeless window and written in short time-sliced transactions through an
+external event, so Revit stays usable while long jobs run. The window shows
+progress per job and can pause, resume and cancel; queued jobs run in order.
+"""
+__title__ = "Job\nQueue"
+__author__ = "PRADUL P"
+__version__ = "1.0"
+
+# The window and its external event live on after this script returns
+__persistentengine__ = True
+
+from ludarp import metrics
+from ludarp.jobwindow import show_job_window
+
+# Initialize the document (its saved profiles are the jobs offered)
+doc = __revit__.ActiveUIDocument.Document
+
+# ---------------------------------------------------------------------------------
+# MAIN SCRIPT EXECUTION
+# ---------------------------------------------------------------------------------
+
+def main():
+    # 🟦 Open (or bring back) the session's job window, then offer profiles to queue
+    window = show_job_window(__revit__)
+    with metrics.phase("pick"):
+        window.pick_and_add()
+
+if __name__ == "__main__":
+    with metrics.run("Job Queue", doc):
+        main()
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 """
 📋 LUDARP Filter Override: Duplicate Filter
-Version: 1.2 | Author: PRADUL P
+Version: 1.3 | Author: PRADUL P
 
 This script allows users to create a clone of an existing parameter filter, 
 automatically preserving its categories, rules, and graphic overrides 
@@ -9,91 +9,26 @@ within the current view.
 """
 __title__ = "Duplicate\nFilter"
 __author__ = "PRADUL P"
-__version__ = "1.2"
+__version__ = "1.3"
 
-from Autodesk.Revit.DB import *
+from Autodesk.Revit.DB import FilteredElementCollector, ParameterFilterElement
 from pyrevit import forms, script
-from collections import OrderedDict
+from ludarp.pickers import pick_views
+from ludarp.overrides import duplicate_filter
+from ludarp import metrics
 
 # Initialize the document
 doc = __revit__.ActiveUIDocument.Document
 
-# ---------------------------------------------------------------------------------
-# UI HELPERS: CATEGORIZED VIEW PICKER
-# ---------------------------------------------------------------------------------
-
-valid_types = [
-    ViewType.FloorPlan, ViewType.CeilingPlan, ViewType.Elevation, 
-    ViewType.ThreeD, ViewType.Section, ViewType.Detail, 
-    ViewType.EngineeringPlan, ViewType.AreaPlan
-]
-
-class ViewItem:
-    """Wrapper class for Revit View elements to display with custom labels/emojis."""
-    def __init__(self, view):
-        self.view = view
-        self.Id = view.Id
-        if view.IsTemplate:
-            self.Name = "   🎨 [Template] " + view.Name
-        else:
-            v_type_str = str(view.ViewType).replace("ViewType.", "").replace("ThreeD", "3D")
-            self.Name = "   📄 [" + v_type_str + "] " + view.Name
-
-class SeparatorItem:
-    """Used to create non-clickable category headers in the selection list."""
-    def __init__(self, title):
-        self.Name = "💠 " + title.upper() + " 💠"
-        self.view = None
-        self.Id = None
-
-def build_view_dict(all_views, exclude_id=None):
-    """Builds a categorized and searchable dictionary of views."""
-    all_valid = []
-    templates = []
-    by_type = {}
-    for v in all_views:
-        if exclude_id and v.Id == exclude_id: continue
-        if v.IsTemplate:
-            templates.append(ViewItem(v))
-        elif v.ViewType in valid_types:
-            item = ViewItem(v)
-            cat_name = "📁 " + str(v.ViewType).replace("ViewType.", "").replace("ThreeD", "3D") + "s"
-            if cat_name not in by_type: by_type[cat_name] = []
-            by_type[cat_name].append(item)
-            
-    templates.sort(key=lambda x: x.Name)
-    for cat in by_type: by_type[cat].sort(key=lambda x: x.Name)
-    
-    if templates:
-        all_valid.append(SeparatorItem("VIEW TEMPLATES"))
-        all_valid.extend(templates)
-    for cat in sorted(by_type.keys()):
-        if by_type[cat]:
-            all_valid.append(SeparatorItem(cat.replace("📁 ", "")))
-            all_valid.extend(by_type[cat])
-            
-    d = OrderedDict()
-    d[" 🌍 ALL VIEWS & TEMPLATES"] = all_valid
-    d["⭐ VIEW TEMPLATES"] = templates
-    for cat in sorted(by_type.keys()): d[cat] = by_type[cat]
-    return d
-
 # ---------------------------------------------------------------------------------
 # MAIN SCRIPT EXECUTION
 # ---------------------------------------------------------------------------------
 
 def main():
     # 🟦 STEP 1: Select Target View or Template (to read overrides from)
-    all_views = FilteredElementCollector(doc).OfClass(View)
-    target_option = forms.SelectFromList.show(
-        build_view_dict(all_views),
-        name_attr="Name",
-        multiselect=False,
-        title="1. Pick View/Template containing the Source Filter"
-    )
-    if not target_option or target_option.view is None:
+    target_view = pick_views(doc, "1. Pick View/Template containing the Source Filter")
+    if not target_view:
         script.exit()
-    target_view = target_option.view
 
     # 🟦 STEP 2: Pick Source Filter to Duplicate
     all_filters = FilteredElementCollector(doc).OfClass(ParameterFilterElement).ToElements()
@@ -118,34 +53,14 @@ def main():
         script.exit()
 
     # 🟩 EXECUTE: Create and configure the duplicate
-    # Store current overrides from the selected view
     try:
-        current_override = target_view.GetFilterOverrides(source_filter.Id)
-    except:
-        current_override = OverrideGraphicSettings()
-
-    t = Transaction(doc, "LUDARP: Duplicate Filter")
-    t.Start()
-    try:
-        # Clone properties
-        cats = source_filter.GetCategories()
-        elem_filter = source_filter.GetElementFilter()
-        
-        # Create the new ParameterFilterElement
-        new_filter = ParameterFilterElement.Create(doc, new_name, cats, elem_filter)
-
-        # Apply same overrides and add to the selected view/template
-        if not target_view.GetFilters().Contains(new_filter.Id):
-            target_view.AddFilter(new_filter.Id)
-        target_view.SetFilterOverrides(new_filter.Id, current_override)
-
-        t.Commit()
+        duplicate_filter(doc, target_view, source_filter, new_name)
         forms.toast("Filter duplicated successfully!")
         forms.alert("Filter '{}' duplicated as '{}'.".format(source_filter.Name, new_name), 
                     title="LUDARP: Success")
     except Exception as e:
-        t.RollBack()
         forms.alert("Error during duplication:\n{}".format(e), title="LUDARP: Error")
 
 if __name__ == "__main__":
-    main()
+    with metrics.run("Duplicate Filter", doc):
+        main()
@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+"""
+🔁 LUDARP Filter Override: Sync Profiles
+Version: 1.2 | Author: PRADUL P
+
+Saves Copy Between Views, Copy Specific Overrides, Reset and Graphics Standard
+jobs as named profiles and replays them later without any picker (here, or
+over a folder of models with Batch Models). Views and filters are stored as
+selectors (exact names, glob or regex patterns, view types, sheet ranges and
+sheet sets) and resolved against the current model at run time, so a weekly
+sync is one click and picks up views placed on the sheets since.
+"""
+__title__ = "Sync\nProfiles"
+__author__ = "PRADUL P"
+__version__ = "1.2"
+
+import os
+from collections import OrderedDict
+from pyrevit import forms, script
+from ludarp.pickers import pick_views, pick_targets, pick_sheet_selector, pick_filters
+from ludarp.overrides import COPY_PARTS
+from ludarp import metrics, profiles
+from ludarp.views import get_view_index
+
+# Initialize the document
+doc = __revit__.ActiveUIDocument.Document
+
+OPT_RUN = "▶️ Run Profiles"
+OPT_NEW = "➕ New Profile from Picks"
+OPT_EDIT = "📝 Open Profiles File"
+OPT_DELETE = "🗑️ Delete Profile"
+
+OPT_ALL_TEMPLATES = "🌍 All Templates in the Standard's Scope"
+OPT_SHEET_TEMPLATES = "🗂️ Templates Used on Sheets"
+
+FILL_CHOICES = OrderedDict([("Both", "both"), ("Foreground", "fg"), ("Background", "bg")])
+
+# ---------------------------------------------------------------------------------
+# HELPERS
+# ---------------------------------------------------------------------------------
+
+def pick_profiles(store, title, multiselect=True):
+    saved = store.load()
+    if not saved:
+        forms.alert("No profiles saved for this project yet.\nUse '{}' first.".format(OPT_NEW),
+                    title="LUDARP: Sync Profiles")
+        return None
+    by_name = OrderedDict((p.get("name", "?"), p) for p in saved)
+    labels = ["{}  [{}]".format(name, profiles.OPERATIONS.get(p.get("operation"), p.get("operation")))
+              for name, p in by_name.items()]
+    picked = forms.SelectFromList.show(labels, title=title, multiselect=multiselect)
+    if not picked:
+        return None
+    picked = picked if multiselect else [picked]
+    names = list(by_name)
+    return [by_name[names[labels.index(label)]] for label in picked]
+
+def target_selector(views, selector):
+    """Saved targets: the sheet selector when targets came from sheets, else the exact names."""
+    return selector or {"names": [v.Name for v in views]}
+
+def pick_fill(title):
+    choice = forms.SelectFromList.show(list(FILL_CHOICES), title=title, multiselect=False)
+    return FILL_CHOICES.get(choice, "both")
+
+def print_report(results):
+    output = script.get_output()
+    output.print_md("## 🔁 Sync Profiles")
+    icons = {"ok": "✅", "skipped": "⏭️", "error": "❌"}
+    table = [[r["name"], profiles.OPERATIONS.get(r["operation"], r["operation"]), r["targets"],
+              r["filters"], "{} {}".format(icons.get(r["status"], ""), r["status"]), r["ms"], r["message"]]
+             for r in results]
+    output.print_table(table_data=table,
+                       columns=["Profile", "Operation", "Views", "Filters", "Status", "ms", "Message"])
+
+# ---------------------------------------------------------------------------------
+# MODES
+# ---------------------------------------------------------------------------------
+
+def run_profiles(store):
+    chosen = pick_profiles(store, "Pick Profiles to Run")
+    if not chosen:
+        script.exit()
+    results = profiles.run_profiles(doc, chosen)
+    print_report(results)
+    done = sum(1 for r in results if r["status"] == "ok")
+    forms.toast("Replayed {} of {} profile(s)".format(done, len(results)))
+
+def new_between():
+    source = pick_views(doc, "1. Pick SOURCE (Copy Graphics FROM)")
+    if not source:
+        return None
+    targets, selector = pick_targets(doc, "2. Pick TARGETS (Copy Graphics TO)", exclude_id=source.Id)
+    if not targets:
+        return None
+    filters = pick_filters(doc, source, "3. Pick Filters to Sync",
+                           empty_msg="No filters found in source view/template.")
+    if not filters:
+        return None
+    return OrderedDict([
+        ("operation", "copy_between"),
+        ("source", {"name": source.Name}),
+        ("targets", target_selector(targets, selector)),
+        ("filters", {"names": [f.Name for f in filters]}),
+    ])
+
+def new_overrides():
+    views, selector = pick_targets(doc, "1. Pick TARGET Views or Templates")
+    if not views:
+        return None
+    source = pick_filters(doc, views[0], "2. Pick SOURCE Filter (Copy FROM)", multiselect=False,
+                          empty_msg="No filters found in the selected view.")
+    if not source:
+        return None
+    targets = pick_filters(doc, views[0], "3. Pick TARGET Filters (Copy TO)", exclude_ids=[source.Id])
+    if not targets:
+        return None
+    parts = forms.SelectFromList.show(COPY_PARTS, title="4. Select Properties to Copy", multiselect=True)
+    if not parts:
+        return None
+    profile = OrderedDict([
+        ("operation", "copy_overrides"),
+        ("targets", target_selector(views, selector)),
+        ("source_filter", source.Name),
+        ("filters", {"names": [f.Name for f in targets]}),
+        ("parts", list(parts)),
+    ])
+    if "Copy ALL" not in parts:
+        if "Projection Fills" in parts:
+            profile["projection_fill"] = pick_fill("Projection Fill: Which part to copy?")
+        if "Cut Fills" in parts:
+            profile["cut_fill"] = pick_fill("Cut Fill: Which part to copy?")
+    return profile
+
+def new_reset():
+    views, selector = pick_targets(doc, "1. Pick Views or Templates to Reset")
+    if not views:
+        return None
+    filters = pick_filters(doc, views[0], "2. Pick Filters to Reset",
+                           empty_msg="No filters found in the selected view.")
+    if not filters:
+        return None
+    return OrderedDict([
+        ("operation", "reset"),
+        ("targets", target_selector(views, selector)),
+        ("filters", {"names": [f.Name for f in filters]}),
+    ])
+
+def new_standard():
+    path = forms.pick_file(file_ext="json", title="Pick Graphics Standard File")
+    if not path:
+        return None
+    profile = OrderedDict([("operation", "standard"), ("standard", path)])
+    sheet_index = get_view_index(doc).sheet_index()
+    if sheet_index.sheets:
+        scope = forms.CommandSwitchWindow.show([OPT_ALL_TEMPLATES, OPT_SHEET_TEMPLATES], message="Templates to check:")
+        if not scope:
+            return None
+        if scope == OPT_SHEET_TEMPLATES:
+            selector = pick_sheet_selector(sheet_index, "Templates Used on Sheets", apply_to="templates")
+            if not selector:
+                return None
+            profile["targets"] = selector
+    return profile
+
+NEW_BODIES = {
+    "copy_between": new_between,
+    "copy_overrides": new_overrides,
+    "reset": new_reset,
+    "standard": new_standard,
+}
+
+def new_profile(store):
+    labels = dict((label, op) for op, label in profiles.OPERATIONS.items())
+    operation = forms.CommandSwitchWindow.show(list(labels), message="Operation to save:")
+    if not operation:
+        script.exit()
+    body = NEW_BODIES[labels[operation]]()
+    if not body:
+        script.exit()
+    name = forms.ask_for_string(prompt="Profile name:", title="LUDARP: Save Profile")
+    if not name:
+        script.exit()
+    profile = OrderedDict([("name", name)])
+    profile.update(body)
+    store.put(profile)
+    forms.alert("Profile '{}' saved.\nEdit the names into patterns in the profiles file to make it "
+                "pick up new views and filters.".format(name), title="LUDARP: Sync Profiles")
+
+def open_file(store):
+    if not os.path.exists(store.path):
+        store.save([])
+    os.startfile(store.path)
+
+def delete_profile(store):
+    chosen = pick_profiles(store, "Pick Profiles to Delete")
+    if not chosen:
+        script.exit()
+    for profile in chosen:
+        store.delete(profile.get("name"))
+    forms.toast("Deleted {} profile(s)".format(len(chosen)))
+
+def main():
+    mode = forms.CommandSwitchWindow.show([OPT_RUN, OPT_NEW, OPT_EDIT, OPT_DELETE],
+                                          message="Sync profiles:")
+    if not mode:
+        script.exit()
+    store = profiles.ProfileStore(doc)
+    try:
+        if mode == OPT_RUN:
+            run_profiles(store)
+        elif mode == OPT_NEW:
+            new_profile(store)
+        elif mode == OPT_EDIT:
+            open_file(store)
+        else:
+            delete_profile(store)
+    except (IOError, ValueError) as e:
+        forms.alert("Profiles file problem:\n{}".format(e), title="LUDARP: Sync Profiles")
+
+if __name__ == "__main__":
+    with metrics.run("Sync Profiles", doc):
+        main()
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""
+⏪ LUDARP Filter Override: Restore Snapshot
+Version: 1.1 | Author: PRADUL P
+
+Every bulk FilterOverride tool snapshots the filter overrides and visibility it
+is about to change. This script lists the snapshots of the current document and
+puts one back: only (view, filter) pairs that differ from the snapshot are
+written, in a single transaction. The state before the restore is snapshotted
+as well, so a restore can itself be restored. The comparison runs on all
+cores (see ludarp.parallel) behind a progress bar.
+"""
+__title__ = "Restore\nSnapshot"
+__author__ = "PRADUL P"
+__version__ = "1.1"
+
+from pyrevit import forms, script
+from ludarp import metrics, snapshots
+
+# Initialize the document
+doc = __revit__.ActiveUIDocument.Document
+
+class SnapshotItem(object):
+    """Snapshot index entry with a readable label for the picker."""
+    def __init__(self, entry):
+        self.entry = entry
+        self.Name = "🕒 {0}   {1}   ({2:,} pair(s), {3:.1f} KB)".format(
+            entry["timestamp"], entry["tool"], entry["pairs"], entry.get("bytes", 0) / 1024.0)
+
+# ---------------------------------------------------------------------------------
+# MAIN SCRIPT EXECUTION
+# ---------------------------------------------------------------------------------
+
+def main():
+    store = snapshots.SnapshotStore(doc)
+    entries = store.entries()
+    if not entries:
+        forms.alert("No override snapshots for this document yet.\n"
+                    "They are taken automatically by Copy Between, Copy Specific Overrides, "
+                    "Change Colors and Reset.", title="LUDARP: Restore Snapshot")
+        script.exit()
+
+    # 🟦 STEP 1: Pick the snapshot (newest first)
+    picked = forms.SelectFromList.show(
+        [SnapshotItem(e) for e in reversed(entries)],
+        name_attr="Name",
+        multiselect=False,
+        title="Pick a Snapshot to Restore"
+    )
+    if not picked:
+        script.exit()
+
+    # 🟦 STEP 2: Confirm
+    if not forms.alert(
+        "Restore the filter overrides captured before '{}' at {}?\n"
+        "Only pairs that changed since then are written.".format(
+            picked.entry["tool"], picked.entry["timestamp"]),
+        yes=True, no=True, title="LUDARP: Restore Snapshot"
+    ):
+        script.exit()
+
+    # 🟩 EXECUTE: Minimal diff in one transaction
+    try:
+        with forms.ProgressBar(title="Comparing snapshot pairs ({value} of {max_value})") as pb:
+            changed, skipped = snapshots.restore(doc, picked.entry, store, progress=pb.update_progress)
+    except Exception as e:
+        forms.alert("Error during restore:\n{}".format(e), title="LUDARP: Error")
+        return
+
+    # 🎉 SUCCESS
+    msg = "Restored {} change(s) from the snapshot of {}.".format(changed, picked.entry["timestamp"])
+    if not changed:
+        msg = "Nothing to restore: the model already matches the snapshot."
+    if skipped:
+        msg += "\n{} pair(s) skipped (view or filter no longer exists).".format(skipped)
+    forms.toast("Snapshot restored!")
+    forms.alert(msg, title="LUDARP: Restore Complete")
+
+if __name__ == "__main__":
+    with metrics.run("Restore Snapshot", doc):
+        main()
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""
+📑 LUDARP Filter Override: Spreadsheet Export / Import
+Version: 1.0 | Author: PRADUL P
+
+Exports the visibility and overrides of every (template, filter) pair to a flat
+CSV or TSV file for bulk editing outside Revit, and imports it back: the sheet
+is diffed against the model and only the changed rows are written, in a single
+transaction.
+"""
+__title__ = "Export /\nImport"
+__author__ = "PRADUL P"
+__version__ = "1.0"
+
+from pyrevit import forms, script
+from ludarp import metrics, spreadsheet
+
+# Initialize the document
+doc = __revit__.ActiveUIDocument.Document
+
+OPT_EXPORT_CSV = "📤 Export to CSV"
+OPT_EXPORT_TSV = "📤 Export to TSV (tab-separated)"
+OPT_IMPORT = "📥 Import Edited Sheet"
+
+# Problems listed in the output window before the rest are summarized
+MAX_PROBLEMS_SHOWN = 200
+
+# ---------------------------------------------------------------------------------
+# MAIN SCRIPT EXECUTION
+# ---------------------------------------------------------------------------------
+
+def export_sheet(ext):
+    path = forms.save_file(file_ext=ext, default_name="{} - Filter Overrides".format(doc.Title),
+                           title="Export Template Filter Overrides")
+    if not path:
+        script.exit()
+    try:
+        count = spreadsheet.export_overrides(doc, path)
+    except Exception as e:
+        forms.alert("Error during export:\n{}".format(e), title="LUDARP: Error")
+        return
+    forms.toast("Exported {:,} row(s)!".format(count))
+    forms.alert("Exported {:,} (template, filter) row(s) to:\n{}".format(count, path),
+                title="LUDARP: Export Complete")
+
+def print_problems(plan):
+    output = script.get_output()
+    output.print_md("## ⚠️ Skipped Rows ({:,})".format(len(plan.problems)))
+    table = [[number, message] for number, message in plan.problems[:MAX_PROBLEMS_SHOWN]]
+    output.print_table(table_data=table, columns=["Row", "Problem"])
+    if len(plan.problems) > MAX_PROBLEMS_SHOWN:
+        output.print_md("... and {:,} more.".format(len(plan.problems) - MAX_PROBLEMS_SHOWN))
+
+def import_sheet():
+    # 🟦 STEP 1: Pick and diff the sheet
+    path = forms.pick_file(files_filter="Spreadsheet (*.csv;*.tsv;*.txt)|*.csv;*.tsv;*.txt",
+                           title="Pick Edited Override Sheet")
+    if not path:
+        script.exit()
+    try:
+        plan = spreadsheet.plan_import(doc, path)
+    except (IOError, ValueError) as e:
+        forms.alert("Cannot read the sheet:\n{}".format(e), title="LUDARP: Import")
+        return
+    if plan.problems:
+        print_problems(plan)
+    if not plan.actions:
+        forms.alert("Nothing to import: all {:,} row(s) match the model{}.".format(
+            plan.rows, " (see skipped rows)" if plan.problems else ""), title="LUDARP: Import")
+        return
+
+    # 🟦 STEP 2: Confirm
+    if not forms.alert(
+        "{:,} of {:,} row(s) differ from the model{}.\n"
+        "Write them in one transaction? A snapshot is taken first (see Restore Snapshot).".format(
+            plan.changed, plan.rows,
+            "; {:,} row(s) skipped".format(len(plan.problems)) if plan.problems else ""),
+        yes=True, no=True, title="LUDARP: Import"
+    ):
+        script.exit()
+
+    # 🟩 EXECUTE: Changed rows only, one transaction
+    try:
+        spreadsheet.apply_import(doc, plan)
+    except Exception as e:
+        forms.alert("Error during import:\n{}".format(e), title="LUDARP: Error")
+        return
+
+    # 🎉 SUCCESS
+    forms.toast("Imported {:,} changed row(s)!".format(plan.changed))
+
+def main():
+    mode = forms.CommandSwitchWindow.show(
+        [OPT_EXPORT_CSV, OPT_EXPORT_TSV, OPT_IMPORT],
+        message="Template filter overrides spreadsheet:"
+    )
+    if not mode:
+        script.exit()
+    if mode == OPT_IMPORT:
+        import_sheet()
+    else:
+        export_sheet("csv" if mode == OPT_EXPORT_CSV else "tsv")
+
+if __name__ == "__main__":
+    with metrics.run("Override Spreadsheet", doc):
+        main()
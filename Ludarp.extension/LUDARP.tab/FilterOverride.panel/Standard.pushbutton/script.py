@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+"""
+📐 LUDARP Filter Override: Graphics Standard
+Version: 1.1 | Author: PRADUL P
+
+Applies a company graphics standard (a JSON file mapping filter name patterns
+to visibility and override graphics) to every view template of the model in
+one pass: the standard is matched against all templates, only the differing
+(template, filter) pairs are written, in a single transaction, and a compliance
+report is printed. The check can be narrowed to the templates governing the
+views on a range of sheets or a sheet set. A standard can also be created from
+a reference template.
+"""
+__title__ = "Graphics\nStandard"
+__author__ = "PRADUL P"
+__version__ = "1.1"
+
+import os
+from pyrevit import forms, script
+from ludarp.pickers import pick_views, pick_sheet_selector
+from ludarp import metrics, standards
+from ludarp.views import get_view_index
+
+# Initialize the document
+doc = __revit__.ActiveUIDocument.Document
+config = script.get_config()
+
+OPT_CHECK = "✅ Check Compliance"
+OPT_APPLY = "🟩 Apply Standard to All Templates"
+OPT_CREATE = "📝 Create Standard from a Template"
+
+SCOPE_ALL = "🌍 All Templates"
+SCOPE_SHEETS = "🗂️ Templates Used on Sheets"
+SCOPE_SET = "📚 Templates Used in a Sheet Set"
+
+# ---------------------------------------------------------------------------------
+# HELPERS
+# ---------------------------------------------------------------------------------
+
+def pick_standard_file():
+    """Standard file to use (the last one is offered first)."""
+    last = config.get_option("standard_path", "")
+    if last and os.path.exists(last):
+        choice = forms.CommandSwitchWindow.show(
+            ["📄 " + os.path.basename(last), "📂 Browse..."],
+            message="Graphics standard file:"
+        )
+        if not choice:
+            return None
+        if not choice.startswith("📂"):
+            return last
+    path = forms.pick_file(file_ext="json", title="Pick Graphics Standard File")
+    if path:
+        config.standard_path = path
+        script.save_config()
+    return path
+
+def pick_templates():
+    """Templates to match: None for every template, or those governing views on sheets."""
+    sheet_index = get_view_index(doc).sheet_index()
+    if not sheet_index.sheets:
+        return None
+    scope = forms.CommandSwitchWindow.show([SCOPE_ALL, SCOPE_SHEETS, SCOPE_SET], message="Templates to match:")
+    if not scope:
+        script.exit()
+    if scope == SCOPE_ALL:
+        return None
+    selector = pick_sheet_selector(sheet_index, "Graphics Standard Scope", by_set=(scope == SCOPE_SET),
+                                   apply_to="templates")
+    if not selector:
+        script.exit()
+    return sheet_index.resolve(selector)
+
+def load_standard(path):
+    try:
+        return standards.Standard.load(path)
+    except (IOError, ValueError) as e:
+        forms.alert("Cannot read the standard:\n{}".format(e), title="LUDARP: Graphics Standard")
+        return None
+
+def print_report(plan, applied):
+    output = script.get_output()
+    output.print_md("## 📐 {}".format(plan.standard.name))
+    output.print_md("{} of {} template(s) compliant{}.".format(
+        plan.compliant_templates, len(plan.rows),
+        " before this run ({} change(s) written)".format(len(plan.actions)) if applied else ""))
+
+    table = []
+    for r in sorted(plan.rows, key=lambda r: r["template"]):
+        status = "✅" if not r["changed"] and not r["added"] else ("🟩" if applied else "⚠️")
+        table.append([status, r["template"], r["matched"], r["compliant"], r["changed"], r["added"],
+                      ", ".join(r["unmatched"]) or "-"])
+    output.print_table(
+        table_data=table,
+        columns=["", "Template", "Matched", "Compliant", "Changed" if applied else "To Change",
+                 "Added" if applied else "To Add", "Not Covered by Standard"],
+        title="Compliance"
+    )
+    if plan.problems:
+        output.print_md("### ⚠️ Standard Warnings")
+        for p in plan.problems:
+            output.print_md("- " + p)
+
+# ---------------------------------------------------------------------------------
+# MAIN SCRIPT EXECUTION
+# ---------------------------------------------------------------------------------
+
+def create_standard():
+    # 🟦 Pick the reference template and where to save
+    source = pick_views(doc, "Pick the REFERENCE View or Template")
+    if not source:
+        script.exit()
+    path = forms.save_file(file_ext="json", default_name="Graphics Standard",
+                           title="Save Graphics Standard")
+    if not path:
+        script.exit()
+
+    data = standards.standard_from_view(doc, source)
+    standards.write_standard(data, path)
+    config.standard_path = path
+    script.save_config()
+    forms.alert("Saved {} rule(s) from '{}' to:\n{}\n\nEdit the filter patterns to generalize them "
+                "(e.g. \"A-Wall*\") and remove keys that should not be enforced.".format(
+                    len(data["rules"]), source.Name, path),
+                title="LUDARP: Graphics Standard")
+
+def main():
+    mode = forms.CommandSwitchWindow.show(
+        [OPT_CHECK, OPT_APPLY, OPT_CREATE],
+        message="Graphics standard for all view templates:"
+    )
+    if not mode:
+        script.exit()
+    if mode == OPT_CREATE:
+        return create_standard()
+
+    # 🟦 STEP 1: Load the standard
+    path = pick_standard_file()
+    if not path:
+        script.exit()
+    standard = load_standard(path)
+    if standard is None:
+        return
+
+    # 🟦 STEP 2: Match it against every template in scope (minimal diff, on all cores)
+    templates = pick_templates()
+    with forms.ProgressBar(title="Matching templates ({value} of {max_value})") as pb:
+        plan = standards.plan(doc, standard, templates, progress=pb.update_progress)
+    if not plan.rows:
+        forms.alert("No view templates in scope of the standard.", title="LUDARP: Graphics Standard")
+        return
+    if mode == OPT_CHECK or not plan.actions:
+        print_report(plan, applied=False)
+        return
+
+    # 🟦 STEP 3: Confirm
+    if not forms.alert(
+        "{} change(s) across {} template(s) will be written in one transaction.\n"
+        "A snapshot is taken first (see Restore Snapshot). Continue?".format(
+            len(plan.actions), len(plan.rows) - plan.compliant_templates),
+        yes=True, no=True, title="LUDARP: Graphics Standard"
+    ):
+        script.exit()
+
+    # 🟩 EXECUTE: One batched transaction
+    try:
+        standards.apply(doc, plan)
+    except Exception as e:
+        forms.alert("Error while applying the standard:\n{}".format(e), title="LUDARP: Error")
+        return
+
+    # 🎉 SUCCESS
+    forms.toast("Graphics standard applied!")
+    print_report(plan, applied=True)
+
+if __name__ == "__main__":
+    with metrics.run("Graphics Standard", doc):
+        main()
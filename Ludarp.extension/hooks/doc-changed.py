@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+"""
+🔢 LUDARP Hook: Document Changed
+Version: 1.1 | Author: PRADUL P
+
+Drops the cached filter match counts (see ludarp.matchcounts) and extracted
+element values (see ludarp.extract) a model change can affect. Returns at
+once when the document has nothing cached.
+"""
+from pyrevit import EXEC_PARAMS
+from ludarp import extract, matchcounts
+
+args = EXEC_PARAMS.event_args
+doc = args.GetDocument()
+deleted_ids = args.GetDeletedElementIds()
+modified_ids = args.GetModifiedElementIds()
+try:
+    matchcounts.on_document_changed(doc, args.GetAddedElementIds(), deleted_ids, modified_ids)
+except Exception:
+    # Never let a cache problem interrupt the user's edit
+    pass
+try:
+    extract.on_document_changed(doc, deleted_ids, modified_ids)
+except Exception:
+    pass
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+"""
+🧰 LUDARP Shared Library
+Author: PRADUL P
+
+Common code for the LUDARP buttons. pyRevit puts this extension's lib/ folder on
+sys.path, so buttons import the submodules they need directly:
+
+    from ludarp.views import get_view_index
+    from ludarp.overrides import copy_filters_between_views
+
+Nothing is imported here: each button pays only for the submodules it uses.
+
+Submodules:
+    docs        Stable per-document keys (pure Python)
+    compat      Revit version adapter: API features detected once, bound accessors
+    views       View index and categorized view lists for the pickers
+    pickers     View/filter pickers and safe element/point picks (pyRevit UI)
+    viewpicker  Type-ahead WPF view picker with facets (pyRevit UI)
+    sheets      Sheet / sheet set target selectors over a viewport index
+    search      Token/prefix name search index (pure Python)
+    overrides   Filter override operations (copy, recolor, reset, duplicate)
+    formatting  Project unit detection and cached Revit unit formatters
+    units       Exact pure-Python unit conversion, formatting and parsing
+    expr        Calculator expression engine (pure Python)
+    extract     Type-dispatched value extraction from elements, cached per document
+    history     Calculator history store and incremental tail (pure Python)
+    historyexport Streaming CSV/JSONL/XLSX export of the history (pure Python)
+    historywindow Modeless, live-updating Calc History window (pyRevit UI)
+    metrics     Opt-in run timing per phase and API call counters (pure Python)
+    metricsreport Per-tool p50/p95 aggregation of the metrics log (pure Python)
+    ogsstate    OverrideGraphicSettings <-> plain state tuples
+    parallel    Worker-thread pool for pure-data planning stages (pure Python)
+    overridestore Columnar (view, filter) override states: one-sweep read, bulk diff
+    snapshots   Per-document override snapshots and minimal-diff restore
+    standards   Graphics standard files: matching, compliance and one-pass apply
+    spreadsheet CSV/TSV export and diffing import of template filter overrides
+    profiles    Saved sync profiles and picker-free batch replay
+    batch       Multi-model runner: open detached, replay profiles, save, close
+    jobs        Time-sliced job queue and event-loop pump (pure Python)
+    jobwindow   Modeless Job Queue window driven by an ExternalEvent (pyRevit UI)
+    matchcounts Cached per-view element match counts of filters
+"""
@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+"""
+🗂️ LUDARP Library: Multi-Model Batch Runner
+Author: PRADUL P
+
+Replays saved sync profiles (see ludarp.profiles: copy between views, copy
+overrides, reset, graphics standard) over a list or folder of models. Each
+model is opened in the background (workshared models detached from central,
+worksets closed, since filters and templates do not need them), the profiles
+run in one transaction group, and the model is saved and closed before the
+next one is opened:
+
+    models = batch.collect_models([r"S:/Projects/Tower"])
+    results = batch.run_batch(app, models, profiles, output_folder=r"S:/Out")
+    batch.write_report(results, r"S:/Out/batch report.csv")
+
+Detached workshared models cannot be saved over their central file, so they
+are saved as new central files in the output folder; non-workshared models are
+saved in place unless an output folder is given. Every document is closed and
+dropped from the library caches as soon as its model is done, so memory stays
+flat over long batches.
+
+Only the Revit application object is needed (no UI), so the driver runs
+against the dev/fakerevit.py stand-in as well.
+"""
+import os
+import re
+import gc
+import time
+from collections import OrderedDict
+from Autodesk.Revit.DB import (
+    ModelPathUtils, OpenOptions, DetachFromCentralOption, WorksetConfiguration,
+    WorksetConfigurationOption, SaveAsOptions, WorksharingSaveAsOptions, BasicFileInfo
+)
+from ludarp import metrics, profiles, views
+
+MODEL_EXTENSIONS = (".rvt",)
+
+# Revit backups ("Tower.0003.rvt") are never batch targets
+_BACKUP = re.compile(r"\.\d{4}\.rvt$", re.IGNORECASE)
+
+REPORT_HEADERS = ["Model", "Status", "Open ms", "Run ms", "Save ms", "Total ms", "Saved As",
+                  "Profile", "Profile Status", "Views", "Filters", "Profile ms", "Message"]
+
+# ---------------------------------------------------------------------------------
+# MODELS
+# ---------------------------------------------------------------------------------
+
+def is_model(path):
+    return path.lower().endswith(MODEL_EXTENSIONS) and not _BACKUP.search(path)
+
+def collect_models(sources, recursive=False):
+    """
+    Model paths from files and folders, in order, without duplicates or backups.
+
+    Args:
+        sources (list[str]): Model files and/or folders.
+        recursive (bool): Also search sub-folders of the given folders.
+    """
+    found = OrderedDict()
+    for source in sources:
+        if os.path.isdir(source):
+            if recursive:
+                paths = [os.path.join(root, name) for root, _dirs, names in os.walk(source) for name in names]
+            else:
+                paths = [os.path.join(source, name) for name in os.listdir(source)]
+            for path in sorted(paths, key=lambda p: p.lower()):
+                if is_model(path) and os.path.isfile(path):
+                    found.setdefault(os.path.normcase(os.path.abspath(path)), path)
+        elif is_model(source):
+            found.setdefault(os.path.normcase(os.path.abspath(source)), source)
+    return list(found.values())
+
+def is_workshared(path):
+    try:
+        return BasicFileInfo.Extract(path).IsWorkshared
+    except Exception:
+        return False
+
+def open_model(app, path, workshared, close_worksets=True):
+    """Open a model without UI (detached from central when workshared)."""
+    options = OpenOptions()
+    if workshared:
+        options.DetachFromCentralOption = DetachFromCentralOption.DetachAndPreserveWorksets
+        if close_worksets:
+            options.SetOpenWorksetsConfiguration(
+                WorksetConfiguration(WorksetConfigurationOption.CloseAllWorksets))
+    model_path = ModelPathUtils.ConvertUserVisiblePathToModelPath(path)
+    return app.OpenDocumentFile(model_path, options)
+
+def save_model(doc, path, workshared, output_folder=None):
+    """Save the model; returns the path it was saved to."""
+    if not output_folder:
+        doc.Save()
+        return path
+    target = os.path.join(output_folder, os.path.basename(path))
+    options = SaveAsOptions()
+    options.OverwriteExistingFile = True
+    if workshared:
+        sharing = WorksharingSaveAsOptions()
+        sharing.SaveAsCentral = True
+        options.SetWorksharingOptions(sharing)
+    doc.SaveAs(target, options)
+    return target
+
+def release(doc):
+    """Close a batch document and drop every cached reference to it."""
+    views.forget_view_index(doc)
+    try:
+        doc.Close(False)
+    except Exception:
+        pass
+
+# ---------------------------------------------------------------------------------
+# RUNNER
+# ---------------------------------------------------------------------------------
+
+def _ms(start):
+    return round((time.time() - start) * 1000, 1)
+
+def run_model(app, path, profile_list, output_folder=None, save=True, snapshot=False, close_worksets=True):
+    """
+    Open one model, replay the profiles, save and close it.
+
+    Returns:
+        dict: model, path, status ("ok" / "skipped" / "error"), open_ms, run_ms,
+        save_ms, total_ms, saved_as, message and profiles (see Replayer.run).
+    """
+    start = time.time()
+    result = OrderedDict([("model", os.path.basename(path)), ("path", path), ("status", "ok"),
+                          ("open_ms", 0.0), ("run_ms", 0.0), ("save_ms", 0.0), ("total_ms", 0.0),
+                          ("saved_as", ""), ("message", ""), ("profiles", [])])
+    workshared = is_workshared(path)
+    if save and workshared and not output_folder:
+        result["status"] = "skipped"
+        result["message"] = "Workshared model: pick an output folder (a detached copy cannot replace the central)"
+        return result
+
+    doc = None
+    try:
+        step = time.time()
+        doc = open_model(app, path, workshared, close_worksets)
+        result["open_ms"] = _ms(step)
+        metrics.count("Application.OpenDocumentFile")
+
+        step = time.time()
+        result["profiles"] = profiles.run_profiles(doc, profile_list, snapshot)
+        result["run_ms"] = _ms(step)
+
+        statuses = set(r["status"] for r in result["profiles"])
+        if "error" in statuses:
+            result["status"] = "error"
+            result["message"] = "{} profile(s) failed".format(
+                sum(1 for r in result["profiles"] if r["status"] == "error"))
+        if "ok" not in statuses:
+            result["message"] = result["message"] or "Nothing to change; not saved"
+            if result["status"] == "ok":
+                result["status"] = "skipped"
+        elif save:
+            step = time.time()
+            result["saved_as"] = save_model(doc, path, workshared, output_folder)
+            result["save_ms"] = _ms(step)
+    except Exception as ex:
+        result["status"] = "error"
+        result["message"] = str(ex)
+    finally:
+        if doc is not None:
+            release(doc)
+        doc = None
+        gc.collect()
+    result["total_ms"] = _ms(start)
+    return result
+
+def run_batch(app, models, profile_list, output_folder=None, save=True, snapshot=False,
+              close_worksets=True, progress=None):
+    """
+    Replay profiles over models, one model open at a time.
+
+    Args:
+        app: Revit Application (__revit__.Application).
+        models (list[str]): Model paths (see collect_models).
+        profile_list (list[dict]): Profiles to replay in each model, in order.
+        output_folder (str): Save copies here instead of in place (required for
+            workshared models).
+        save (bool): False runs the profiles and closes without saving (dry run).
+        snapshot (bool): Snapshot the touched pairs per model (see Restore Snapshot).
+        progress (callable): Called as progress(index, total, path) before each
+            model; returning False cancels the remaining models.
+
+    Returns:
+        list[dict]: One result per model (see run_model).
+    """
+    for profile in profile_list:
+        profiles.check_profile(profile)
+    if output_folder and not os.path.isdir(output_folder):
+        os.makedirs(output_folder)
+
+    results = []
+    for index, path in enumerate(models):
+        if progress is not None and progress(index, len(models), path) is False:
+            break
+        results.append(run_model(app, path, profile_list, output_folder, save, snapshot, close_worksets))
+    metrics.note("models", len(results))
+    return results
+
+# ---------------------------------------------------------------------------------
+# REPORT
+# ---------------------------------------------------------------------------------
+
+def report_rows(results):
+    """Flat report rows: one per (model, profile), or one per model without profile results."""
+    for r in results:
+        head = [r["model"], r["status"], r["open_ms"], r["run_ms"], r["save_ms"], r["total_ms"], r["saved_as"]]
+        if not r["profiles"]:
+            yield head + ["", "", "", "", "", r["message"]]
+        for p in r["profiles"]:
+            yield head + [p["name"], p["status"], p["targets"], p["filters"], p["ms"], p["message"]]
+
+def _cell(value):
+    value = value if isinstance(value, type(u"")) else type(u"")(value)
+    if any(c in value for c in (u",", u'"', u"\r", u"\n")):
+        return u'"' + value.replace(u'"', u'""') + u'"'
+    return value
+
+def write_report(results, path):
+    """Write the consolidated per-model report as CSV (UTF-8 with BOM, for Excel)."""
+    lines = [u"\ufeff" + u",".join(REPORT_HEADERS)]
+    lines.extend(u",".join(_cell(v) for v in row) for row in report_rows(results))
+    with open(path, "wb") as f:
+        f.write((u"\r\n".join(lines) + u"\r\n").encode("utf-8"))
+    return path
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""
+🧩 LUDARP Library: Revit Version Adapter
+Author: PRADUL P
+
+Detects the Revit API features that differ between the versions we run,
+once when the module is first imported, and binds plain accessors for them,
+so hot loops never probe the API (no hasattr / getattr per view or filter):
+
+    ID_64               ElementId.Value (64-bit ids, Revit 2024+) instead of IntegerValue
+    FILTER_VISIBILITY   View.Get/SetFilterVisibility
+    FILTER_ENABLE       View.Get/SetIsFilterEnabled (Revit 2021+)
+    FILL_LAYERS         Foreground/background fill patterns (Revit 2019+); older
+                        versions have one ProjectionFill / CutFill pattern and color
+
+    from ludarp.compat import id_value, make_id, ogs_getter, ogs_setter
+
+    get_color = ogs_getter("SurfaceForegroundPatternColor")   # bound once
+    for fid in filter_ids:
+        color = get_color(view.GetFilterOverrides(fid))
+
+OverrideGraphicSettings fields use the Revit 2019+ names everywhere in
+LUDARP (see ludarp.ogsstate); on older versions they are mapped to the
+single-layer properties, and background fields read as "no override".
+"""
+from operator import attrgetter
+from Autodesk.Revit.DB import ElementId, OverrideGraphicSettings, View
+
+# ---------------------------------------------------------------------------------
+# FEATURES (detected once)
+# ---------------------------------------------------------------------------------
+
+ID_64 = hasattr(ElementId, "Value")
+FILTER_VISIBILITY = hasattr(View, "GetFilterVisibility")
+FILTER_ENABLE = hasattr(View, "GetIsFilterEnabled")
+FILL_LAYERS = hasattr(OverrideGraphicSettings, "SurfaceForegroundPatternId")
+
+FEATURES = {
+    "id_64": ID_64,
+    "filter_visibility": FILTER_VISIBILITY,
+    "filter_enable": FILTER_ENABLE,
+    "fill_layers": FILL_LAYERS,
+}
+
+def describe():
+    """One line listing the detected features (for reports and metrics)."""
+    return ", ".join("{}={}".format(k, "yes" if v else "no") for k, v in sorted(FEATURES.items()))
+
+# ---------------------------------------------------------------------------------
+# ELEMENT IDS
+# ---------------------------------------------------------------------------------
+
+# id_value(eid) -> integer value of an ElementId
+if ID_64:
+    id_value = attrgetter("Value")
+    try:
+        from System import Int64
+    except ImportError:
+        # Outside Revit (the dev/fakerevit.py stand-in)
+        Int64 = int
+
+    def make_id(value):
+        return ElementId(Int64(value))
+else:
+    id_value = attrgetter("IntegerValue")
+
+    def make_id(value):
+        return ElementId(int(value))
+
+# ---------------------------------------------------------------------------------
+# FILTERS IN VIEWS
+# ---------------------------------------------------------------------------------
+
+def _no_value(view, fid):
+    return None
+
+def _ignore(view, fid, value):
+    pass
+
+def _get_visibility(view, fid):
+    try:
+        return bool(view.GetFilterVisibility(fid))
+    except Exception:
+        # View types without filter visibility (schedules, legends...)
+        return None
+
+def _set_visibility(view, fid, visible):
+    view.SetFilterVisibility(fid, visible)
+
+def _get_enabled(view, fid):
+    try:
+        return bool(view.GetIsFilterEnabled(fid))
+    except Exception:
+        return None
+
+def _set_enabled(view, fid, enabled):
+    view.SetIsFilterEnabled(fid, enabled)
+
+# Filter visibility / enabled state in a view: None where the version or view type has none
+get_filter_visibility = _get_visibility if FILTER_VISIBILITY else _no_value
+set_filter_visibility = _set_visibility if FILTER_VISIBILITY else _ignore
+get_filter_enabled = _get_enabled if FILTER_ENABLE else _no_value
+set_filter_enabled = _set_enabled if FILTER_ENABLE else _ignore
+
+# ---------------------------------------------------------------------------------
+# OVERRIDE GRAPHIC SETTINGS
+# ---------------------------------------------------------------------------------
+
+# Revit 2019+ field -> pre-2019 property (None: not available)
+_SINGLE_LAYER = {
+    "SurfaceForegroundPatternId": "ProjectionFillPatternId",
+    "SurfaceForegroundPatternColor": "ProjectionFillColor",
+    "SurfaceBackgroundPatternId": None,
+    "SurfaceBackgroundPatternColor": None,
+    "CutForegroundPatternId": "CutFillPatternId",
+    "CutForegroundPatternColor": "CutFillColor",
+    "CutBackgroundPatternId": None,
+    "CutBackgroundPatternColor": None,
+}
+
+def ogs_property(name):
+    """This version's OverrideGraphicSettings property for a field (None if missing)."""
+    if FILL_LAYERS:
+        return name
+    return _SINGLE_LAYER.get(name, name)
+
+def ogs_getter(name):
+    """ogs -> value of a field, bound once (None where the version lacks the field)."""
+    prop = ogs_property(name)
+    if prop is None:
+        return lambda ogs: None
+    return attrgetter(prop)
+
+def ogs_setter(name):
+    """(ogs, value) -> None setting a field, bound once (ignored where the version lacks it)."""
+    prop = ogs_property(name)
+    if prop is None:
+        return lambda ogs, value: None
+    method = getattr(OverrideGraphicSettings, "Set" + prop, None)
+    if method is not None:
+        return method
+    # Setters resolved per instance (the dev stand-in)
+    setter_name = "Set" + prop
+    return lambda ogs, value: getattr(ogs, setter_name)(value)
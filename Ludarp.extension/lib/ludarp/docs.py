@@ -0,0 +1,15 @@
+# -*- coding: utf-8 -*-
+"""
+🗂️ LUDARP Library: Document Keys
+Author: PRADUL P
+
+Stable per-document keys, shared by the snapshot store, saved profiles and
+the per-document caches (value extraction, match counts). A leaf module
+(standard library only), so taking a key loads nothing else.
+"""
+import hashlib
+
+def document_key(doc):
+    """Stable key for a document (from its path, or its title if unsaved)."""
+    source = doc.PathName or doc.Title
+    return hashlib.md5(source.encode("utf-8")).hexdigest()[:16]
@@ -0,0 +1,265 @@
+# -*- coding: utf-8 -*-
+"""
+🧮 LUDARP Library: Expression Engine
+Version: 1.0 | Author: PRADUL P
+
+A small expression language over picked element values. Pure Python (no Revit
+imports), so it can be used and tested outside Revit.
+
+Syntax:
+    Variables     A, B, C ... (any identifier; values are supplied at evaluation)
+    Operators     + - * /  (also − × ÷), parentheses, unary minus/plus
+    Functions     abs(x), min(x, ...), max(x, ...), sqrt(x), round(x[, step])
+    Lengths       1200mm, 120cm, 1.2m, 4ft, 4', 6in, 6"  (converted to decimal feet)
+    Numbers       plain literals are unitless scalars (e.g. A * 2, (A + B) / 2)
+
+All lengths are decimal feet, the Revit internal unit. Each expression is
+compiled once into a tree of closures and can then be evaluated against any
+number of value sets.
+
+Example:
+    expr = compile_expression("max(A - B, 0) + 1200mm")
+    results = expr.evaluate_many({"A": a, "B": b} for a, b in pairs)
+"""
+import re
+import math
+from ludarp.units import FEET_PER_UNIT
+
+# Length units accepted as literal suffixes: suffix -> decimal feet per unit
+LENGTH_UNITS = dict((unit, float(factor)) for unit, factor in FEET_PER_UNIT.items())
+
+class ExpressionError(ValueError):
+    """Raised for syntax errors and evaluation errors (unknown variable, division by zero)."""
+    def __init__(self, message, position=None):
+        if position is not None:
+            message = "{0} (at position {1})".format(message, position + 1)
+        ValueError.__init__(self, message)
+        self.position = position
+
+# ---------------------------------------------------------------------------------
+# TOKENIZER
+# ---------------------------------------------------------------------------------
+
+_TOKEN_RE = re.compile(r"""
+    (?P<ws>\s+)
+  | (?P<num>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)(?:\s*(?P<unit>(?:mm|cm|ft|in|m)(?![A-Za-z0-9_])|'|"))?
+  | (?P<name>[A-Za-z_][A-Za-z0-9_]*)
+  | (?P<op>[-+*/(),])
+""", re.VERBOSE)
+
+# Unicode math symbols map onto their ASCII operators
+_OP_ALIASES = {u"−": u"-", u"×": u"*", u"÷": u"/"}
+
+def tokenize(source):
+    """Split source into (kind, value, position) tokens; kinds are num, name, op, end."""
+    for alias, op in _OP_ALIASES.items():
+        source = source.replace(alias, op)
+    tokens = []
+    pos = 0
+    while pos < len(source):
+        m = _TOKEN_RE.match(source, pos)
+        if not m:
+            raise ExpressionError("Unexpected character '{0}'".format(source[pos]), pos)
+        kind = m.lastgroup if m.lastgroup != "unit" else "num"
+        if kind == "num":
+            value = float(m.group("num"))
+            unit = m.group("unit")
+            if unit:
+                value *= LENGTH_UNITS[unit]
+            tokens.append(("num", value, pos))
+        elif kind == "name":
+            tokens.append(("name", m.group("name"), pos))
+        elif kind == "op":
+            tokens.append(("op", m.group("op"), pos))
+        pos = m.end()
+    tokens.append(("end", None, pos))
+    return tokens
+
+# ---------------------------------------------------------------------------------
+# FUNCTIONS
+# ---------------------------------------------------------------------------------
+
+def _round(x, step=1.0):
+    """Round to the nearest multiple of step (half away from zero)."""
+    if step <= 0:
+        raise ExpressionError("round() step must be positive")
+    n = math.floor(abs(x) / step + 0.5)
+    return math.copysign(n * step, x)
+
+def _sqrt(x):
+    if x < 0:
+        raise ExpressionError("sqrt() of a negative value")
+    return math.sqrt(x)
+
+# name -> (function, min args, max args or None for variadic)
+FUNCTIONS = {
+    "abs": (abs, 1, 1),
+    "min": (min, 1, None),
+    "max": (max, 1, None),
+    "sqrt": (_sqrt, 1, 1),
+    "round": (_round, 1, 2),
+}
+
+# ---------------------------------------------------------------------------------
+# PARSER / COMPILER
+# ---------------------------------------------------------------------------------
+
+def _divide(a, b):
+    if abs(b) < 1e-12:
+        raise ExpressionError("Division by zero")
+    return a / b
+
+_BINARY = {
+    "+": lambda a, b: a + b,
+    "-": lambda a, b: a - b,
+    "*": lambda a, b: a * b,
+    "/": _divide,
+}
+
+class _Parser(object):
+    """
+    Recursive-descent parser that emits compiled nodes directly.
+    Each node is a pair (is_constant, fn) where fn(values) returns a float;
+    constant subtrees are folded at compile time.
+    """
+    def __init__(self, source):
+        self.tokens = tokenize(source)
+        self.index = 0
+        self.variables = set()
+
+    def peek(self):
+        return self.tokens[self.index]
+
+    def next(self):
+        tok = self.tokens[self.index]
+        self.index += 1
+        return tok
+
+    def expect(self, value):
+        kind, val, pos = self.next()
+        if kind != "op" or val != value:
+            raise ExpressionError("Expected '{0}'".format(value), pos)
+
+    def parse(self):
+        node = self.expression()
+        kind, _val, pos = self.peek()
+        if kind != "end":
+            raise ExpressionError("Unexpected input", pos)
+        return node
+
+    def expression(self):
+        node = self.term()
+        while self.peek()[0] == "op" and self.peek()[1] in ("+", "-"):
+            node = self._binary(self.next()[1], node, self.term())
+        return node
+
+    def term(self):
+        node = self.unary()
+        while self.peek()[0] == "op" and self.peek()[1] in ("*", "/"):
+            node = self._binary(self.next()[1], node, self.unary())
+        return node
+
+    def unary(self):
+        kind, val, _pos = self.peek()
+        if kind == "op" and val in ("-", "+"):
+            self.next()
+            const, fn = self.unary()
+            if val == "+":
+                return const, fn
+            if const:
+                c = -fn(None)
+                return True, lambda v: c
+            return False, lambda v: -fn(v)
+        return self.atom()
+
+    def atom(self):
+        kind, val, pos = self.next()
+        if kind == "num":
+            return True, lambda v: val
+        if kind == "op" and val == "(":
+            node = self.expression()
+            self.expect(")")
+            return node
+        if kind == "name":
+            if self.peek()[0] == "op" and self.peek()[1] == "(":
+                return self._call(val, pos)
+            return self._variable(val)
+        if kind == "end":
+            raise ExpressionError("Unexpected end of expression", pos)
+        raise ExpressionError("Unexpected '{0}'".format(val), pos)
+
+    def _variable(self, name):
+        self.variables.add(name)
+
+        def _get(values):
+            try:
+                return values[name]
+            except (KeyError, TypeError):
+                raise ExpressionError("No value for variable '{0}'".format(name))
+        return False, _get
+
+    def _call(self, name, pos):
+        if name not in FUNCTIONS:
+            raise ExpressionError("Unknown function '{0}'".format(name), pos)
+        func, min_args, max_args = FUNCTIONS[name]
+        self.expect("(")
+        args = [self.expression()]
+        while self.peek()[0] == "op" and self.peek()[1] == ",":
+            self.next()
+            args.append(self.expression())
+        self.expect(")")
+        if len(args) < min_args or (max_args is not None and len(args) > max_args):
+            raise ExpressionError("Wrong number of arguments for {0}()".format(name), pos)
+
+        fns = [fn for _const, fn in args]
+        if name in ("min", "max"):
+            call = lambda v: func([f(v) for f in fns])
+        else:
+            call = lambda v: func(*[f(v) for f in fns])
+        return self._fold(all(c for c, _fn in args), call)
+
+    def _binary(self, op, left, right):
+        (lc, lf), (rc, rf) = left, right
+        apply = _BINARY[op]
+        return self._fold(lc and rc, lambda v: apply(lf(v), rf(v)))
+
+    def _fold(self, constant, fn):
+        if constant:
+            c = fn(None)
+            return True, lambda v: c
+        return False, fn
+
+class Expression(object):
+    """A compiled expression. Evaluate it against dicts of variable values (decimal feet)."""
+    def __init__(self, source):
+        parser = _Parser(source)
+        _const, self._fn = parser.parse()
+        self.source = source
+        self.variables = tuple(sorted(parser.variables))
+
+    def evaluate(self, values=None):
+        """Evaluate against one value set, e.g. {"A": 10.0, "B": 3.5}."""
+        try:
+            return float(self._fn(values))
+        except ZeroDivisionError:
+            raise ExpressionError("Division by zero")
+
+    __call__ = evaluate
+
+    def evaluate_many(self, value_sets):
+        """Evaluate against many value sets; returns a list of results."""
+        fn = self._fn
+        return [float(fn(values)) for values in value_sets]
+
+    def __repr__(self):
+        return "Expression({0!r})".format(self.source)
+
+_CACHE = {}
+
+def compile_expression(source):
+    """Compile source once; repeated calls with the same text reuse the compiled expression."""
+    source = source.strip()
+    expr = _CACHE.get(source)
+    if expr is None:
+        expr = _CACHE[source] = Expression(source)
+    return expr
@@ -0,0 +1,346 @@
+# -*- coding: utf-8 -*-
+"""
+📍 LUDARP Library: Value Extraction
+Version: 1.1 | Author: PRADUL P
+
+Type-dispatched extraction of numeric values (decimal feet) from elements.
+Strategies are registered per element class; the strategy chain for each
+concrete class is resolved once. The generic parameter strategy resolves the
+winning parameter once per (class, category, element type), as a
+BuiltInParameter where possible or a Definition otherwise, so later reads are
+a single direct get_Parameter call with no name lookups.
+
+New strategies can be registered from any script:
+
+    @register_extractor(Railing)
+    def _railing_height(el, registry):
+        return el.get_Parameter(BuiltInParameter.STAIRS_RAILING_HEIGHT).AsDouble()
+
+Extracted values and display names are cached per document and element id
+(get_value_cache), so the same Levels and Spots picked again in later
+calculations, batch tables or history logging cost a dictionary lookup
+instead of GetElement and the strategy chain. With pyRevit the cache lives in
+the pyRevit environment store and survives between button runs; the
+doc-changed hook (hooks/doc-changed.py) calls on_document_changed() to drop:
+
+    modified / deleted element         -> its entries
+    modified element type              -> entries of its instances
+    modified Level                     -> every non-Level value (hosted
+                                          elements and spots move with it)
+"""
+from Autodesk.Revit.DB import (
+    Element, ElementId, Level, LocationPoint, SpotDimension, Dimension,
+    BuiltInParameter, StorageType
+)
+from ludarp import metrics
+from ludarp.compat import id_value
+from ludarp.docs import document_key
+
+# Parameter candidates for the generic strategy, in priority order.
+# Built-in parameters are locale-independent; names are the last resort.
+PARAMETER_BIPS = [
+    BuiltInParameter.LEVEL_ELEV,
+    BuiltInParameter.INSTANCE_ELEVATION_PARAM,
+    BuiltInParameter.INSTANCE_FREE_HOST_OFFSET_PARAM,
+]
+PARAMETER_NAMES = ["Elevation", "Elevation from Level", "ELEVATION", "Offset"]
+
+def _read_double(param):
+    if param and param.HasValue and param.StorageType == StorageType.Double:
+        return param.AsDouble()
+    return None
+
+class ExtractorRegistry(object):
+    """Registry of extraction strategies keyed by element class."""
+    def __init__(self):
+        self._strategies = []   # (class, fn) in registration order
+        self._chains = {}       # concrete class -> [fn, ...]
+        self._params = {}       # (class, category id, type id) -> BuiltInParameter / Definition / None
+        self.resolutions = 0
+
+    def register(self, cls, fn=None):
+        """Register fn(el, registry) -> float or None for elements of cls (usable as decorator)."""
+        def _add(fn):
+            self._strategies.append((cls, fn))
+            self._chains.clear()
+            return fn
+        return _add(fn) if fn is not None else _add
+
+    def chain_for(self, el):
+        """Strategies applying to el's concrete class, resolved once per class."""
+        el_cls = type(el)
+        chain = self._chains.get(el_cls)
+        if chain is None:
+            chain = self._chains[el_cls] = [fn for cls, fn in self._strategies if isinstance(el, cls)]
+        return chain
+
+    def extract(self, el):
+        """First non-None value from the element's strategy chain."""
+        if el is None:
+            return None
+        for fn in self.chain_for(el):
+            try:
+                value = fn(el, self)
+            except Exception:
+                value = None
+            if value is not None:
+                return value
+        return None
+
+    def extract_many(self, elements):
+        """Extract values for many elements; returns a list aligned with elements."""
+        return [self.extract(el) for el in elements]
+
+    # ---- Per-type parameter resolution ----
+    def _param_key(self, el):
+        cat = el.Category
+        return (type(el), id_value(cat.Id) if cat else None, id_value(el.GetTypeId()))
+
+    def _resolve_parameter(self, el):
+        self.resolutions += 1
+        for bip in PARAMETER_BIPS:
+            if _read_double(el.get_Parameter(bip)) is not None:
+                return bip
+        for name in PARAMETER_NAMES:
+            param = el.LookupParameter(name)
+            if _read_double(param) is not None:
+                return param.Definition
+        return None
+
+    def parameter_value(self, el):
+        """Read the resolved parameter for el's type; resolve on first use."""
+        key = self._param_key(el)
+        if key in self._params:
+            target = self._params[key]
+            if target is None:
+                return None
+            value = _read_double(el.get_Parameter(target))
+            if value is not None:
+                return value
+            # This instance lacks the cached parameter: resolve it without caching
+            target = self._resolve_parameter(el)
+            return _read_double(el.get_Parameter(target)) if target is not None else None
+
+        target = self._params[key] = self._resolve_parameter(el)
+        return _read_double(el.get_Parameter(target)) if target is not None else None
+
+REGISTRY = ExtractorRegistry()
+register_extractor = REGISTRY.register
+
+def extract_value(el):
+    """Extract a numeric value (decimal feet) from an element, or None (uncached; see get_value_cache)."""
+    return REGISTRY.extract(el)
+
+def dimension_segments(dim):
+    """
+    Every segment value of a dimension in one pass over its segment array.
+    Single-segment dimensions return [Value]; segments without a value are skipped.
+    """
+    if dim.NumberOfSegments > 1:
+        values = (seg.Value for seg in dim.Segments)
+        return [v for v in values if v is not None]
+    return [dim.Value] if dim.Value is not None else []
+
+def _element_info(el):
+    el_type = el.GetType().Name
+    el_name = el.Name
+    if not el_name or el_name == el_type:
+        if hasattr(el, "Category") and el.Category:
+            return "{0} (ID: {1})".format(el.Category.Name, el.Id)
+    return "{0}: {1}".format(el_type, el_name)
+
+def get_ref_info(doc, ref):
+    """Resolve element category/type and name from selection reference (cached per element)."""
+    return get_value_cache(doc).info(doc, ref)
+
+# ---------------------------------------------------------------------------------
+# CACHE
+# ---------------------------------------------------------------------------------
+
+REGISTRY_VAR = "LUDARP_ELEMENT_VALUES"
+_LOCAL_REGISTRY = {}
+
+MANUAL_POINT = "Manual Point"
+
+def _registry():
+    """Document key -> cache state; shared across button runs when pyRevit is loaded."""
+    try:
+        from pyrevit.coreutils import envvars
+    except ImportError:
+        return _LOCAL_REGISTRY
+    registry = envvars.get_pyrevit_env_var(REGISTRY_VAR)
+    if registry is None:
+        registry = {}
+        envvars.set_pyrevit_env_var(REGISTRY_VAR, registry)
+    return registry
+
+def _element_key(ref):
+    """(id value, element or None) of an Element, ElementId or Reference."""
+    if isinstance(ref, Element):
+        return id_value(ref.Id), ref
+    if isinstance(ref, ElementId):
+        return id_value(ref), None
+    return id_value(ref.ElementId), None
+
+class ElementValueCache(object):
+    """
+    Extracted values and display names of one document, keyed by element id
+    value. The state is plain dicts, so it can be kept in the pyRevit store and
+    outlive this module between runs. Values of None (nothing extractable) are
+    cached too; picked manual points never are.
+    """
+    def __init__(self, state=None):
+        self.state = state if state is not None else {}
+        self.values = self.state.setdefault("values", {})      # element -> value or None
+        self.infos = self.state.setdefault("infos", {})        # element -> display name
+        self.by_type = self.state.setdefault("by_type", {})    # type -> elements
+        self.levels = self.state.setdefault("levels", set())   # elements that are Levels
+        self.counts = self.state.setdefault("counts", {"hits": 0, "misses": 0})
+
+    def __len__(self):
+        return len(self.values) + len(self.infos)
+
+    def _remember(self, key, el):
+        if isinstance(el, Level):
+            self.levels.add(key)
+        type_id = id_value(el.GetTypeId())
+        if type_id > 0:
+            self.by_type.setdefault(type_id, set()).add(key)
+
+    def _hit(self):
+        self.counts["hits"] += 1
+        metrics.count("ElementValue.cached")
+
+    def _resolve(self, doc, el, ref):
+        if el is not None:
+            return el
+        metrics.count("Document.GetElement")
+        try:
+            return doc.GetElement(ref)
+        except Exception:
+            return None
+
+    def value(self, doc, ref):
+        """Extracted value (decimal feet) of a picked reference, element id or element, or None."""
+        key, el = _element_key(ref)
+        if key in self.values:
+            self._hit()
+            return self.values[key]
+        el = self._resolve(doc, el, ref)
+        if el is None:
+            return None
+        self.counts["misses"] += 1
+        metrics.count("extract_value")
+        value = self.values[key] = REGISTRY.extract(el)
+        self._remember(key, el)
+        return value
+
+    def values_of(self, elements):
+        """Extracted values of resolved elements, aligned with elements (no GetElement)."""
+        return [self.value(None, el) for el in elements]
+
+    def info(self, doc, ref):
+        """Display name of a picked reference, element id or element ("Manual Point" without one)."""
+        try:
+            key, el = _element_key(ref)
+        except Exception:
+            return MANUAL_POINT
+        info = self.infos.get(key)
+        if info is not None:
+            self._hit()
+            return info
+        el = self._resolve(doc, el, ref)
+        if not el:
+            return MANUAL_POINT
+        try:
+            info = _element_info(el)
+        except Exception:
+            return MANUAL_POINT
+        self.counts["misses"] += 1
+        self.infos[key] = info
+        self._remember(key, el)
+        return info
+
+    def drop(self, key):
+        self.values.pop(key, None)
+        self.infos.pop(key, None)
+        self.levels.discard(key)
+
+    def clear(self):
+        for part in (self.values, self.infos, self.by_type, self.levels):
+            part.clear()
+        self.counts.update(hits=0, misses=0)
+
+    def invalidate(self, element_ids):
+        """Drop the entries affected by changes to these elements (id values)."""
+        level_changed = False
+        for eid in element_ids:
+            if eid in self.levels:
+                level_changed = True
+            self.drop(eid)
+            for instance in self.by_type.pop(eid, ()):
+                self.drop(instance)
+        if level_changed:
+            # Names of other elements stay valid; their values may not
+            for key in [k for k in self.values if k not in self.levels]:
+                del self.values[key]
+
+    def stats(self):
+        return dict(self.counts, values=len(self.values), infos=len(self.infos))
+
+def get_value_cache(doc):
+    """Extraction cache of the document (shared by every tool for the session)."""
+    registry = _registry()
+    key = document_key(doc)
+    state = registry.get(key)
+    if state is None:
+        state = registry[key] = {}
+    return ElementValueCache(state)
+
+def forget(doc):
+    """Drop every cached value of a document."""
+    _registry().pop(document_key(doc), None)
+
+def on_document_changed(doc, deleted_ids, modified_ids):
+    """DocumentChanged handler: drop the entries of changed elements (no API reads)."""
+    state = _registry().get(document_key(doc))
+    if not state or not (state.get("values") or state.get("infos")):
+        return
+    changed = [id_value(eid) for eid in deleted_ids]
+    changed.extend(id_value(eid) for eid in modified_ids)
+    if changed:
+        ElementValueCache(state).invalidate(changed)
+
+# ---------------------------------------------------------------------------------
+# BUILT-IN STRATEGIES (registration order is evaluation order)
+# ---------------------------------------------------------------------------------
+
+@register_extractor(Level)
+def _level(el, registry):
+    return el.Elevation
+
+@register_extractor(SpotDimension)
+def _spot(el, registry):
+    try:
+        return el.Origin.Z
+    except Exception:
+        return _read_double(el.get_Parameter(BuiltInParameter.DIM_VALUE_LENGTH))
+
+@register_extractor(Dimension)
+def _dimension(el, registry):
+    if el.Value is not None:
+        return el.Value
+    if el.Segments.Size > 0:
+        return el.Segments.get_Item(0).Value
+    return None
+
+@register_extractor(Element)
+def _location_point(el, registry):
+    loc = el.Location
+    if isinstance(loc, LocationPoint):
+        return loc.Point.Z
+    return None
+
+@register_extractor(Element)
+def _parameter(el, registry):
+    return registry.parameter_value(el)
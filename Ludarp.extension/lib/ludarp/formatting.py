@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""
+📏 LUDARP Library: Revit Unit Formatting
+Author: PRADUL P
+
+Project unit detection and a per-document cache of configured Revit unit
+formatters, rebuilt when the document's project units change. Falls back to
+the exact pure-Python engine (ludarp.units) when Revit's UnitFormatUtils is
+unavailable.
+
+get_formatters() reads and fingerprints the project units, so entry points
+call it once per run and pass the registry down to everything that formats.
+"""
+from Autodesk.Revit.DB import SpecTypeId, UnitTypeId, UnitFormatUtils, FormatOptions
+from ludarp import units as lunits
+
+# ---------- Configuration ----------
+UNITS = {
+    "m": {"label": "Meters", "id": UnitTypeId.Meters},
+    "cm": {"label": "Centimeters", "id": UnitTypeId.Centimeters},
+    "mm": {"label": "Millimeters", "id": UnitTypeId.Millimeters},
+    "ft": {"label": "Feet", "id": UnitTypeId.Feet},
+    "fi": {"label": "Fractional Inches", "id": UnitTypeId.FeetFractionalInches}
+}
+
+# Accuracy applied per unit, shared with the unit engine so both format identically
+UNIT_ACCURACY = dict((k, float(lunits.accuracy_for(k))) for k in UNITS)
+
+def detect_project_unit(doc):
+    try:
+        units = doc.GetUnits()
+        fmt = units.GetFormatOptions(SpecTypeId.Length)
+        uid = fmt.GetUnitTypeId()
+
+        for key, spec in UNITS.items():
+            if uid == spec["id"]:
+                return key
+    except:
+        pass
+    return "m"
+
+def _format_options(unit_key, accuracy=None):
+    """Create format options for the target unit with the given accuracy."""
+    target_uid = UNITS.get(unit_key, {}).get("id", UnitTypeId.Meters)
+    fo = FormatOptions(target_uid)
+    if accuracy is not None:
+        fo.Accuracy = accuracy
+    return fo
+
+def _fallback_format(value_feet, unit_key, accuracy=None):
+    """Fallback to the pure-Python unit engine if Revit API fails."""
+    return lunits.format_length(value_feet, unit_key, accuracy)
+
+def units_fingerprint(units):
+    """The project unit settings that change a formatted length (None if unreadable)."""
+    try:
+        fo = units.GetFormatOptions(SpecTypeId.Length)
+        return (units.DecimalSymbol, units.DigitGroupingSymbol, units.DigitGroupingAmount,
+                fo.GetUnitTypeId().TypeId, fo.Accuracy)
+    except Exception:
+        return None
+
+class FormatterRegistry(object):
+    """
+    Formatter cache for one document's units: one configured formatter per
+    (unit key, accuracy). FormatOptions are built on the first request only;
+    hits/misses are counted for profiling. get_formatters() replaces the
+    registry when the units fingerprint changes.
+    """
+    def __init__(self, doc, units=None, fingerprint=None):
+        self.doc = doc
+        self._units = units
+        self.fingerprint = fingerprint
+        self._formatters = {}
+        self.hits = 0
+        self.misses = 0
+
+    def formatter(self, unit_key, accuracy=None):
+        """Return a callable formatting decimal feet into unit_key."""
+        if accuracy is None:
+            accuracy = UNIT_ACCURACY.get(unit_key)
+        key = (unit_key, accuracy)
+        fn = self._formatters.get(key)
+        if fn is not None:
+            self.hits += 1
+            return fn
+
+        self.misses += 1
+        try:
+            if self._units is None:
+                self._units = self.doc.GetUnits()
+            units, fo = self._units, _format_options(unit_key, accuracy)
+
+            def fn(value_feet):
+                try:
+                    return UnitFormatUtils.Format(units, SpecTypeId.Length, value_feet, False, fo)
+                except Exception:
+                    return _fallback_format(value_feet, unit_key, accuracy)
+        except Exception:
+            fn = lunits.formatter(unit_key, accuracy)
+        self._formatters[key] = fn
+        return fn
+
+    def format(self, value_feet, unit_key, accuracy=None):
+        return self.formatter(unit_key, accuracy)(value_feet)
+
+    def format_many(self, values, unit_key, accuracy=None):
+        """Format many values with a single formatter lookup."""
+        fn = self.formatter(unit_key, accuracy)
+        return [fn(v) for v in values]
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "formatters": len(self._formatters)}
+
+_REGISTRIES = {}
+
+def get_formatters(doc):
+    """
+    Formatter registry for the document, rebuilt when its project units change.
+    Reads the units on every call: take it once per run, not once per value.
+    """
+    key = (doc.Title, doc.PathName)
+    try:
+        units = doc.GetUnits()
+    except Exception:
+        units = None
+    fingerprint = units_fingerprint(units)
+    registry = _REGISTRIES.get(key)
+    if registry is None or registry.fingerprint != fingerprint:
+        registry = _REGISTRIES[key] = FormatterRegistry(doc, units, fingerprint)
+    return registry
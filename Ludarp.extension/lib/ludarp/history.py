@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+"""
+📤 LUDARP Library: History Store
+Version: 1.5 | Author: PRADUL P
+
+Appends calculations to the history log and reads it back entry by entry.
+HistoryTail follows the log from a byte offset, so an open History window only
+parses the lines appended since it last looked. Exporting lives in
+ludarp.historyexport, which the Calculator never loads.
+"""
+import os
+import io
+import json
+import tempfile
+from datetime import datetime
+from ludarp import metrics
+
+# Append-only history log (one JSON object per line) and the old JSON array log
+temp_dir = tempfile.gettempdir()
+HISTORY_FILE = os.path.join(temp_dir, "calculator_history.jsonl")
+LEGACY_HISTORY_FILE = os.path.join(temp_dir, "calculator_history.json")
+
+# ---------------------------------------------------------------------------------
+# READING
+# ---------------------------------------------------------------------------------
+
+def _legacy_entries(legacy_path):
+    """Entries of the old JSON array log (empty when missing or unreadable)."""
+    if not legacy_path or not os.path.exists(legacy_path):
+        return []
+    try:
+        with io.open(legacy_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception:
+        return []
+
+def iter_history(path=HISTORY_FILE, legacy_path=LEGACY_HISTORY_FILE):
+    """
+    Yield history entries (dicts) in chronological order, one at a time.
+
+    Entries from the legacy JSON array log are yielded first, then the
+    append-only log is streamed line by line. Corrupt lines are skipped.
+    """
+    for entry in _legacy_entries(legacy_path):
+        yield entry
+
+    if not os.path.exists(path):
+        return
+    with io.open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
+
+def _parse_line(line):
+    """History entry of one log line (bytes), or None for blank and corrupt lines."""
+    line = line.decode("utf-8").strip()
+    if not line:
+        return None
+    try:
+        return json.loads(line)
+    except ValueError:
+        return None
+
+class HistoryTail(object):
+    """
+    Incremental reader of the history log. Each read() parses only the lines
+    appended since the previous one; a line still being written (no newline
+    yet) is left for the next read. changed() costs a single stat call, so it
+    can be polled.
+
+        tail = HistoryTail()
+        entries, reset = tail.read()        # whole log (legacy entries first)
+        ...
+        if tail.changed():
+            entries, reset = tail.read()    # only the new entries
+
+    When the log shrinks (cleared or replaced), the next read starts over and
+    returns reset=True with the whole log.
+    """
+    def __init__(self, path=HISTORY_FILE, legacy_path=LEGACY_HISTORY_FILE):
+        self.path = path
+        self.legacy_path = legacy_path
+        self.offset = 0
+        self.started = False
+
+    def _size(self):
+        try:
+            return os.path.getsize(self.path)
+        except OSError:
+            return 0
+
+    def changed(self):
+        """True when the log has grown or shrunk since the last read."""
+        return not self.started or self._size() != self.offset
+
+    def reset(self):
+        """Read the whole log again on the next read()."""
+        self.offset = 0
+        self.started = False
+
+    def read(self):
+        """
+        Entries appended since the last read, in chronological order.
+
+        Returns:
+            (list[dict], bool): The entries, and whether the log started over
+            (the entries are then the whole log and replace what was shown).
+        """
+        entries = []
+        reset = not self.started or self._size() < self.offset
+        if reset:
+            self.offset = 0
+            entries.extend(_legacy_entries(self.legacy_path))
+        self.started = True
+        if not os.path.exists(self.path):
+            return entries, reset
+        with open(self.path, "rb") as f:
+            f.seek(self.offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    # Still being appended: read it whole next time
+                    break
+                self.offset += len(line)
+                entry = _parse_line(line)
+                if entry is not None:
+                    entries.append(entry)
+        return entries, reset
+
+def op_display(op):
+    """Short display label for a logged operation name."""
+    if op.startswith("Formula: "):
+        return u"🧮 " + op[len("Formula: "):]
+    if "Addition" in op or "+" in op:
+        return u"➕ Add"
+    elif "Subtraction" in op or "-" in op:
+        return u"➖ Subtract"
+    elif "Multiplication" in op or "*" in op:
+        return u"✖️ Multiply"
+    elif "Division" in op or "/" in op:
+        return u"➗ Divide"
+    return op
+
+# ---------------------------------------------------------------------------------
+# WRITING
+# ---------------------------------------------------------------------------------
+
+def make_history_entry(a_info, val_a_str, b_info, val_b_str, op, res_val_str,
+                       a_ft=None, b_ft=None, res_ft=None):
+    """Build one history log entry from already-resolved element info and values."""
+    return {
+        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "element_a": a_info,
+        "value_a": val_a_str,
+        "element_b": b_info,
+        "value_b": val_b_str,
+        "operation": op,
+        "result": res_val_str,
+        # Raw values (decimal feet) so exports can convert units exactly
+        "value_a_ft": a_ft,
+        "value_b_ft": b_ft,
+        "result_ft": res_ft
+    }
+
+def append_history(entries, path=HISTORY_FILE):
+    """Append entries to the history log (JSON Lines) with a single file open."""
+    try:
+        with metrics.phase("apply"):
+            with open(path, "ab") as f:
+                f.write("".join(json.dumps(e) + "\n" for e in entries).encode("utf-8"))
+    except Exception:
+        pass
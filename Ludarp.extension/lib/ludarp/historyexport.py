@@ -0,0 +1,252 @@
+# -*- coding: utf-8 -*-
+"""
+📤 LUDARP Library: History Export
+Author: PRADUL P
+
+Streams the calculation history (ludarp.history) to CSV, JSONL or XLSX
+without ever holding the whole log in memory. Rows are encoded once each and
+written to disk in chunks; lengths can be converted on the way with the exact
+unit engine (ludarp.units).
+"""
+import os
+import json
+import shutil
+import tempfile
+import zipfile
+from collections import OrderedDict
+from xml.sax.saxutils import escape
+from ludarp import units as lunits
+from ludarp.history import iter_history, op_display
+
+try:
+    text_type = unicode
+except NameError:
+    text_type = str
+
+# Number of rows buffered before each write to disk
+CHUNK_ROWS = 500
+
+# Exportable columns: key -> header (in export order)
+COLUMNS = OrderedDict([
+    ("timestamp", "Timestamp"),
+    ("element_a", "Element A"),
+    ("value_a", "Value A"),
+    ("operation", "Operation"),
+    ("element_b", "Element B"),
+    ("value_b", "Value B"),
+    ("result", "Result"),
+])
+
+# Columns holding lengths, mapped to the raw value (decimal feet) logged beside them
+VALUE_COLUMNS = {"value_a": "value_a_ft", "value_b": "value_b_ft", "result": "result_ft"}
+
+# Target units for conversion during export: the unit engine's display units
+# ("fi" is exported as feet-fractional-inches text, the others as numbers)
+EXPORT_UNITS = OrderedDict(
+    (key, label) for key, (label, _factor, _accuracy) in lunits.UNIT_DEFS.items()
+)
+
+FORMATS = ("csv", "jsonl", "xlsx")
+
+# ---------------------------------------------------------------------------------
+# ROW BUILDING
+# ---------------------------------------------------------------------------------
+
+def _text(value):
+    if value is None:
+        return u""
+    if isinstance(value, text_type):
+        return value
+    if isinstance(value, bytes):
+        return value.decode("utf-8")
+    return text_type(value)
+
+def _row_builder(columns, unit):
+    """
+    Build a function mapping a history entry to a list of cell values.
+
+    Converted lengths are returned as numbers (rounded to the unit's accuracy);
+    everything else as text. Entries logged before raw values were recorded
+    keep their formatted string.
+    """
+    convert = None
+    if unit:
+        if unit not in EXPORT_UNITS:
+            raise ValueError("Unknown export unit: {}".format(unit))
+        if unit == "fi":
+            convert = lunits.formatter(unit)
+        else:
+            accuracy = lunits.accuracy_for(unit)
+            whole = accuracy.denominator == 1
+
+            def convert(raw):
+                value = lunits.round_to(lunits.to_unit(raw, unit), accuracy)
+                return int(value) if whole else float(value)
+
+    getters = []
+    for key in columns:
+        raw_key = VALUE_COLUMNS.get(key) if convert else None
+        if key == "operation":
+            getters.append(lambda e: op_display(_text(e.get("operation"))))
+        elif raw_key:
+            def _get(e, key=key, raw_key=raw_key):
+                raw = e.get(raw_key)
+                if raw is None:
+                    return _text(e.get(key))
+                return convert(raw)
+            getters.append(_get)
+        else:
+            getters.append(lambda e, key=key: _text(e.get(key)))
+
+    return lambda entry: [g(entry) for g in getters]
+
+def headers_for(columns, unit=None):
+    """Column headers, annotated with the target unit for converted columns."""
+    headers = []
+    for key in columns:
+        header = COLUMNS[key]
+        if unit and key in VALUE_COLUMNS:
+            header = u"{0} ({1})".format(header, unit)
+        headers.append(header)
+    return headers
+
+# ---------------------------------------------------------------------------------
+# WRITERS
+# ---------------------------------------------------------------------------------
+
+def _csv_cell(value):
+    value = _text(value)
+    if any(c in value for c in u',"\r\n'):
+        return u'"' + value.replace(u'"', u'""') + u'"'
+    return value
+
+class _ChunkedFile(object):
+    """Collects encoded rows and writes them to disk every CHUNK_ROWS rows."""
+    def __init__(self, f):
+        self.f = f
+        self.buf = []
+        self.sep = u"".encode("utf-8")
+
+    def add(self, line):
+        # The single encoding step for a whole row
+        self.buf.append(line.encode("utf-8"))
+        if len(self.buf) >= CHUNK_ROWS:
+            self.flush()
+
+    def flush(self):
+        if self.buf:
+            self.f.write(self.sep.join(self.buf))
+            self.buf = []
+
+def _write_csv(f, headers, rows):
+    out = _ChunkedFile(f)
+    out.add(u",".join(_csv_cell(h) for h in headers) + u"\r\n")
+    for row in rows:
+        out.add(u",".join(_csv_cell(v) for v in row) + u"\r\n")
+    out.flush()
+
+def _write_jsonl(f, headers, rows):
+    out = _ChunkedFile(f)
+    for row in rows:
+        out.add(_text(json.dumps(OrderedDict(zip(headers, row)), ensure_ascii=False)) + u"\n")
+    out.flush()
+
+def _xlsx_cell(value):
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return u"<c><v>{0!r}</v></c>".format(value)
+    return u'<c t="inlineStr"><is><t xml:space="preserve">{0}</t></is></c>'.format(escape(_text(value)))
+
+_XLSX_PARTS = [
+    ("[Content_Types].xml",
+     '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+     '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+     '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+     '<Default Extension="xml" ContentType="application/xml"/>'
+     '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+     '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+     '</Types>'),
+    ("_rels/.rels",
+     '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+     '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+     '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+     '</Relationships>'),
+    ("xl/workbook.xml",
+     '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+     '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+     'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+     '<sheets><sheet name="History" sheetId="1" r:id="rId1"/></sheets></workbook>'),
+    ("xl/_rels/workbook.xml.rels",
+     '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+     '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+     '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>'
+     '</Relationships>'),
+]
+
+def _write_xlsx(dest_file, headers, rows):
+    """
+    Stream the sheet XML to a temporary file, then zip it with the static parts.
+    The sheet uses inline strings, so no shared-string table has to be kept in memory.
+    """
+    tmp_dir = tempfile.mkdtemp(prefix="ludarp_xlsx_")
+    try:
+        sheet_path = os.path.join(tmp_dir, "sheet1.xml")
+        with open(sheet_path, "wb") as f:
+            out = _ChunkedFile(f)
+            out.add(u'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                    u'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>')
+            out.add(u"<row>" + u"".join(_xlsx_cell(h) for h in headers) + u"</row>")
+            for row in rows:
+                out.add(u"<row>" + u"".join(_xlsx_cell(v) for v in row) + u"</row>")
+            out.add(u"</sheetData></worksheet>")
+            out.flush()
+
+        with zipfile.ZipFile(dest_file, "w", zipfile.ZIP_DEFLATED) as zf:
+            for name, content in _XLSX_PARTS:
+                zf.writestr(name, content)
+            zf.write(sheet_path, "xl/worksheets/sheet1.xml")
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+# ---------------------------------------------------------------------------------
+# EXPORT PIPELINE
+# ---------------------------------------------------------------------------------
+
+def export_history(dest_file, fmt="csv", columns=None, unit=None, entries=None):
+    """
+    Stream history entries straight to disk.
+
+    Args:
+        dest_file (str): Output path.
+        fmt (str): One of FORMATS ("csv", "jsonl", "xlsx").
+        columns (list[str]): Column keys to export (default: all of COLUMNS).
+        unit (str): Optional EXPORT_UNITS key; lengths are converted from the
+            raw logged values during the stream.
+        entries (iterable): Entry source (default: iter_history()).
+
+    Returns:
+        int: Number of exported rows.
+    """
+    if fmt not in FORMATS:
+        raise ValueError("Unknown export format: {}".format(fmt))
+    columns = [c for c in (columns or COLUMNS.keys()) if c in COLUMNS]
+    if entries is None:
+        entries = iter_history()
+
+    headers = headers_for(columns, unit)
+    build_row = _row_builder(columns, unit)
+    counter = [0]
+
+    def rows():
+        for entry in entries:
+            counter[0] += 1
+            yield build_row(entry)
+
+    if fmt == "xlsx":
+        _write_xlsx(dest_file, headers, rows())
+    else:
+        with open(dest_file, "wb") as f:
+            if fmt == "csv":
+                _write_csv(f, headers, rows())
+            else:
+                _write_jsonl(f, headers, rows())
+    return counter[0]
@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+"""
+📊 LUDARP Library: Live Calculation History Window
+Author: PRADUL P
+
+The Calc History window, kept open next to the Calculator. The list is an
+ObservableCollection filled once from the log; after that a UI-thread timer
+asks the log (ludarp.history.HistoryTail) whether it has changed, one stat
+call per tick, and inserts only the newly appended calculations at the top.
+Keeping the window open costs nothing while nobody calculates, and a long
+history is never parsed twice.
+
+The window is modeless and kept for the Revit session (the button runs in a
+persistent engine); pressing the button again brings it back. It never calls
+the Revit API, so it needs no external event.
+"""
+import os
+from System import TimeSpan
+from System.Collections.ObjectModel import ObservableCollection
+from System.Windows.Threading import DispatcherTimer
+from pyrevit import forms, script
+from ludarp.history import HISTORY_FILE, LEGACY_HISTORY_FILE, HistoryTail, op_display
+from ludarp import metrics
+
+XAML_PATH = os.path.join(os.path.dirname(__file__), "historywindow.xaml")
+
+# Seconds between checks of the log for new calculations
+POLL_SECONDS = 1.0
+
+# Export format choices shown in the export dialog
+EXPORT_FORMATS = {
+    "📄 CSV (.csv)": "csv",
+    "🧾 JSON Lines (.jsonl)": "jsonl",
+    "📊 Excel Workbook (.xlsx)": "xlsx",
+}
+
+_WINDOW = None
+
+class HistoryRecord(object):
+    def __init__(self, entry):
+        self.timestamp = entry.get("timestamp", "")
+        self.element_a = entry.get("element_a", "")
+        self.value_a = entry.get("value_a", "")
+        self.element_b = entry.get("element_b", "")
+        self.value_b = entry.get("value_b", "")
+
+        self.element_a_disp = "{0} ({1})".format(self.element_a, self.value_a)
+        self.element_b_disp = "{0} ({1})".format(self.element_b, self.value_b)
+
+        self.op_disp = op_display(entry.get("operation", ""))
+        self.result = entry.get("result", "")
+
+class HistoryWindow(forms.WPFWindow):
+    def __init__(self):
+        forms.WPFWindow.__init__(self, XAML_PATH)
+
+        # Latest calculations first; new ones are inserted in place
+        self.tail = HistoryTail()
+        self.records = ObservableCollection[object]()
+        self.HistoryList.ItemsSource = self.records
+
+        self.timer = DispatcherTimer()
+        self.timer.Interval = TimeSpan.FromSeconds(POLL_SECONDS)
+        self.timer.Tick += self.poll
+        self.timer.Start()
+        self.load_history()
+
+        # Bind event handlers
+        self.CopyBtn.Click += self.copy_result
+        self.ExportBtn.Click += self.export_log
+        self.ClearBtn.Click += self.clear_history
+        self.CloseBtn.Click += self.close_window
+        self.Closed += self.closed
+
+    # ---- Log ----
+    def load_history(self):
+        """Read what the log gained since the last look (all of it the first time)."""
+        try:
+            with metrics.phase("collect"):
+                entries, reset = self.tail.read()
+        except Exception as e:
+            self.timer.Stop()
+            forms.alert("Error loading history:\n{}".format(e))
+            return
+        if reset:
+            # Whole log: one new collection instead of a notification per row
+            self.records = ObservableCollection[object]([HistoryRecord(entry) for entry in reversed(entries)])
+            self.HistoryList.ItemsSource = self.records
+        else:
+            for entry in entries:
+                self.records.Insert(0, HistoryRecord(entry))
+        self.update_status()
+
+    def poll(self, sender, e):
+        if self.tail.changed():
+            self.load_history()
+
+    def update_status(self):
+        self.StatusText.Text = "{} calculation(s), updated live".format(self.records.Count)
+
+    # ---- Events ----
+    def copy_result(self, sender, e):
+        selected = self.HistoryList.SelectedItem
+        if selected:
+            script.clipboard_copy(selected.result)
+            forms.toast("Copied result: {}".format(selected.result))
+        else:
+            forms.alert("Please select a calculation from the list first.")
+
+    def export_log(self, sender, e):
+        if not self.records.Count:
+            forms.alert("No history to export.")
+            return
+        # The export pipeline (zip, XML, unit engine) loads on first use only
+        from ludarp.historyexport import COLUMNS, EXPORT_UNITS, export_history
+
+        # Output format
+        fmt_choice = forms.CommandSwitchWindow.show(
+            sorted(EXPORT_FORMATS.keys()),
+            message="📤 Export history as:"
+        )
+        if not fmt_choice:
+            return
+        fmt = EXPORT_FORMATS[fmt_choice]
+
+        # Optional column selection (nothing picked = all columns)
+        labels = {v: k for k, v in COLUMNS.items()}
+        picked = forms.SelectFromList.show(
+            list(COLUMNS.values()),
+            title="Columns to Export (leave empty for all)",
+            multiselect=True
+        )
+        columns = [labels[p] for p in picked] if picked else list(COLUMNS.keys())
+        columns = [c for c in COLUMNS if c in columns]
+
+        # Optional unit conversion of values and results
+        unit_options = {"As Logged": None}
+        for key, label in EXPORT_UNITS.items():
+            unit_options["{} ({})".format(label, key)] = key
+        unit_choice = forms.CommandSwitchWindow.show(
+            sorted(unit_options.keys()),
+            message="🎯 Units for exported values:"
+        )
+        if not unit_choice:
+            return
+
+        dest_file = forms.save_file(
+            file_ext=fmt,
+            default_name="LUDARP_Calculation_History.{}".format(fmt)
+        )
+        if not dest_file:
+            return
+
+        try:
+            with metrics.phase("apply"):
+                count = export_history(dest_file, fmt, columns, unit_options[unit_choice])
+            metrics.note("exported_rows", count)
+            forms.toast("Exported {} calculation(s) to {}!".format(count, fmt.upper()))
+        except Exception as ex:
+            forms.alert("Error exporting history:\n{}".format(ex))
+
+    def clear_history(self, sender, e):
+        if not self.records.Count:
+            forms.alert("History is already empty.")
+            return
+
+        confirm = forms.alert(
+            "Are you sure you want to clear all calculation history?",
+            yes=True, no=True,
+            title="Clear History"
+        )
+        if confirm:
+            try:
+                for path in (HISTORY_FILE, LEGACY_HISTORY_FILE):
+                    if os.path.exists(path):
+                        os.remove(path)
+                self.tail.reset()
+                self.load_history()
+                forms.toast("History cleared!")
+            except Exception as ex:
+                forms.alert("Error clearing history:\n{}".format(ex))
+
+    def close_window(self, sender, e):
+        self.Close()
+
+    def closed(self, sender, e):
+        global _WINDOW
+        self.timer.Stop()
+        _WINDOW = None
+
+def show_history_window():
+    """The session's history window (created, or brought to the front and refreshed)."""
+    global _WINDOW
+    if _WINDOW is None:
+        _WINDOW = HistoryWindow()
+        _WINDOW.show()
+    else:
+        _WINDOW.load_history()
+        _WINDOW.Activate()
+    return _WINDOW
@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+"""
+⏳ LUDARP Library: Time-Sliced Job Queue
+Author: PRADUL P
+
+Runs long filter jobs in small slices so Revit stays responsive. A job is a
+generator: each next() does one small step of work (one target view, or a
+few dozen override writes) and the queue runs steps until the slice's time
+budget is spent:
+
+    queue = JobQueue(budget=0.05)
+    queue.add(Job("Weekly plan sync", steps, total=len(targets)))
+    while queue.run_slice():
+        pass                    # Revit processes UI messages between slices
+
+Jobs run one after another in the order they were added. The queue can be
+paused and resumed, and queued or running jobs can be cancelled between
+slices. A job's begin_slice / end_slice / abort_slice hooks wrap every slice
+(ProfileJob in ludarp.profiles opens and commits one transaction per slice);
+a step that raises aborts its slice, fails its job and the queue moves on.
+
+Pump connects a queue to an event loop: request() asks the loop for one
+callback (ExternalEvent.Raise in Revit), and tick() is that callback. Pure
+Python (no Revit imports), so the scheduling runs under a fake event loop
+and clock as well (see dev/job_queue_check.py).
+"""
+import time
+
+# Seconds of work per slice: short enough that Revit never feels frozen
+DEFAULT_BUDGET = 0.05
+
+QUEUED, RUNNING, DONE, CANCELLED, FAILED = "queued", "running", "done", "cancelled", "failed"
+FINISHED = (DONE, CANCELLED, FAILED)
+
+# ---------------------------------------------------------------------------------
+# JOBS
+# ---------------------------------------------------------------------------------
+
+class Job(object):
+    """
+    One queued job.
+
+    Args:
+        name (str): Shown in the job window.
+        steps (callable): Returns the step generator (called when the job starts).
+        total (int): Number of steps, for progress (None when unknown).
+    """
+    def __init__(self, name, steps, total=None):
+        self.name = name
+        self.steps = steps
+        self.total = total
+        self.done = 0
+        self.slices = 0
+        self.seconds = 0.0
+        self.status = QUEUED
+        self.message = ""
+        self._iter = None
+
+    @property
+    def finished(self):
+        return self.status in FINISHED
+
+    @property
+    def progress(self):
+        """Fraction done (0.0 - 1.0), or None while the total is unknown."""
+        if self.status == DONE:
+            return 1.0
+        if not self.total:
+            return None
+        return min(float(self.done) / self.total, 1.0)
+
+    # ---- Slice hooks (no-ops here) ----
+    def begin_slice(self):
+        pass
+
+    def end_slice(self):
+        pass
+
+    def abort_slice(self):
+        pass
+
+    def close(self):
+        """Called once when the job finishes, whatever the outcome."""
+        self._iter = None
+
+class JobQueue(object):
+    """Ordered jobs run slice by slice; see the module docstring."""
+    def __init__(self, budget=DEFAULT_BUDGET, clock=time.time):
+        self.budget = budget
+        self.clock = clock
+        self.jobs = []
+        self.paused = False
+        self.listeners = []
+
+    def _changed(self):
+        for listener in list(self.listeners):
+            listener(self)
+
+    # ---- Queue ----
+    def add(self, job):
+        self.jobs.append(job)
+        self._changed()
+        return job
+
+    def current(self):
+        """The job the next slice works on (None when everything is finished)."""
+        for job in self.jobs:
+            if not job.finished:
+                return job
+        return None
+
+    def has_work(self):
+        return not self.paused and self.current() is not None
+
+    def clear_finished(self):
+        self.jobs = [job for job in self.jobs if not job.finished]
+        self._changed()
+
+    # ---- Control ----
+    def pause(self):
+        self.paused = True
+        self._changed()
+
+    def resume(self):
+        self.paused = False
+        self._changed()
+
+    def cancel(self, job=None):
+        """Cancel one job, or every unfinished job. Slices already committed stay."""
+        for j in ([job] if job is not None else self.jobs):
+            if not j.finished:
+                j.status = CANCELLED
+                j.message = "Cancelled after {} of {} step(s)".format(j.done, j.total or "?")
+                j.close()
+        self._changed()
+
+    # ---- Running ----
+    def run_slice(self):
+        """
+        Run steps of the current job until the time budget is spent (always at
+        least one step).
+
+        Returns:
+            bool: True while there is more work to run (and the queue is not paused).
+        """
+        job = self.current()
+        if job is None or self.paused:
+            return False
+        start = self.clock()
+        if job._iter is None:
+            job.status = RUNNING
+            job._iter = iter(job.steps())
+        complete = False
+        try:
+            job.begin_slice()
+            while True:
+                try:
+                    next(job._iter)
+                except StopIteration:
+                    complete = True
+                    break
+                job.done += 1
+                if self.clock() - start >= self.budget:
+                    break
+            job.end_slice()
+        except Exception as ex:
+            job.abort_slice()
+            job.status = FAILED
+            job.message = str(ex) or type(ex).__name__
+            complete = True
+        job.slices += 1
+        job.seconds += self.clock() - start
+        if complete:
+            if job.status == RUNNING:
+                job.status = DONE
+            job.close()
+        self._changed()
+        return self.has_work()
+
+    def run_all(self):
+        """Run every job to the end in this call (no event loop)."""
+        while self.run_slice():
+            pass
+
+# ---------------------------------------------------------------------------------
+# EVENT LOOP DRIVER
+# ---------------------------------------------------------------------------------
+
+class Pump(object):
+    """
+    Drives a queue from an event loop, one slice per callback.
+
+    Args:
+        queue (JobQueue): The jobs to run.
+        request (callable): Asks the loop to call tick() once, soon (ExternalEvent.Raise).
+    """
+    def __init__(self, queue, request):
+        self.queue = queue
+        self.request = request
+        self.pending = False
+        queue.listeners.append(self._queue_changed)
+
+    def _queue_changed(self, queue):
+        self.kick()
+
+    def kick(self):
+        """Request a callback when there is work and none is requested yet."""
+        if self.pending or not self.queue.has_work():
+            return
+        self.pending = True
+        self.request()
+
+    def tick(self):
+        """The loop's callback: run one slice, then request the next one."""
+        self.pending = False
+        self.queue.run_slice()
+        self.kick()
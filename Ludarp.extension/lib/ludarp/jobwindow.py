@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""
+⏳ LUDARP Library: Modeless Job Queue Window
+Author: PRADUL P
+
+The Revit side of ludarp.jobs. Saved sync profiles are queued as jobs in a
+modeless window and run in time-sliced batches through an ExternalEvent:
+each slice is one short transaction made in a valid API context, and the
+event is raised again after every slice, so Revit handles its own UI between
+slices and stays responsive while the window shows progress.
+
+A profile job plans itself in its first slice (selectors are resolved against
+the model as it is when the job starts), snapshots the pairs it touches
+(Restore Snapshot puts the whole job back), then writes one target view or
+one batch of override writes per step. A transaction group cannot outlive an
+API callback, so a job is one undo step per slice, not one overall.
+
+The window is kept for the Revit session (the button runs in a persistent
+engine); pressing the button again brings it back and queues more profiles.
+"""
+import os
+from Autodesk.Revit.UI import IExternalEventHandler, ExternalEvent
+from pyrevit import forms
+from ludarp import jobs, profiles
+
+XAML_PATH = os.path.join(os.path.dirname(__file__), "jobwindow.xaml")
+
+BUDGETS = [("⚡ 25 ms slices (smoothest)", 0.025), ("⏱️ 50 ms slices", 0.05),
+           ("🏃 200 ms slices (fastest)", 0.2)]
+
+STATUS_LABELS = {
+    jobs.QUEUED: "⏳ Queued", jobs.RUNNING: "▶️ Running", jobs.DONE: "✅ Done",
+    jobs.CANCELLED: "⏹️ Cancelled", jobs.FAILED: "❌ Failed",
+}
+
+_WINDOW = None
+
+# ---------------------------------------------------------------------------------
+# EXTERNAL EVENT
+# ---------------------------------------------------------------------------------
+
+class SliceHandler(IExternalEventHandler):
+    """Runs one slice of the queue each time the external event is raised."""
+    def __init__(self):
+        self.pump = None
+
+    def Execute(self, uiapp):
+        if self.pump is not None:
+            self.pump.tick()
+
+    def GetName(self):
+        return "LUDARP Job Queue"
+
+# ---------------------------------------------------------------------------------
+# WINDOW
+# ---------------------------------------------------------------------------------
+
+class JobRow(object):
+    """List row of one job."""
+    def __init__(self, job):
+        self.job = job
+        self.name = job.name
+        self.status = STATUS_LABELS.get(job.status, job.status)
+        progress = job.progress
+        self.percent = 100.0 * progress if progress is not None else 0.0
+        self.steps = "{} / {}".format(job.done, job.total or "?")
+        self.seconds = "{:.1f}".format(job.seconds)
+        self.message = job.message
+
+class JobWindow(forms.WPFWindow):
+    def __init__(self, uiapp):
+        forms.WPFWindow.__init__(self, XAML_PATH)
+        self.uiapp = uiapp
+        self.queue = jobs.JobQueue()
+        self.handler = SliceHandler()
+        self.event = ExternalEvent.Create(self.handler)
+        self.handler.pump = jobs.Pump(self.queue, self.event.Raise)
+        self.queue.listeners.append(self.refresh)
+
+        self.BudgetBox.ItemsSource = [label for label, _seconds in BUDGETS]
+        self.BudgetBox.SelectedIndex = 1
+        self.BudgetBox.SelectionChanged += self.budget_changed
+
+        self.AddBtn.Click += self.add_clicked
+        self.PauseBtn.Click += self.pause_clicked
+        self.CancelBtn.Click += self.cancel_clicked
+        self.CancelAllBtn.Click += self.cancel_all_clicked
+        self.ClearBtn.Click += self.clear_clicked
+        self.CloseBtn.Click += self.close_clicked
+        self.Closed += self.closed
+        self.refresh(self.queue)
+
+    # ---- Queue ----
+    def add_profiles(self, doc, chosen, snapshot=True):
+        for profile in chosen:
+            self.queue.add(profiles.ProfileJob(doc, profile, snapshot))
+
+    def pick_and_add(self):
+        doc = self.uiapp.ActiveUIDocument.Document
+        saved = profiles.ProfileStore(doc).load()
+        if not saved:
+            forms.alert("No sync profiles saved in this project.\n"
+                        "Create them with Sync Profiles first.", title="LUDARP: Job Queue")
+            return
+        labels = ["{}  [{}]".format(p.get("name", "?"), profiles.OPERATIONS.get(p.get("operation"), "?"))
+                  for p in saved]
+        picked = forms.SelectFromList.show(labels, title="Queue Profiles: " + doc.Title, multiselect=True)
+        if picked:
+            self.add_profiles(doc, [saved[labels.index(label)] for label in picked])
+
+    def refresh(self, queue):
+        selected = self.JobList.SelectedIndex
+        self.JobList.ItemsSource = [JobRow(job) for job in queue.jobs]
+        self.JobList.SelectedIndex = selected
+        self.PauseBtn.Content = "▶️ Resume" if queue.paused else "⏸️ Pause"
+        left = len([job for job in queue.jobs if not job.finished])
+        if queue.paused:
+            self.StatusText.Text = "Paused: {} job(s) waiting".format(left)
+        elif left:
+            self.StatusText.Text = "Running: {} job(s) left".format(left)
+        else:
+            self.StatusText.Text = "Idle: add profiles to run them in the background"
+
+    # ---- Events ----
+    def budget_changed(self, sender, e):
+        self.queue.budget = BUDGETS[self.BudgetBox.SelectedIndex][1]
+
+    def add_clicked(self, sender, e):
+        self.pick_and_add()
+
+    def pause_clicked(self, sender, e):
+        if self.queue.paused:
+            self.queue.resume()
+        else:
+            self.queue.pause()
+
+    def cancel_clicked(self, sender, e):
+        row = self.JobList.SelectedItem
+        if row is not None:
+            self.queue.cancel(row.job)
+
+    def cancel_all_clicked(self, sender, e):
+        self.queue.cancel()
+
+    def clear_clicked(self, sender, e):
+        self.queue.clear_finished()
+
+    def close_clicked(self, sender, e):
+        self.Close()
+
+    def closed(self, sender, e):
+        global _WINDOW
+        # Nothing runs without a visible window
+        self.queue.listeners.remove(self.refresh)
+        self.queue.cancel()
+        self.handler.pump = None
+        self.event.Dispose()
+        _WINDOW = None
+
+def show_job_window(uiapp):
+    """The session's job window (created, or brought to the front)."""
+    global _WINDOW
+    if _WINDOW is None:
+        _WINDOW = JobWindow(uiapp)
+        _WINDOW.show()
+    else:
+        _WINDOW.Activate()
+    return _WINDOW
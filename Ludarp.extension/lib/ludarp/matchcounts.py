@@ -0,0 +1,260 @@
+# -*- coding: utf-8 -*-
+"""
+🔢 LUDARP Library: Filter Match Counts
+Author: PRADUL P
+
+How many elements each filter actually hits in a view. A count runs one
+view-scoped collector: the filter's categories are applied first as a quick
+ElementMulticategoryFilter, then the filter's own element filter (the slow
+parameter rules) narrows what is left, and GetElementCount() counts without
+materializing any element.
+
+Counts are cached per (document, filter, view) for the Revit session. With
+pyRevit the cache lives in the pyRevit environment store, so it survives
+between button runs; the doc-changed hook (hooks/doc-changed.py) calls
+on_document_changed() to drop the counts a change can affect:
+
+    added / modified element of a filter's categories -> that filter's counts
+    modified filter or view                           -> its counts
+    modified view template                            -> the counts of its views
+    any deleted element, or a very large change       -> all counts of the document
+
+View templates hold no elements; their filters are counted over the views
+that use the template (see counts_for_view). A view-scoped collector only
+sees what the view shows, so a filter whose visibility is off in a view is
+counted over the whole model instead and reported as hidden, not as
+matching nothing.
+"""
+from Autodesk.Revit.DB import FilteredElementCollector, ElementMulticategoryFilter
+from ludarp import metrics
+from ludarp.compat import FILTER_VISIBILITY, get_filter_visibility
+from ludarp.docs import document_key
+from ludarp.ogsstate import id_value
+
+# Counts at or above this slow down regeneration noticeably when styled
+HEAVY_COUNT = 20000
+
+# Changes touching more elements than this clear the document's counts
+MAX_CHANGED_IDS = 2000
+
+REGISTRY_VAR = "LUDARP_MATCH_COUNTS"
+_LOCAL_REGISTRY = {}
+
+# Category key of filters without categories (selection filters): any change drops them
+ANY_CATEGORY = "*"
+
+# View key of counts taken over the whole model (filters hidden in the view)
+MODEL_SCOPE = 0
+
+# ---------------------------------------------------------------------------------
+# CACHE
+# ---------------------------------------------------------------------------------
+
+def _registry():
+    """Document key -> cache state; shared across button runs when pyRevit is loaded."""
+    try:
+        from pyrevit.coreutils import envvars
+    except ImportError:
+        return _LOCAL_REGISTRY
+    registry = envvars.get_pyrevit_env_var(REGISTRY_VAR)
+    if registry is None:
+        registry = {}
+        envvars.set_pyrevit_env_var(REGISTRY_VAR, registry)
+    return registry
+
+class MatchCountCache(object):
+    """
+    Counts of one document. The state is plain dicts, so it can be kept in the
+    pyRevit store and outlive this module between runs.
+    """
+    def __init__(self, state=None):
+        self.state = state if state is not None else {}
+        self.counts = self.state.setdefault("counts", {})            # (filter, view) -> count
+        self.categories = self.state.setdefault("categories", {})    # filter -> category keys
+        self.by_category = self.state.setdefault("by_category", {})  # category key -> filters
+        self.by_view = self.state.setdefault("by_view", {})          # view -> filters
+
+    def __len__(self):
+        return len(self.counts)
+
+    def get(self, fid, vid):
+        return self.counts.get((fid, vid))
+
+    def put(self, fid, vid, count, categories):
+        self.counts[(fid, vid)] = count
+        self.by_view.setdefault(vid, set()).add(fid)
+        if fid not in self.categories:
+            self.categories[fid] = categories
+            for category in categories:
+                self.by_category.setdefault(category, set()).add(fid)
+
+    def drop_filter(self, fid):
+        for category in self.categories.pop(fid, ()):
+            self.by_category.get(category, set()).discard(fid)
+        for vid, fids in self.by_view.items():
+            if fid in fids:
+                fids.discard(fid)
+                self.counts.pop((fid, vid), None)
+
+    def drop_view(self, vid):
+        for fid in self.by_view.pop(vid, ()):
+            self.counts.pop((fid, vid), None)
+
+    def clear(self):
+        for part in (self.counts, self.categories, self.by_category, self.by_view):
+            part.clear()
+
+    def invalidate(self, category_ids, element_ids):
+        """Drop the counts affected by changes to elements of these categories / ids."""
+        for eid in element_ids:
+            if eid in self.categories:
+                self.drop_filter(eid)
+            if eid in self.by_view:
+                self.drop_view(eid)
+        affected = set(self.by_category.get(ANY_CATEGORY, ())) if element_ids else set()
+        for category in category_ids:
+            affected.update(self.by_category.get(category, ()))
+        for fid in affected:
+            self.drop_filter(fid)
+
+def get_cache(doc):
+    registry = _registry()
+    key = document_key(doc)
+    state = registry.get(key)
+    if state is None:
+        state = registry[key] = {}
+    return MatchCountCache(state)
+
+def forget(doc):
+    """Drop every cached count of a document."""
+    _registry().pop(document_key(doc), None)
+
+def on_document_changed(doc, added_ids, deleted_ids, modified_ids):
+    """DocumentChanged handler: drop the counts the change can affect (cheap when none are cached)."""
+    state = _registry().get(document_key(doc))
+    if not state or not state.get("counts"):
+        return
+    cache = MatchCountCache(state)
+    if list(deleted_ids):
+        cache.clear()
+        return
+    changed = list(added_ids) + list(modified_ids)
+    if len(changed) > MAX_CHANGED_IDS:
+        cache.clear()
+        return
+    categories = set()
+    element_ids = set()
+    for eid in changed:
+        element_ids.add(id_value(eid))
+        element = doc.GetElement(eid)
+        if getattr(element, "IsTemplate", False):
+            # Templates hold no counts; the views they govern do
+            from ludarp.views import get_view_index
+            element_ids.update(id_value(v.Id) for v in get_view_index(doc).dependent_views(element))
+        category = getattr(element, "Category", None)
+        if category is not None:
+            categories.add(id_value(category.Id))
+    cache.invalidate(categories, element_ids)
+
+# ---------------------------------------------------------------------------------
+# COUNTING
+# ---------------------------------------------------------------------------------
+
+def is_hidden(view, filter_elem):
+    """True when the filter's visibility is off in the view (False where unknown)."""
+    if not FILTER_VISIBILITY:
+        return False
+    metrics.count("View.GetFilterVisibility")
+    return get_filter_visibility(view, filter_elem.Id) is False
+
+def _collector(doc, view):
+    """Collector over what the view shows, or over the whole model (view None)."""
+    return FilteredElementCollector(doc) if view is None else FilteredElementCollector(doc, view.Id)
+
+def _count(doc, view, filter_elem):
+    """(count, category keys) of one filter in one (non-template) view, or the model (view None)."""
+    if hasattr(filter_elem, "GetElementIds"):
+        # Selection filter: its own elements that the view shows
+        wanted = set(id_value(eid) for eid in filter_elem.GetElementIds())
+        shown = _collector(doc, view).WhereElementIsNotElementType().ToElementIds()
+        return sum(1 for eid in shown if id_value(eid) in wanted), (ANY_CATEGORY,)
+
+    categories = filter_elem.GetCategories()
+    keys = tuple(id_value(c) for c in categories)
+    if not keys:
+        return 0, keys
+    collector = (_collector(doc, view)
+                 .WherePasses(ElementMulticategoryFilter(categories))
+                 .WhereElementIsNotElementType())
+    element_filter = filter_elem.GetElementFilter()
+    if element_filter is not None:
+        collector = collector.WherePasses(element_filter)
+    return collector.GetElementCount(), keys
+
+def count_matches(doc, view, filter_elem, cache=None, hidden=None):
+    """
+    Elements of a (non-template) view matched by a filter, cached. A filter
+    hidden in the view (hidden=None: looked up) is counted over the model.
+
+    Returns:
+        int, or None when the view cannot be scanned (templates, schedules...).
+    """
+    if view.IsTemplate:
+        return None
+    if hidden is None:
+        hidden = is_hidden(view, filter_elem)
+    cache = cache if cache is not None else get_cache(doc)
+    fid, vid = id_value(filter_elem.Id), MODEL_SCOPE if hidden else id_value(view.Id)
+    count = cache.get(fid, vid)
+    if count is not None:
+        metrics.count("MatchCount.cached")
+        return count
+    try:
+        with metrics.phase("collect"):
+            count, keys = _count(doc, None if hidden else view, filter_elem)
+    except Exception:
+        return None
+    metrics.count("FilteredElementCollector")
+    cache.put(fid, vid, count, keys)
+    return count
+
+def counts_for_view(doc, view, filters, cache=None):
+    """
+    Match counts of filters in a view; a template is counted over the views that use it.
+
+    Returns:
+        (dict, set, list): filter id value -> total count (None when nothing
+        could be scanned), the filter id values hidden in every counted view
+        (their total is the model count), and the views that were counted.
+    """
+    from ludarp.views import get_view_index
+    cache = cache if cache is not None else get_cache(doc)
+    views = get_view_index(doc).dependent_views(view) if view.IsTemplate else [view]
+    totals = {}
+    hidden = set()
+    for f in filters:
+        shown = [v for v in views if not is_hidden(v, f)]
+        if views and not shown:
+            # Hidden everywhere it is counted: one model count, not one per view
+            hidden.add(id_value(f.Id))
+            totals[id_value(f.Id)] = count_matches(doc, views[0], f, cache, hidden=True)
+            continue
+        counts = [count_matches(doc, v, f, cache, hidden=False) for v in shown]
+        counts = [c for c in counts if c is not None]
+        totals[id_value(f.Id)] = sum(counts) if counts else None
+    return totals, hidden, views
+
+def describe(count, hidden=False):
+    """
+    Short label for a count: '1,234', '⚠️ 0' (matches nothing), '🐢 25,000'
+    (heavy) or '🙈 1,234 in model' (hidden in the view, counted over the model).
+    """
+    if hidden:
+        return "🙈 hidden" if count is None else "🙈 {:,} in model".format(count)
+    if count is None:
+        return "–"
+    if count == 0:
+        return "⚠️ 0"
+    if count >= HEAVY_COUNT:
+        return "🐢 {:,}".format(count)
+    return "{:,}".format(count)
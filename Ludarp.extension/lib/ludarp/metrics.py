@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+"""
+⏱️ LUDARP Library: Run Metrics
+Author: PRADUL P
+
+Opt-in instrumentation for the LUDARP buttons. When enabled, every button run
+appends one JSON line to %TEMP%/ludarp_metrics.jsonl with the time spent per
+phase (collect, pick, plan, apply, commit) and the Revit API calls made, by
+kind. Pure Python (no Revit imports).
+
+Buttons wrap their main() in a run; library code reports into the active run:
+
+    with metrics.run("Copy Between Views", doc):
+        main()
+
+    with metrics.phase("apply"):
+        ...
+    metrics.count("View.SetFilterOverrides", len(filter_ids))
+
+Phases are exclusive: time spent in a nested phase is not counted again in the
+enclosing one. When metrics are disabled run() and phase() cost one flag check.
+
+Enable with the Metrics button (creates the flag file) or LUDARP_METRICS=1.
+"""
+import os
+import json
+import time
+import tempfile
+from datetime import datetime
+
+temp_dir = tempfile.gettempdir()
+METRICS_FILE = os.path.join(temp_dir, "ludarp_metrics.jsonl")
+FLAG_FILE = os.path.join(temp_dir, "ludarp_metrics.enabled")
+
+PHASES = ("collect", "pick", "plan", "apply", "commit")
+
+# ---------------------------------------------------------------------------------
+# SWITCH
+# ---------------------------------------------------------------------------------
+
+def is_enabled():
+    env = os.environ.get("LUDARP_METRICS")
+    if env is not None:
+        return env not in ("", "0", "false", "off")
+    return os.path.exists(FLAG_FILE)
+
+def set_enabled(enabled):
+    """Persist the switch for later runs (flag file next to the metrics log)."""
+    if enabled:
+        with open(FLAG_FILE, "wb") as f:
+            f.write(b"1")
+    elif os.path.exists(FLAG_FILE):
+        os.remove(FLAG_FILE)
+
+# ---------------------------------------------------------------------------------
+# RECORDING
+# ---------------------------------------------------------------------------------
+
+class _NullContext(object):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+_NULL = _NullContext()
+_ACTIVE = []    # stack of active Run objects (normally zero or one)
+
+class _Phase(object):
+    def __init__(self, run, name):
+        self.run = run
+        self.name = name
+
+    def __enter__(self):
+        self.run._stack.append([self.name, time.time(), 0.0])
+        return self
+
+    def __exit__(self, *exc):
+        name, start, child = self.run._stack.pop()
+        total = time.time() - start
+        phases = self.run.phases
+        phases[name] = phases.get(name, 0.0) + (total - child)
+        if self.run._stack:
+            self.run._stack[-1][2] += total
+        return False
+
+class Run(object):
+    """One instrumented button run; written to the metrics log on exit."""
+    def __init__(self, tool, doc=None, path=METRICS_FILE):
+        self.tool = tool
+        self.model = _model_name(doc)
+        self.path = path
+        self.phases = {}
+        self.calls = {}
+        self.info = {}
+        self._stack = []
+        self._start = None
+
+    def phase(self, name):
+        return _Phase(self, name)
+
+    def count(self, kind, n=1):
+        self.calls[kind] = self.calls.get(kind, 0) + n
+
+    def __enter__(self):
+        self._start = time.time()
+        _ACTIVE.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        total = time.time() - self._start
+        if _ACTIVE and _ACTIVE[-1] is self:
+            _ACTIVE.pop()
+        if exc_type is None:
+            status = "ok"
+        elif issubclass(exc_type, SystemExit):
+            status = "exit"
+        else:
+            status = "error"
+        self.write(total, status)
+        return False
+
+    def record(self, total, status="ok"):
+        timed = sum(self.phases.values())
+        phases = dict((k, round(v * 1000, 2)) for k, v in self.phases.items())
+        phases["other"] = round(max(total - timed, 0.0) * 1000, 2)
+        return {
+            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "tool": self.tool,
+            "model": self.model,
+            "status": status,
+            "total_ms": round(total * 1000, 2),
+            "phases": phases,
+            "calls": self.calls,
+            "info": self.info,
+        }
+
+    def write(self, total, status="ok"):
+        try:
+            line = json.dumps(self.record(total, status)) + "\n"
+            with open(self.path, "ab") as f:
+                f.write(line.encode("utf-8"))
+        except Exception:
+            pass
+
+def _model_name(doc):
+    try:
+        return doc.Title
+    except Exception:
+        return None
+
+def run(tool, doc=None):
+    """Context manager instrumenting one button run (no-op when disabled)."""
+    if not is_enabled():
+        return _NULL
+    return Run(tool, doc)
+
+def current():
+    return _ACTIVE[-1] if _ACTIVE else None
+
+def phase(name):
+    """Time a phase of the active run (no-op without one)."""
+    if not _ACTIVE:
+        return _NULL
+    return _ACTIVE[-1].phase(name)
+
+def count(kind, n=1):
+    """Count n Revit API calls of a kind in the active run."""
+    if _ACTIVE:
+        _ACTIVE[-1].count(kind, n)
+
+def note(key, value):
+    """Attach a value (e.g. number of targets) to the active run's record."""
+    if _ACTIVE:
+        _ACTIVE[-1].info[key] = value
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""
+📊 LUDARP Library: Metrics Report
+Author: PRADUL P
+
+Reads the run log written by ludarp.metrics and aggregates it per tool (and
+model) for the Metrics button. Kept apart from ludarp.metrics so buttons that
+only record runs do not load the reporting code. Pure Python.
+"""
+import io
+import os
+import json
+
+from ludarp.metrics import METRICS_FILE, PHASES
+
+def iter_records(path=METRICS_FILE):
+    if not os.path.exists(path):
+        return
+    with io.open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers (None if empty)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = int(-(-pct * len(ordered) // 100))   # ceil
+    return ordered[max(rank, 1) - 1]
+
+def summarize(records, by_model=False, statuses=("ok",)):
+    """
+    Aggregate runs per tool (and model): run count, p50/p95 of total time and
+    of each phase, and mean API calls per run by kind.
+
+    Returns:
+        list[dict] sorted by tool (and model).
+    """
+    groups = {}
+    for r in records:
+        if statuses and r.get("status") not in statuses:
+            continue
+        key = (r.get("tool"), r.get("model") if by_model else None)
+        groups.setdefault(key, []).append(r)
+
+    rows = []
+    for (tool, model), runs in sorted(groups.items(), key=lambda kv: (kv[0][0] or "", kv[0][1] or "")):
+        totals = [r.get("total_ms", 0.0) for r in runs]
+        row = {
+            "tool": tool, "model": model, "runs": len(runs),
+            "p50_ms": percentile(totals, 50), "p95_ms": percentile(totals, 95),
+            "phases": {}, "calls": {},
+        }
+        for name in PHASES + ("other",):
+            values = [r.get("phases", {}).get(name, 0.0) for r in runs]
+            if any(values):
+                row["phases"][name] = (percentile(values, 50), percentile(values, 95))
+        for r in runs:
+            for kind, n in r.get("calls", {}).items():
+                row["calls"][kind] = row["calls"].get(kind, 0) + n
+        for kind in row["calls"]:
+            row["calls"][kind] = round(row["calls"][kind] / float(len(runs)), 1)
+        rows.append(row)
+    return rows
@@ -0,0 +1,287 @@
+# -*- coding: utf-8 -*-
+"""
+🧬 LUDARP Library: Override State
+Author: PRADUL P
+
+Converts OverrideGraphicSettings to and from plain, hashable tuples so filter
+override states can be stored, compared and diffed without touching Revit.
+
+A state is a tuple aligned with FIELDS; "no override" is always None:
+
+    colors          (r, g, b) or None
+    pattern ids     integer element id or None
+    line weights    pen number or None
+    transparency    0-100 or None (0)
+    halftone        True or None
+    detail level    "Coarse" / "Medium" / "Fine" or None
+
+The fields are the ones Copy Specific Overrides handles. Each field also has a
+short key (KEYS) and a text form (to_text / from_text, with pattern names) used
+by graphics standard files and spreadsheets.
+"""
+from collections import OrderedDict
+from Autodesk.Revit.DB import (
+    OverrideGraphicSettings, Color, ViewDetailLevel,
+    FilteredElementCollector, FillPatternElement, LinePatternElement
+)
+
+# Field name -> kind, in storage order (names are the OverrideGraphicSettings properties)
+FIELDS = OrderedDict([
+    ("ProjectionLineColor", "color"),
+    ("ProjectionLinePatternId", "id"),
+    ("ProjectionLineWeight", "weight"),
+    ("CutLineColor", "color"),
+    ("CutLinePatternId", "id"),
+    ("CutLineWeight", "weight"),
+    ("SurfaceForegroundPatternId", "id"),
+    ("SurfaceForegroundPatternColor", "color"),
+    ("SurfaceBackgroundPatternId", "id"),
+    ("SurfaceBackgroundPatternColor", "color"),
+    ("CutForegroundPatternId", "id"),
+    ("CutForegroundPatternColor", "color"),
+    ("CutBackgroundPatternId", "id"),
+    ("CutBackgroundPatternColor", "color"),
+    ("SurfaceTransparency", "int"),
+    ("Halftone", "bool"),
+    ("DetailLevel", "detail"),
+])
+FIELD_NAMES = list(FIELDS.keys())
+FIELD_INDEX = dict((name, i) for i, name in enumerate(FIELD_NAMES))
+DEFAULT_STATE = (None,) * len(FIELDS)
+
+# Short keys for standard files and spreadsheet columns, aligned with FIELD_NAMES
+KEYS = [
+    "projection_line_color", "projection_line_pattern", "projection_line_weight",
+    "cut_line_color", "cut_line_pattern", "cut_line_weight",
+    "surface_pattern", "surface_color",
+    "surface_background_pattern", "surface_background_color",
+    "cut_pattern", "cut_color",
+    "cut_background_pattern", "cut_background_color",
+    "transparency", "halftone", "detail_level",
+]
+KEY_FIELDS = OrderedDict(zip(KEYS, FIELD_NAMES))
+
+DETAIL_LEVELS = ("Coarse", "Medium", "Fine")
+
+# ---------------------------------------------------------------------------------
+# ELEMENT IDS
+# ---------------------------------------------------------------------------------
+
+# Bound for this Revit version by ludarp.compat (re-exported for the modules using them)
+from ludarp.compat import id_value, make_id, ogs_getter, ogs_setter
+
+# ---------------------------------------------------------------------------------
+# READING
+# ---------------------------------------------------------------------------------
+
+def _read_color(c):
+    if c is None or not c.IsValid:
+        return None
+    return (int(c.Red), int(c.Green), int(c.Blue))
+
+def _read_id(eid):
+    if eid is None:
+        return None
+    # Only InvalidElementId means "no override": the solid line pattern id is negative
+    value = id_value(eid)
+    return value if value != -1 else None
+
+def _read_weight(w):
+    return w if w is not None and w > 0 else None
+
+def _read_int(v):
+    return v if v else None
+
+def _read_bool(v):
+    return True if v else None
+
+def _read_detail(v):
+    name = str(v).split(".")[-1] if v is not None else None
+    return name if name and name != "Undefined" else None
+
+_READERS = {
+    "color": _read_color, "id": _read_id, "weight": _read_weight,
+    "int": _read_int, "bool": _read_bool, "detail": _read_detail,
+}
+_FIELD_READERS = [(ogs_getter(name), _READERS[kind]) for name, kind in FIELDS.items()]
+
+def read_state(ogs):
+    """Hashable state tuple of an OverrideGraphicSettings."""
+    return tuple(read(get(ogs)) for get, read in _FIELD_READERS)
+
+# ---------------------------------------------------------------------------------
+# WRITING
+# ---------------------------------------------------------------------------------
+
+def _write_value(kind, value):
+    if kind == "color":
+        return Color(value[0], value[1], value[2])
+    if kind == "id":
+        return make_id(value)
+    if kind == "detail":
+        return _DETAIL_VALUES[value]
+    return value
+
+_DETAIL_VALUES = dict((name, getattr(ViewDetailLevel, name)) for name in DETAIL_LEVELS)
+_FIELD_WRITERS = [(ogs_setter(name), kind) for name, kind in FIELDS.items()]
+
+def build_ogs(state):
+    """A new OverrideGraphicSettings with exactly the overrides in state."""
+    ogs = OverrideGraphicSettings()
+    for (set_field, kind), value in zip(_FIELD_WRITERS, state):
+        if value is not None:
+            set_field(ogs, _write_value(kind, value))
+    return ogs
+
+def as_dict(state):
+    """Field name -> value for the fields that carry an override."""
+    return OrderedDict((n, v) for n, v in zip(FIELD_NAMES, state) if v is not None)
+
+def from_dict(values):
+    """State tuple from a field name -> value mapping (missing fields: no override)."""
+    return tuple(values.get(name) for name in FIELD_NAMES)
+
+def merge(state, values):
+    """Copy of state with the given field values replaced."""
+    merged = list(state)
+    for name, value in values.items():
+        merged[FIELD_INDEX[name]] = value
+    return tuple(merged)
+
+def load_state(value):
+    """State tuple from its JSON form (JSON turns the color tuples into lists)."""
+    return tuple(tuple(v) if isinstance(v, list) else v for v in value)
+
+# ---------------------------------------------------------------------------------
+# TEXT VALUES (standard files, spreadsheets)
+# ---------------------------------------------------------------------------------
+
+def _is_line_field(name):
+    return name.endswith("LinePatternId")
+
+class PatternNames(object):
+    """
+    Fill and line pattern names <-> element id values of one document.
+
+    Fill patterns whose name exists as both a drafting and a model pattern are
+    named "<name> (Drafting)" / "<name> (Model)"; the solid line pattern, which
+    is not an element, is "Solid".
+    """
+    SOLID_LINE = "Solid"
+
+    def __init__(self, doc):
+        self.fill_names = self._unique_names(
+            (p, self._target(p)) for p in FilteredElementCollector(doc).OfClass(FillPatternElement))
+        self.line_names = dict((id_value(p.Id), p.Name)
+                               for p in FilteredElementCollector(doc).OfClass(LinePatternElement))
+        self.line_names[id_value(LinePatternElement.GetSolidPatternId())] = self.SOLID_LINE
+        self.fill_ids = dict((n.lower(), v) for v, n in self.fill_names.items())
+        self.line_ids = dict((n.lower(), v) for v, n in self.line_names.items())
+        # A plain name still resolves when it is only qualified because of a duplicate
+        for v, n in self.fill_names.items():
+            plain = n.rsplit(" (", 1)[0].lower()
+            self.fill_ids.setdefault(plain, v)
+
+    @staticmethod
+    def _target(pattern):
+        try:
+            return str(pattern.GetFillPattern().Target).split(".")[-1]
+        except Exception:
+            return None
+
+    @staticmethod
+    def _unique_names(patterns):
+        patterns = list(patterns)
+        counts = {}
+        for p, _target in patterns:
+            counts[p.Name] = counts.get(p.Name, 0) + 1
+        names = {}
+        for p, target in patterns:
+            name = p.Name
+            if counts[name] > 1 and target:
+                name = "{} ({})".format(name, target)
+            names[id_value(p.Id)] = name
+        return names
+
+    def name(self, field, value):
+        names = self.line_names if _is_line_field(field) else self.fill_names
+        return names.get(value, "#{}".format(value))
+
+    def id(self, field, name):
+        """Id value of a pattern name ("#123" is taken as a raw id); KeyError if unknown."""
+        if name.startswith("#") and name[1:].isdigit():
+            return int(name[1:])
+        ids = self.line_ids if _is_line_field(field) else self.fill_ids
+        return ids[name.strip().lower()]
+
+def format_color(rgb):
+    return "#{:02X}{:02X}{:02X}".format(*rgb)
+
+def parse_color(value):
+    """(r, g, b) from "#RRGGBB", "r,g,b" or a 3-item list."""
+    if isinstance(value, (list, tuple)):
+        parts = list(value)
+    else:
+        text = value.strip()
+        if text.startswith("#") and len(text) == 7:
+            parts = [int(text[i:i + 2], 16) for i in (1, 3, 5)]
+        else:
+            parts = [p.strip() for p in text.split(",")]
+    rgb = tuple(int(p) for p in parts)
+    if len(rgb) != 3 or not all(0 <= c <= 255 for c in rgb):
+        raise ValueError("not a color: {!r}".format(value))
+    return rgb
+
+def _parse_bool(value):
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in ("1", "true", "yes", "y", "on", "x"):
+        return True
+    if text in ("0", "false", "no", "n", "off", ""):
+        return False
+    raise ValueError("not a yes/no value: {!r}".format(value))
+
+def _parse_int(value, low, high):
+    number = int(value)
+    if not low <= number <= high:
+        raise ValueError("{} is outside {}-{}".format(number, low, high))
+    return number
+
+def to_text(field, value, names):
+    """Text form of a state value ("" for no override)."""
+    if value is None:
+        return ""
+    kind = FIELDS[field]
+    if kind == "color":
+        return format_color(value)
+    if kind == "id":
+        return names.name(field, value)
+    if kind == "bool":
+        return "yes"
+    return str(value)
+
+def from_text(field, value, names):
+    """
+    State value from its text (or JSON) form; "" / None mean no override.
+
+    Raises:
+        ValueError: malformed value; KeyError: unknown pattern name.
+    """
+    if value is None or (not isinstance(value, (bool, int, list)) and str(value).strip() == ""):
+        return None
+    kind = FIELDS[field]
+    if kind == "color":
+        return parse_color(value)
+    if kind == "id":
+        return names.id(field, str(value))
+    if kind == "weight":
+        return _parse_int(value, 1, 16)
+    if kind == "int":
+        return _parse_int(value, 0, 100) or None
+    if kind == "bool":
+        return True if _parse_bool(value) else None
+    detail = str(value).strip().capitalize()
+    if detail not in DETAIL_LEVELS:
+        raise ValueError("detail level must be one of {}".format(", ".join(DETAIL_LEVELS)))
+    return detail
@@ -0,0 +1,338 @@
+# -*- coding: utf-8 -*-
+"""
+🎨 LUDARP Library: Filter Override Operations
+Author: PRADUL P
+
+The write side of the FilterOverride tools: synchronizing filters between
+views, copying selected override properties between filters, recoloring,
+resetting and duplicating filters. Each operation runs in one transaction
+and reports its plan/apply/commit phases and API calls to ludarp.metrics.
+Calls are counted where they are made (also by the helpers the Job Queue
+runs step by step), and only when they are made.
+"""
+from Autodesk.Revit.DB import Transaction, OverrideGraphicSettings, ParameterFilterElement
+from ludarp import metrics
+from ludarp.compat import (
+    FILTER_VISIBILITY, get_filter_visibility, set_filter_visibility, ogs_getter, ogs_setter
+)
+
+# Property groups offered by Copy Specific Overrides
+COPY_PARTS = [
+    "Projection Lines", "Projection Fills",
+    "Cut Lines", "Cut Fills",
+    "Transparency", "Halftone",
+    "Detail Level", "Copy ALL"
+]
+
+# Fields copied by each property group of Copy Specific Overrides; fills are
+# split into their foreground / background layers
+_PART_FIELDS = [
+    ("Projection Lines", None, ["ProjectionLineColor", "ProjectionLinePatternId", "ProjectionLineWeight"]),
+    ("Cut Lines", None, ["CutLineColor", "CutLinePatternId", "CutLineWeight"]),
+    ("Projection Fills", "fg", ["SurfaceForegroundPatternId", "SurfaceForegroundPatternColor"]),
+    ("Projection Fills", "bg", ["SurfaceBackgroundPatternId", "SurfaceBackgroundPatternColor"]),
+    ("Cut Fills", "fg", ["CutForegroundPatternId", "CutForegroundPatternColor"]),
+    ("Cut Fills", "bg", ["CutBackgroundPatternId", "CutBackgroundPatternColor"]),
+    ("Transparency", None, ["SurfaceTransparency"]),
+    ("Halftone", None, ["Halftone"]),
+    ("Detail Level", None, ["DetailLevel"]),
+]
+
+# Field -> (getter, setter), bound once for this Revit version (see ludarp.compat)
+_ACCESSORS = dict((name, (ogs_getter(name), ogs_setter(name)))
+                  for _part, _layer, fields in _PART_FIELDS for name in fields)
+
+# ---------------------------------------------------------------------------------
+# COPY BETWEEN VIEWS
+# ---------------------------------------------------------------------------------
+
+def read_source(source_view, filter_ids):
+    """(filter id, overrides, visibility or None) of each filter in the source view."""
+    rows = []
+    reads = 0
+    try:
+        for fid in filter_ids:
+            reads += 1
+            ogs = source_view.GetFilterOverrides(fid)
+            # None where the Revit version or view type has no filter visibility
+            rows.append((fid, ogs, get_filter_visibility(source_view, fid)))
+    finally:
+        metrics.count("View.GetFilterOverrides", reads)
+        if FILTER_VISIBILITY:
+            metrics.count("View.GetFilterVisibility", len(rows))
+    return rows
+
+def copy_into_view(target_view, source):
+    """
+    Write read_source() rows into one target view (inside an open transaction).
+
+    Returns:
+        int: Number of filters that had to be added to the view.
+    """
+    added = written = shown = 0
+    # Read the target's applied filters once (GetFilters builds a new collection per call)
+    metrics.count("View.GetFilters")
+    applied = set(target_view.GetFilters())
+    try:
+        for fid, overrides, vis_state in source:
+            # 🟢 Check if the filter exists in the target view; if not, add it.
+            if fid not in applied:
+                added += 1
+                target_view.AddFilter(fid)
+
+            # 🎨 Copy Overrides (Colors, Lines, Fills, Transparency)
+            written += 1
+            target_view.SetFilterOverrides(fid, overrides)
+
+            # 👁️ Synchronize Visibility State (On/Off)
+            if vis_state is not None:
+                shown += 1
+                try:
+                    set_filter_visibility(target_view, fid, vis_state)
+                except Exception:
+                    pass
+    finally:
+        metrics.count("View.AddFilter", added)
+        metrics.count("View.SetFilterOverrides", written)
+        metrics.count("View.SetFilterVisibility", shown)
+    return added
+
+def copy_filters_between_views(doc, source_view, target_views, filter_ids):
+    """
+    Core function to transfer filters and their overrides.
+
+    Args:
+        doc (DB.Document): The document to modify.
+        source_view (DB.View): The view/template to copy graphics FROM.
+        target_views (list[DB.View]): The views/templates to copy graphics TO.
+        filter_ids (list[DB.ElementId]): The specific filters to be synchronized.
+    """
+    # 📖 Read the source overrides and visibility once per filter, not once per target
+    with metrics.phase("plan"):
+        source = read_source(source_view, filter_ids)
+
+    # Start a transaction to modify the database (rolled back if anything fails)
+    t = Transaction(doc, "LUDARP: Copy Filters Between Views")
+    t.Start()
+    try:
+        with metrics.phase("apply"):
+            for target_view in target_views:
+                copy_into_view(target_view, source)
+
+        with metrics.phase("commit"):
+            t.Commit()
+        metrics.count("Transaction.Commit")
+    except Exception:
+        t.RollBack()
+        metrics.count("Transaction.RollBack")
+        raise
+
+    metrics.note("targets", len(target_views))
+    metrics.note("filters", len(source))
+
+# ---------------------------------------------------------------------------------
+# COPY SPECIFIC OVERRIDES
+# ---------------------------------------------------------------------------------
+
+def part_accessors(copy_options, proj_fill_part="both", cut_fill_part="both"):
+    """
+    (getter, setter) pairs of the fields the selected property groups copy.
+
+    Args:
+        copy_options (list[str]): Names from COPY_PARTS.
+        proj_fill_part / cut_fill_part (str): "fg", "bg" or "both".
+    """
+    layers = {"Projection Fills": proj_fill_part, "Cut Fills": cut_fill_part}
+    accessors = []
+    for part, layer, fields in _PART_FIELDS:
+        if part not in copy_options:
+            continue
+        if layer is not None and layers[part] not in (layer, "both"):
+            continue
+        accessors.extend(_ACCESSORS[name] for name in fields)
+    return accessors
+
+def copy_fields(src_ogs, target_ogs, accessors):
+    """Copy the part_accessors() fields from src_ogs onto target_ogs (preserving the rest)."""
+    for get_field, set_field in accessors:
+        set_field(target_ogs, get_field(src_ogs))
+    return target_ogs
+
+def copy_override_parts(src_ogs, target_ogs, copy_options, proj_fill_part="both", cut_fill_part="both"):
+    """
+    Copy the selected property groups from src_ogs onto target_ogs (preserving the rest).
+
+    Args:
+        copy_options (list[str]): Names from COPY_PARTS.
+        proj_fill_part / cut_fill_part (str): "fg", "bg" or "both".
+    """
+    return copy_fields(src_ogs, target_ogs, part_accessors(copy_options, proj_fill_part, cut_fill_part))
+
+def copy_overrides_to_filters(doc, view, source_filter_id, target_filter_ids, copy_options,
+                              proj_fill_part="both", cut_fill_part="both"):
+    """Apply the source filter's overrides (all, or selected parts) to target filters in one view."""
+    copy_overrides_in_views(doc, [(view, source_filter_id, target_filter_ids)],
+                            copy_options, proj_fill_part, cut_fill_part)
+
+def copy_parts_in_view(view, source_filter_id, target_filter_ids, copy_options,
+                       proj_fill_part="both", cut_fill_part="both"):
+    """
+    Copy Specific Overrides in one view (inside an open transaction).
+
+    Returns:
+        int: Number of target filters written (calls are counted as they are made).
+    """
+    copy_all = "Copy ALL" in copy_options
+    with metrics.phase("plan"):
+        metrics.count("View.GetFilterOverrides")
+        src_ogs = view.GetFilterOverrides(source_filter_id)
+        src_visible = None
+        if copy_all and FILTER_VISIBILITY:
+            metrics.count("View.GetFilterVisibility")
+            src_visible = get_filter_visibility(view, source_filter_id)
+        # Fields to copy, bound once for all targets
+        accessors = None if copy_all else part_accessors(copy_options, proj_fill_part, cut_fill_part)
+
+    reads = written = shown = 0
+    with metrics.phase("apply"):
+        try:
+            for fid in target_filter_ids:
+                if copy_all:
+                    written += 1
+                    view.SetFilterOverrides(fid, src_ogs)
+                    # Copy visibility state
+                    if src_visible is not None:
+                        shown += 1
+                        set_filter_visibility(view, fid, src_visible)
+                else:
+                    # Preserve existing overrides that weren't selected for change
+                    reads += 1
+                    target_ogs = view.GetFilterOverrides(fid)
+                    copy_fields(src_ogs, target_ogs, accessors)
+                    written += 1
+                    view.SetFilterOverrides(fid, target_ogs)
+        finally:
+            metrics.count("View.GetFilterOverrides", reads)
+            metrics.count("View.SetFilterOverrides", written)
+            metrics.count("View.SetFilterVisibility", shown)
+    return written
+
+def copy_overrides_in_views(doc, jobs, copy_options, proj_fill_part="both", cut_fill_part="both"):
+    """
+    Copy Specific Overrides for several views in one transaction.
+
+    Args:
+        jobs (list): (view, source filter id, target filter ids) per view.
+    """
+    n = 0
+    t = Transaction(doc, "LUDARP: Copy Specific Overrides")
+    t.Start()
+    try:
+        for view, source_filter_id, target_filter_ids in jobs:
+            n += copy_parts_in_view(
+                view, source_filter_id, target_filter_ids, copy_options, proj_fill_part, cut_fill_part)
+
+        with metrics.phase("commit"):
+            t.Commit()
+        metrics.count("Transaction.Commit")
+    except Exception:
+        t.RollBack()
+        metrics.count("Transaction.RollBack")
+        raise
+
+    metrics.note("filters", n)
+
+# ---------------------------------------------------------------------------------
+# CHANGE COLORS / RESET / DUPLICATE
+# ---------------------------------------------------------------------------------
+
+def recolor_filters(doc, view, filter_ids, mode, color, pattern_id):
+    """Set the foreground fill color and pattern of filters ("Projection" or "Cut")."""
+    # Fill setters bound once (pre-2019 single-layer fills map to the same fields)
+    prefix = "Surface" if mode == "Projection" else "Cut"
+    set_pattern = ogs_setter(prefix + "ForegroundPatternId")
+    set_color = ogs_setter(prefix + "ForegroundPatternColor")
+
+    t = Transaction(doc, "LUDARP: Bulk Change Filter Colors")
+    t.Start()
+    reads = written = 0
+    try:
+        with metrics.phase("apply"):
+            try:
+                for fid in filter_ids:
+                    # Get current overrides to preserve other properties (halftone, etc.)
+                    reads += 1
+                    ogs = view.GetFilterOverrides(fid)
+                    set_pattern(ogs, pattern_id)
+                    set_color(ogs, color)
+                    written += 1
+                    view.SetFilterOverrides(fid, ogs)
+            finally:
+                metrics.count("View.GetFilterOverrides", reads)
+                metrics.count("View.SetFilterOverrides", written)
+
+        with metrics.phase("commit"):
+            t.Commit()
+        metrics.count("Transaction.Commit")
+    except Exception:
+        t.RollBack()
+        metrics.count("Transaction.RollBack")
+        raise
+
+def reset_filters(doc, view, filter_ids):
+    """Clear all graphic overrides of the given filters in a view."""
+    t = Transaction(doc, "LUDARP: Reset Filter Overrides")
+    t.Start()
+
+    # Create a default (blank) override object
+    default_ogs = OverrideGraphicSettings()
+
+    with metrics.phase("apply"):
+        for fid in filter_ids:
+            try:
+                view.SetFilterOverrides(fid, default_ogs)
+            except Exception:
+                pass
+
+    with metrics.phase("commit"):
+        t.Commit()
+
+    metrics.count("View.SetFilterOverrides", len(filter_ids))
+    metrics.count("Transaction.Commit")
+
+def duplicate_filter(doc, view, source_filter, new_name):
+    """
+    Clone a ParameterFilterElement (categories + rules), add it to the view and
+    apply the source filter's overrides. Rolls back and re-raises on failure.
+    """
+    # Store current overrides from the selected view
+    try:
+        current_override = view.GetFilterOverrides(source_filter.Id)
+    except:
+        current_override = OverrideGraphicSettings()
+
+    t = Transaction(doc, "LUDARP: Duplicate Filter")
+    t.Start()
+    try:
+        with metrics.phase("apply"):
+            # Clone properties
+            cats = source_filter.GetCategories()
+            elem_filter = source_filter.GetElementFilter()
+
+            # Create the new ParameterFilterElement
+            new_filter = ParameterFilterElement.Create(doc, new_name, cats, elem_filter)
+
+            # Apply same overrides and add to the selected view/template
+            if not view.GetFilters().Contains(new_filter.Id):
+                view.AddFilter(new_filter.Id)
+            view.SetFilterOverrides(new_filter.Id, current_override)
+
+        with metrics.phase("commit"):
+            t.Commit()
+        metrics.count("ParameterFilterElement.Create")
+        metrics.count("View.SetFilterOverrides")
+        metrics.count("Transaction.Commit")
+        return new_filter
+    except Exception:
+        t.RollBack()
+        raise
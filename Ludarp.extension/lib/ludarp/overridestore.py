@@ -0,0 +1,341 @@
+# -*- coding: utf-8 -*-
+"""
+🧮 LUDARP Library: Columnar Override Store
+Author: PRADUL P
+
+The filter override state of many (view, filter) pairs held column by column
+in typed arrays instead of one state tuple (or live OverrideGraphicSettings)
+per pair:
+
+    view_ids, filter_ids    element id values
+    colors                  packed 0xRRGGBB, -1 = no override
+    pattern ids             element id value, -1 = no override
+    line weights            pen number, 0 = no override
+    transparency            0-100, 0 = no override
+    flags                   halftone, detail level, visibility and applied bits
+
+A pair costs about a hundred bytes, and two pairs (or two whole stores) are
+compared on their packed values without building any color tuple. collect()
+fills a store in one sweep: each view's filters are listed once and each
+applied filter's overrides are read once, then released.
+
+Rows are read back as StateRow views (__slots__, nothing copied) or as
+ogsstate tuples with state(i) where Revit values must be built again.
+Snapshots and the override spreadsheet export read through a store; diff()
+and fingerprint() compare stores in bulk.
+"""
+import hashlib
+from array import array
+from collections import OrderedDict
+from ludarp import metrics
+from ludarp.compat import get_filter_visibility
+from ludarp.ogsstate import FIELDS, FIELD_NAMES, DETAIL_LEVELS, read_state, id_value
+
+try:
+    array("q")
+    ID_CODE = "q"
+except ValueError:
+    # No 64-bit integer arrays (IronPython 2.7): doubles hold every id value exactly
+    ID_CODE = "d"
+
+NONE = -1
+
+# Flag bits
+HALFTONE = 1
+DETAIL_SHIFT = 1
+DETAIL_MASK = 6            # two bits: 0 = no override, 1-3 = DETAIL_LEVELS
+STATE_BITS = HALFTONE | DETAIL_MASK
+VISIBILITY_KNOWN = 8
+VISIBLE = 16
+NOT_APPLIED = 32
+
+# Value columns: the ogsstate fields except halftone and detail level (in the flags)
+_CODES = {"color": "i", "id": ID_CODE, "weight": "b", "int": "b"}
+_COLUMNS = [(i, name, kind) for i, (name, kind) in enumerate(FIELDS.items()) if kind in _CODES]
+_HALFTONE_INDEX = FIELD_NAMES.index("Halftone")
+_DETAIL_INDEX = FIELD_NAMES.index("DetailLevel")
+
+# ---------------------------------------------------------------------------------
+# PACKING
+# ---------------------------------------------------------------------------------
+
+def _pack(kind, value):
+    if value is None:
+        return NONE if kind in ("color", "id") else 0
+    if kind == "color":
+        return (value[0] << 16) | (value[1] << 8) | value[2]
+    return value
+
+def _unpack(kind, value):
+    if kind == "color":
+        return None if value == NONE else ((value >> 16) & 255, (value >> 8) & 255, value & 255)
+    if kind == "id":
+        return None if value == NONE else int(value)
+    return value or None
+
+def _state_flags(state):
+    flags = HALFTONE if state[_HALFTONE_INDEX] else 0
+    detail = state[_DETAIL_INDEX]
+    if detail is not None:
+        flags |= (DETAIL_LEVELS.index(detail) + 1) << DETAIL_SHIFT
+    return flags
+
+def _visibility_flags(visible):
+    if visible is None:
+        return 0
+    return VISIBILITY_KNOWN | (VISIBLE if visible else 0)
+
+def pack_state(state):
+    """Packed column values and state flags of an ogsstate tuple (the row key)."""
+    return tuple(_pack(kind, state[i]) for i, _name, kind in _COLUMNS) + (_state_flags(state),)
+
+# Column values of a pair whose filter is not applied
+_EMPTY = pack_state((None,) * len(FIELD_NAMES))[:-1]
+
+def _bytes(column):
+    return column.tobytes() if hasattr(column, "tobytes") else column.tostring()
+
+# ---------------------------------------------------------------------------------
+# STORE
+# ---------------------------------------------------------------------------------
+
+class StateRow(object):
+    """A view of one row of an OverrideStore (nothing is copied)."""
+    __slots__ = ("store", "index")
+
+    def __init__(self, store, index):
+        self.store = store
+        self.index = index
+
+    @property
+    def view_id(self):
+        return int(self.store.view_ids[self.index])
+
+    @property
+    def filter_id(self):
+        return int(self.store.filter_ids[self.index])
+
+    @property
+    def applied(self):
+        return self.store.applied(self.index)
+
+    @property
+    def visible(self):
+        return self.store.visible(self.index)
+
+    @property
+    def state(self):
+        return self.store.state(self.index)
+
+    def key(self):
+        return self.store.key(self.index)
+
+class OverrideStore(object):
+    """Columnar (view, filter) override states; see the module docstring."""
+    def __init__(self):
+        self.view_ids = array(ID_CODE)
+        self.filter_ids = array(ID_CODE)
+        self.columns = [array(_CODES[kind]) for _i, _name, kind in _COLUMNS]
+        self.flags = array("B")
+        self._positions = None
+
+    def __len__(self):
+        return len(self.flags)
+
+    def __iter__(self):
+        for i in range(len(self.flags)):
+            yield StateRow(self, i)
+
+    @property
+    def nbytes(self):
+        """Memory held by the columns."""
+        arrays = [self.view_ids, self.filter_ids, self.flags] + self.columns
+        return sum(a.itemsize * len(a) for a in arrays)
+
+    # ---- Writing ----
+    def append(self, view_id, filter_id, state, visible=None, packed=None):
+        """
+        Add a pair whose filter is applied, with its state tuple (see ogsstate).
+        packed: pack_state(state) when the caller already has it.
+        """
+        packed = packed or pack_state(state)
+        self.view_ids.append(view_id)
+        self.filter_ids.append(filter_id)
+        for column, value in zip(self.columns, packed):
+            column.append(value)
+        self.flags.append(packed[-1] | _visibility_flags(visible))
+        self._positions = None
+
+    def extend_missing(self, view_id, filter_ids):
+        """Add pairs of one view whose filters are not applied to it (in bulk)."""
+        count = len(filter_ids)
+        if not count:
+            return
+        self.view_ids.extend(array(ID_CODE, [view_id]) * count)
+        self.filter_ids.extend(array(ID_CODE, filter_ids))
+        for column, value in zip(self.columns, _EMPTY):
+            column.extend(array(column.typecode, [value]) * count)
+        self.flags.extend(array("B", [NOT_APPLIED]) * count)
+        self._positions = None
+
+    # ---- Reading ----
+    def applied(self, i):
+        return not self.flags[i] & NOT_APPLIED
+
+    def visible(self, i):
+        flags = self.flags[i]
+        return bool(flags & VISIBLE) if flags & VISIBILITY_KNOWN else None
+
+    def key(self, i):
+        """Packed, hashable override state of row i (equal keys = equal states)."""
+        return tuple(column[i] for column in self.columns) + (self.flags[i] & STATE_BITS,)
+
+    def state(self, i):
+        """The ogsstate tuple of row i."""
+        state = [None] * len(FIELD_NAMES)
+        for column, (index, _name, kind) in zip(self.columns, _COLUMNS):
+            state[index] = _unpack(kind, column[i])
+        flags = self.flags[i]
+        state[_HALFTONE_INDEX] = True if flags & HALFTONE else None
+        detail = (flags & DETAIL_MASK) >> DETAIL_SHIFT
+        state[_DETAIL_INDEX] = DETAIL_LEVELS[detail - 1] if detail else None
+        return tuple(state)
+
+    def row(self, i):
+        return StateRow(self, i)
+
+    def positions(self):
+        """(view id, filter id) -> row index (built once; build it before sharing the store with workers)."""
+        if self._positions is None:
+            self._positions = dict(((int(v), int(f)), i)
+                                   for i, (v, f) in enumerate(zip(self.view_ids, self.filter_ids)))
+        return self._positions
+
+    def find(self, view_id, filter_id):
+        """Row index of a pair, or None."""
+        return self.positions().get((view_id, filter_id))
+
+    def spans(self):
+        """view id -> (first row, end row) of each view's consecutive rows (as collect() writes them)."""
+        spans = OrderedDict()
+        start = 0
+        for i in range(1, len(self.view_ids) + 1):
+            if i == len(self.view_ids) or self.view_ids[i] != self.view_ids[start]:
+                spans[int(self.view_ids[start])] = (start, i)
+                start = i
+        return spans
+
+    def distinct(self):
+        """Packed state key -> first row index holding it (states are shared by many pairs)."""
+        first = {}
+        for i in range(len(self.flags)):
+            first.setdefault(self.key(i), i)
+        return first
+
+    # ---- Bulk comparison ----
+    def fingerprint(self):
+        """Hash of every pair and state: equal stores (same pair order) have equal fingerprints."""
+        digest = hashlib.md5()
+        for column in [self.view_ids, self.filter_ids, self.flags] + self.columns:
+            digest.update(_bytes(column))
+        return digest.hexdigest()
+
+    def diff(self, other):
+        """
+        Pairs that differ from another store, matched by (view id, filter id).
+
+        Returns:
+            list[(view id, filter id, kind)]: kind is "added" (only in other),
+            "removed" (only here), "applied" (applied in one only), "overrides"
+            or "visibility".
+        """
+        if self.view_ids == other.view_ids and self.filter_ids == other.filter_ids:
+            return self._diff_aligned(other)
+        changes = []
+        seen = set()
+        for j in range(len(other)):
+            pair = (int(other.view_ids[j]), int(other.filter_ids[j]))
+            seen.add(pair)
+            i = self.find(*pair)
+            if i is None:
+                changes.append(pair + ("added",))
+            elif self.applied(i) != other.applied(j):
+                changes.append(pair + ("applied",))
+            else:
+                if self.key(i) != other.key(j):
+                    changes.append(pair + ("overrides",))
+                if self.visible(i) != other.visible(j):
+                    changes.append(pair + ("visibility",))
+        for i in range(len(self)):
+            pair = (int(self.view_ids[i]), int(self.filter_ids[i]))
+            if pair not in seen:
+                changes.append(pair + ("removed",))
+        return changes
+
+    def _diff_aligned(self, other):
+        """diff() of two stores holding the same pairs in the same order: whole
+        columns are compared first and only differing columns are scanned."""
+        rows = set()
+        for mine, theirs in zip(self.columns + [self.flags], other.columns + [other.flags]):
+            if mine != theirs:
+                rows.update(i for i, (a, b) in enumerate(zip(mine, theirs)) if a != b)
+        changes = []
+        for i in sorted(rows):
+            pair = (int(self.view_ids[i]), int(self.filter_ids[i]))
+            if self.applied(i) != other.applied(i):
+                changes.append(pair + ("applied",))
+                continue
+            if self.key(i) != other.key(i):
+                changes.append(pair + ("overrides",))
+            if self.visible(i) != other.visible(i):
+                changes.append(pair + ("visibility",))
+        return changes
+
+# ---------------------------------------------------------------------------------
+# COLLECTING
+# ---------------------------------------------------------------------------------
+
+# Filter visibility in a view (None where the view type or version does not support it)
+filter_visibility = get_filter_visibility
+
+def collect(targets, visibility=True, applied_out=None):
+    """
+    Read (view, filter ids) targets into a store in one sweep. filter ids None
+    means every filter applied to the view; requested filters that are not
+    applied are stored as not applied, after the view's applied ones. With
+    visibility=False filter visibility is not read (stored as unknown).
+    applied_out (dict), when given, receives view id -> applied filter id values.
+    """
+    store = OverrideStore()
+    packed = {}     # state -> packed values: most pairs share a few states
+    views = reads = 0
+    for view, filter_ids in targets:
+        vid = id_value(view.Id)
+        applied = list(view.GetFilters())
+        views += 1
+        wanted = applied if filter_ids is None else filter_ids
+        applied = set(id_value(fid) for fid in applied)
+        if applied_out is not None:
+            applied_out[vid] = applied
+        missing = []
+        for fid in wanted:
+            fid_value = id_value(fid)
+            if fid_value not in applied:
+                missing.append(fid_value)
+                continue
+            state = read_state(view.GetFilterOverrides(fid))
+            values = packed.get(state)
+            if values is None:
+                values = packed[state] = pack_state(state)
+            store.append(vid, fid_value, state, filter_visibility(view, fid) if visibility else None, values)
+            reads += 1
+        store.extend_missing(vid, missing)
+    metrics.count("View.GetFilters", views)
+    metrics.count("View.GetFilterOverrides", reads)
+    if visibility:
+        metrics.count("View.GetFilterVisibility", reads)
+    return store
+
+def collect_views(views, visibility=True):
+    """Every filter applied to each of the views."""
+    return collect(((view, None) for view in views), visibility)
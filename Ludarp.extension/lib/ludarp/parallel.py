@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""
+🧵 LUDARP Library: Parallel Planning
+Author: PRADUL P
+
+Runs the pure-data planning stage of the bulk tools on a pool of worker
+threads. The Revit API thread reads the model once into plain data (an
+OverrideStore, snapshot pairs, names); the workers compute matches, diffs and
+write plans from that data only; the API thread then turns the minimal write
+list back into Revit objects and writes it:
+
+    store = collect_views(templates)                            # API thread
+    chunks = parallel.map_chunks(plan_chunk, range(len(templates)),
+                                 progress=pb.update_progress)   # workers
+    actions = [(templates[i], make_id(fid), kind, payload)      # API thread
+               for chunk in chunks for i, fid, kind, payload in chunk]
+
+Worker functions must not call the Revit API or ludarp.metrics (the run's
+phase stack belongs to the API thread). Results come back in input order
+whatever the scheduling, so plans are identical to a serial run. progress
+(done items, total) is called on the calling thread while the workers run,
+so a pyRevit progress bar can be updated from it.
+
+IronPython has no global interpreter lock, so inside Revit the workers use
+every core. Under CPython (the dev stand-in) threads take turns, and small
+inputs run inline either way: a pool only pays off past a few thousand items.
+"""
+import sys
+import threading
+
+# Items below which a stage runs inline on the calling thread
+MIN_PARALLEL = 2000
+
+# Worker threads: None = one per core, capped at MAX_WORKERS
+WORKERS = None
+MAX_WORKERS = 8
+
+# Chunks per worker: enough to balance uneven items, few enough to stay cheap
+CHUNKS_PER_WORKER = 4
+
+# Seconds between progress callbacks while the workers run
+PROGRESS_INTERVAL = 0.1
+
+def worker_count():
+    """Worker threads for a planning stage (WORKERS, or one per core up to MAX_WORKERS)."""
+    if WORKERS:
+        return WORKERS
+    try:
+        from System import Environment
+        count = Environment.ProcessorCount
+    except ImportError:
+        import multiprocessing
+        try:
+            count = multiprocessing.cpu_count()
+        except NotImplementedError:
+            count = 1
+    return max(1, min(count, MAX_WORKERS))
+
+def split(items, parts):
+    """items (a list) as consecutive chunks, about `parts` of them."""
+    size = max(1, -(-len(items) // max(1, parts)))
+    return [items[start:start + size] for start in range(0, len(items), size)]
+
+def map_chunks(fn, items, progress=None):
+    """
+    fn(chunk) for consecutive chunks of items, on the worker pool.
+
+    Args:
+        fn (callable): Pure function of a list of items (no Revit API calls).
+        items (iterable): The work, e.g. template indices or snapshot pairs.
+        progress (callable): Called as progress(done, total) on this thread.
+
+    Returns:
+        list: fn's result for each chunk, in item order.
+
+    Raises:
+        Exception: The first error raised by fn (the other workers stop).
+    """
+    items = list(items)
+    total = len(items)
+    workers = worker_count()
+    if workers == 1 or total < MIN_PARALLEL:
+        results = []
+        done = 0
+        for chunk in split(items, CHUNKS_PER_WORKER):
+            results.append(fn(chunk))
+            done += len(chunk)
+            if progress is not None:
+                progress(done, total)
+        return results
+    return _Pool(fn, split(items, workers * CHUNKS_PER_WORKER), workers).run(total, progress)
+
+class _Pool(object):
+    """Threads taking the next chunk until none is left or one fails."""
+    def __init__(self, fn, chunks, workers):
+        self.fn = fn
+        self.chunks = chunks
+        self.workers = min(workers, len(chunks))
+        self.results = [None] * len(chunks)
+        self.lock = threading.Lock()
+        self.finished = threading.Event()
+        self.next = 0
+        self.done = 0
+        self.running = 0
+        self.error = None
+
+    def _take(self):
+        with self.lock:
+            if self.error is not None or self.next >= len(self.chunks):
+                return None
+            self.next += 1
+            return self.next - 1
+
+    def _work(self):
+        try:
+            while True:
+                index = self._take()
+                if index is None:
+                    break
+                self.results[index] = self.fn(self.chunks[index])
+                with self.lock:
+                    self.done += len(self.chunks[index])
+        except Exception:
+            with self.lock:
+                if self.error is None:
+                    self.error = sys.exc_info()[1]
+        finally:
+            with self.lock:
+                self.running -= 1
+                if not self.running:
+                    self.finished.set()
+
+    def run(self, total, progress):
+        self.running = self.workers
+        for _ in range(self.workers):
+            thread = threading.Thread(target=self._work)
+            thread.daemon = True
+            thread.start()
+        while not self.finished.wait(PROGRESS_INTERVAL):
+            if progress is not None:
+                progress(self.done, total)
+        if self.error is not None:
+            raise self.error
+        if progress is not None:
+            progress(total, total)
+        return self.results
@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+"""
+🖱️ LUDARP Library: Pickers
+Author: PRADUL P
+
+pyRevit pickers shared by the buttons: the type-ahead view/template picker,
+the bulk-target picker (views one by one, or by sheets / sheet set), filter
+pickers (with element match counts) and safe element/point picks in
+the model.
+"""
+from pyrevit import forms, script
+from ludarp import metrics
+
+TARGETS_PICK = "📄 Pick Views / Templates"
+TARGETS_SHEETS = "🗂️ Views on Sheets"
+TARGETS_SET = "📚 Views in a Sheet Set"
+APPLY_VIEWS, APPLY_TEMPLATES = "📄 The Views Themselves", "🎨 Their View Templates"
+
+def pick_views(doc, title, multiselect=False, exclude_id=None):
+    """
+    Type-ahead view/template picker (ludarp.viewpicker) over the cached view
+    index; falls back to the categorized SelectFromList (with a logged
+    warning) if the window cannot be created.
+
+    Returns:
+        View (single), list[View] (multiselect) or None if cancelled/empty.
+    """
+    from ludarp.views import get_view_index
+
+    index = get_view_index(doc)
+    try:
+        from ludarp import viewpicker
+        window = viewpicker.ViewPickerWindow(index, title, multiselect, exclude_id)
+    except Exception as ex:
+        # XAML/WPF failures surface as .NET exceptions, so log whatever it was
+        script.get_logger().warning("View picker unavailable, using the list picker: {}".format(ex))
+        return _pick_views_from_list(index, title, multiselect, exclude_id)
+    with metrics.phase("pick"):
+        window.show_dialog()
+    return window.result or None
+
+def _pick_views_from_list(index, title, multiselect, exclude_id):
+    view_dict = index.view_dict(exclude_id=exclude_id)
+    with metrics.phase("pick"):
+        picked = forms.SelectFromList.show(
+            view_dict,
+            name_attr="Name",
+            multiselect=multiselect,
+            title=title
+        )
+    if not picked:
+        return None
+    if not multiselect:
+        return picked.view
+    views = [opt.view for opt in picked if opt.view is not None]
+    return views or None
+
+def pick_targets(doc, title, exclude_id=None):
+    """
+    Targets of a bulk tool: views/templates picked one by one, or every view
+    on a range of sheets or in a sheet set, or the templates governing them
+    (resolved through the sheet index, see ludarp.sheets).
+
+    Returns:
+        (list[View], dict): The targets and the sheet selector that produced
+        them (None for hand-picked views); (None, None) if cancelled or empty.
+    """
+    from ludarp.views import get_view_index
+
+    sheet_index = get_view_index(doc).sheet_index()
+    mode = TARGETS_PICK
+    if sheet_index.sheets:
+        with metrics.phase("pick"):
+            mode = forms.CommandSwitchWindow.show([TARGETS_PICK, TARGETS_SHEETS, TARGETS_SET], message=title)
+    if not mode:
+        return None, None
+    if mode == TARGETS_PICK:
+        return pick_views(doc, title, multiselect=True, exclude_id=exclude_id), None
+
+    selector = pick_sheet_selector(sheet_index, title, by_set=(mode == TARGETS_SET))
+    if not selector:
+        return None, None
+    from ludarp.sheets import describe
+    try:
+        views = [v for v in sheet_index.resolve(selector) if v.Id != exclude_id]
+    except Exception as e:
+        # Typed specs: a bad "re:" pattern
+        forms.alert("Cannot read the sheet selection:\n{}".format(e), title="LUDARP: Targets")
+        return None, None
+    if not views:
+        forms.alert("Nothing to target: no {} found.".format(describe(selector)), title="LUDARP: Targets")
+        return None, None
+    metrics.note("sheet_targets", len(views))
+    return views, selector
+
+def pick_sheet_selector(sheet_index, title, by_set=False, apply_to=None):
+    """
+    Ask for sheet numbers (ranges, patterns) or sheet sets, then views or
+    templates (unless apply_to is given). Returns a sheet selector dict (see
+    ludarp.sheets) or None.
+    """
+    with metrics.phase("pick"):
+        if by_set:
+            names = list(sheet_index.sheet_sets())
+            if not names:
+                forms.alert("No sheet sets in this project.", title="LUDARP: Targets")
+                return None
+            picked = forms.SelectFromList.show(names, title=title + ": Sheet Sets", multiselect=True)
+            if not picked:
+                return None
+            selector = {"sheet_set": list(picked)}
+        else:
+            text = forms.ask_for_string(
+                default="{}..{}".format(sheet_index.sheets[0].SheetNumber, sheet_index.sheets[-1].SheetNumber),
+                prompt="Sheet numbers, comma separated: ranges (A-201..A-299), patterns (A-2*) or numbers",
+                title=title
+            )
+            specs = [spec.strip() for spec in (text or "").split(",") if spec.strip()]
+            if not specs:
+                return None
+            selector = {"sheets": specs}
+        if apply_to is None:
+            choice = forms.CommandSwitchWindow.show([APPLY_VIEWS, APPLY_TEMPLATES], message="Target on those sheets:")
+            if not choice:
+                return None
+            apply_to = "templates" if choice == APPLY_TEMPLATES else "views"
+    selector["apply_to"] = apply_to
+    return selector
+
+def filters_in_view(doc, view):
+    """ParameterFilterElements applied to a view/template."""
+    filters = [doc.GetElement(fid) for fid in view.GetFilters()]
+    metrics.count("View.GetFilters")
+    metrics.count("Document.GetElement", len(filters))
+    return filters
+
+class FilterPickItem(forms.TemplateListItem):
+    """List row for a filter: its name and how many elements it matches in the view."""
+    def __init__(self, filter_elem, count, hidden=False):
+        forms.TemplateListItem.__init__(self, filter_elem, checkable=True, name_attr="Name")
+        self.count = count
+        self.hidden = hidden
+
+    @property
+    def name(self):
+        from ludarp.matchcounts import describe
+        return u"{}    ({} elements)".format(self.item.Name, describe(self.count, self.hidden))
+
+def _with_counts(doc, view, filters):
+    """Filters as FilterPickItems with cached match counts (plain filters for templates)."""
+    if view.IsTemplate:
+        return filters
+    try:
+        from ludarp.matchcounts import count_matches, get_cache, is_hidden
+        cache = get_cache(doc)
+        items = []
+        for f in filters:
+            hidden = is_hidden(view, f)
+            items.append(FilterPickItem(f, count_matches(doc, view, f, cache, hidden), hidden))
+        return items
+    except Exception:
+        return filters
+
+def pick_filters(doc, view, title, multiselect=True, exclude_ids=None, empty_msg=None):
+    """
+    Pick filter(s) applied to a view. Alerts and returns None when the view has none.
+    In a view (not a template) each filter shows how many elements it matches there.
+
+    Returns:
+        ParameterFilterElement (single), list (multiselect) or None.
+    """
+    with metrics.phase("collect"):
+        filters = filters_in_view(doc, view)
+    if exclude_ids:
+        filters = [f for f in filters if f.Id not in exclude_ids]
+    if not filters:
+        forms.alert(empty_msg or "No filters found in the selected view/template.")
+        return None
+    filters = _with_counts(doc, view, filters)
+    with metrics.phase("pick"):
+        return forms.SelectFromList.show(
+            filters,
+            name_attr="Name",
+            multiselect=multiselect,
+            title=title
+        ) or None
+
+def safe_pick_object(uidoc, prompt="🖱️ Pick element"):
+    from Autodesk.Revit.Exceptions import OperationCanceledException
+    from Autodesk.Revit.UI.Selection import ObjectType
+    try:
+        with metrics.phase("pick"):
+            return uidoc.Selection.PickObject(ObjectType.Element, prompt)
+    except OperationCanceledException:
+        return None
+    except Exception as e:
+        forms.alert("Selection error:\n{}".format(e), title="Selection Error")
+        return None
+
+def safe_pick_point(uidoc, prompt="📍 Pick point"):
+    from Autodesk.Revit.Exceptions import OperationCanceledException
+    try:
+        with metrics.phase("pick"):
+            return uidoc.Selection.PickPoint(prompt)
+    except OperationCanceledException:
+        return None
+    except Exception as e:
+        forms.alert("Point pick error:\n{}".format(e), title="Selection Error")
+        return None
@@ -0,0 +1,450 @@
+# -*- coding: utf-8 -*-
+"""
+🔁 LUDARP Library: Sync Profiles
+Author: PRADUL P
+
+Named, saved FilterOverride jobs that replay without any picker. Profiles are
+stored per project in %APPDATA%/LUDARP/profiles/<document key>.json:
+
+    {
+      "name": "Weekly plan sync",
+      "operation": "copy_between",
+      "source": {"name": "A - Plan Template"},
+      "targets": {"pattern": "Level *", "view_types": ["FloorPlan"], "kind": "views"},
+      "filters": {"pattern": "A-*"}
+    }
+    {
+      "name": "Wall fills",
+      "operation": "copy_overrides",
+      "targets": {"kind": "templates", "pattern": "A - *"},
+      "source_filter": "A-Walls",
+      "filters": {"names": ["A-Walls Existing", "A-Walls Demo"]},
+      "parts": ["Projection Fills", "Halftone"],
+      "projection_fill": "both", "cut_fill": "both"
+    }
+    {"name": "Clear demo", "operation": "reset", "targets": {"kind": "templates"},
+     "filters": {"pattern": "*Demo*"}}
+    {"name": "Office standard", "operation": "standard", "standard": "S:/Standards/filters.json"}
+
+View selectors: "names" (exact) and "pattern" (glob or "re:", as in graphics
+standards) select views, all views when neither is given; "view_types" (a
+template counts as the view type it is for), "kind" ("templates" / "views" /
+"all") and "template" (pattern on the assigned template's name) narrow the
+selection. "sheets" (ranges such as
+"A-201..A-299", patterns or numbers) and "sheet_set" scope a selection to
+the views placed on those sheets, and "apply_to": "templates" turns it into
+the templates governing them (see ludarp.sheets):
+
+    "targets": {"sheets": ["A-201..A-299"], "apply_to": "templates"}
+
+Filter selectors ("names", "pattern")
+pick among the filters applied to the source view (copy_between) or to each
+target view (copy_overrides, reset). A "standard" profile applies a graphics
+standard file to every template in its scope (see ludarp.standards), or to
+the templates its optional "targets" selector resolves to.
+
+Selectors are resolved at run time against the cached view index, and a batch
+of profiles shares one view sweep, one filter sweep and one transaction group.
+A planned profile (Work) is written in one transaction, or step by step in
+the modeless Job Queue (see ludarp.jobwindow).
+"""
+import os
+import io
+import json
+import time
+import tempfile
+from collections import OrderedDict
+from Autodesk.Revit.DB import FilteredElementCollector, FilterElement, Transaction, TransactionGroup
+from ludarp import jobs, metrics, sheets, snapshots, standards
+from ludarp.compat import id_value
+from ludarp.docs import document_key
+from ludarp.ogsstate import DEFAULT_STATE, read_state
+from ludarp.overrides import (
+    COPY_PARTS, copy_filters_between_views, copy_overrides_in_views,
+    read_source, copy_into_view, copy_parts_in_view
+)
+from ludarp.standards import compile_pattern
+from ludarp.views import get_view_index
+
+PROFILE_ROOT = os.path.join(os.environ.get("APPDATA") or tempfile.gettempdir(), "LUDARP", "profiles")
+
+OPERATIONS = OrderedDict([
+    ("copy_between", "Copy Between Views"),
+    ("copy_overrides", "Copy Specific Overrides"),
+    ("reset", "Reset Filter Overrides"),
+    ("standard", "Apply Graphics Standard"),
+])
+FILL_PARTS = ("fg", "bg", "both")
+
+# ---------------------------------------------------------------------------------
+# STORE
+# ---------------------------------------------------------------------------------
+
+class ProfileStore(object):
+    """The saved profiles of one document (a JSON list, in save order)."""
+    def __init__(self, doc, root=PROFILE_ROOT):
+        self.path = os.path.join(root, document_key(doc) + ".json")
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return []
+        with io.open(self.path, "r", encoding="utf-8-sig") as f:
+            return json.load(f, object_pairs_hook=OrderedDict)
+
+    def save(self, profiles):
+        folder = os.path.dirname(self.path)
+        if not os.path.isdir(folder):
+            os.makedirs(folder)
+        with open(self.path, "wb") as f:
+            f.write(json.dumps(profiles, indent=2, ensure_ascii=False).encode("utf-8"))
+
+    def put(self, profile):
+        """Add a profile, replacing any profile of the same name."""
+        check_profile(profile)
+        profiles = [p for p in self.load() if p.get("name") != profile["name"]]
+        profiles.append(profile)
+        self.save(profiles)
+
+    def delete(self, name):
+        self.save([p for p in self.load() if p.get("name") != name])
+
+def check_profile(profile):
+    """Raises ValueError when a profile is incomplete."""
+    label = "Profile '{}'".format(profile.get("name") or "?")
+    if not profile.get("name"):
+        raise ValueError("A profile needs a name")
+    operation = profile.get("operation")
+    if operation not in OPERATIONS:
+        raise ValueError("{}: operation must be one of {}".format(label, ", ".join(OPERATIONS)))
+    if operation == "copy_between" and not profile.get("source"):
+        raise ValueError("{}: a \"source\" view selector is required".format(label))
+    if operation == "copy_overrides":
+        if not profile.get("source_filter"):
+            raise ValueError("{}: a \"source_filter\" name is required".format(label))
+        unknown = [p for p in profile.get("parts") or [] if p not in COPY_PARTS]
+        if not profile.get("parts") or unknown:
+            raise ValueError("{}: \"parts\" must list items of {}".format(label, ", ".join(COPY_PARTS)))
+        for key in ("projection_fill", "cut_fill"):
+            if profile.get(key, "both") not in FILL_PARTS:
+                raise ValueError("{}: \"{}\" must be fg, bg or both".format(label, key))
+    if (profile.get("targets") or {}).get("apply_to", "views") not in sheets.APPLY_TO:
+        raise ValueError("{}: \"apply_to\" must be views or templates".format(label))
+    if operation == "reset" and not profile.get("filters"):
+        raise ValueError("{}: a \"filters\" selector is required".format(label))
+    if operation == "standard" and not profile.get("standard"):
+        raise ValueError("{}: a \"standard\" file path is required".format(label))
+
+# ---------------------------------------------------------------------------------
+# SELECTORS
+# ---------------------------------------------------------------------------------
+
+def _name_matcher(selector):
+    """name -> bool for a names/pattern selector (everything when neither is given)."""
+    names = set(n.lower() for n in selector.get("names") or [])
+    pattern = selector.get("pattern")
+    match = compile_pattern(pattern) if pattern else None
+    if not names and match is None:
+        return lambda name: True
+    return lambda name: name.lower() in names or (match is not None and bool(match(name)))
+
+class Replayer(object):
+    """Resolves selectors and runs profiles against one document."""
+    def __init__(self, doc):
+        self.doc = doc
+        self.index = get_view_index(doc)
+        self._filter_names = None
+
+    def filter_names(self):
+        """Filter id value -> name (one sweep, cached)."""
+        if self._filter_names is None:
+            with metrics.phase("collect"):
+                self._filter_names = dict((id_value(f.Id), f.Name)
+                                          for f in FilteredElementCollector(self.doc).OfClass(FilterElement))
+            metrics.count("FilteredElementCollector")
+        return self._filter_names
+
+    # ---- Views ----
+    def resolve_views(self, selector):
+        """
+        Views (and templates) matching a view selector, in index order (sheet
+        order for sheet selectors).
+        """
+        selector = selector or {}
+        if sheets.is_sheet_selector(selector):
+            return self._resolve_on_sheets(selector)
+        by_name = _name_matcher(selector)
+        kind = selector.get("kind", "all")
+        types = set(selector.get("view_types") or [])
+        template = selector.get("template")
+        match_template = compile_pattern(template) if template else None
+        views = []
+        for r in self.index.records():
+            if kind == "templates" and not r.is_template or kind == "views" and r.is_template:
+                continue
+            # Templates carry the ViewType of the views they govern
+            if types and r.type_label not in types:
+                continue
+            if match_template is not None and not self._template_matches(r, match_template):
+                continue
+            if by_name(r.name):
+                views.append(r.view)
+        return views
+
+    def _resolve_on_sheets(self, selector):
+        # The placed views, narrowed by the other keys, then mapped to templates
+        placed = self.index.sheet_index().resolve(dict(selector, apply_to="views"))
+        narrowed = dict((k, v) for k, v in selector.items() if k not in sheets.SHEET_KEYS + ("apply_to",))
+        if narrowed:
+            wanted = set(id_value(v.Id) for v in self.resolve_views(narrowed))
+            placed = [v for v in placed if id_value(v.Id) in wanted]
+        if selector.get("apply_to") == "templates":
+            return self.index.governing_templates(placed)
+        return placed
+
+    def _template_matches(self, record, match):
+        if not record.has_template:
+            return False
+        template = self.index.by_id.get(id_value(record.view.ViewTemplateId))
+        return template is not None and bool(match(template.Name))
+
+    def resolve_view(self, selector):
+        """The single view a source selector names ({"name": ...} or a full selector)."""
+        if selector.get("name"):
+            selector = {"names": [selector["name"]]}
+        views = self.resolve_views(selector)
+        if len(views) != 1:
+            raise ValueError("Source selector matches {} views (exactly one needed)".format(len(views)))
+        return views[0]
+
+    # ---- Filters ----
+    def resolve_filters(self, view, selector, exclude=None):
+        """Ids of the filters applied to a view that match a filter selector."""
+        names = self.filter_names()
+        by_name = _name_matcher(selector or {})
+        metrics.count("View.GetFilters")
+        return [fid for fid in view.GetFilters()
+                if id_value(fid) != exclude and by_name(names.get(id_value(fid), ""))]
+
+    def filter_id(self, view, name):
+        wanted = name.lower()
+        names = self.filter_names()
+        for fid in view.GetFilters():
+            if names.get(id_value(fid), "").lower() == wanted:
+                return fid
+        return None
+
+    # ---- Operations ----
+    def plan(self, profile, result):
+        """The Work of one profile, or None when it has nothing to change (see result["message"])."""
+        check_profile(profile)
+        planner = getattr(self, "_plan_" + profile["operation"])
+        with metrics.phase("plan"):
+            return planner(profile, result)
+
+    def run(self, profile, snapshot=True):
+        """
+        Replay one profile.
+
+        Returns:
+            dict: name, operation, targets, filters, status ("ok" / "skipped" /
+            "error"), message and ms.
+        """
+        start = time.time()
+        result = new_result(profile)
+        try:
+            work = self.plan(profile, result)
+            if work is None:
+                result["status"] = "skipped"
+            else:
+                if snapshot:
+                    snapshots.safe_capture_targets(self.doc, profile["name"], work.targets)
+                work.write()
+        except Exception as ex:
+            result["status"] = "error"
+            result["message"] = str(ex)
+        result["ms"] = round((time.time() - start) * 1000, 1)
+        return result
+
+    def _plan_copy_between(self, profile, result):
+        source = self.resolve_view(profile["source"])
+        targets = [v for v in self.resolve_views(profile.get("targets")) if v.Id != source.Id]
+        filter_ids = self.resolve_filters(source, profile.get("filters"))
+        result["targets"], result["filters"] = len(targets), len(filter_ids)
+        if not targets or not filter_ids:
+            result["message"] = "No {} matched".format("target views" if not targets else "filters")
+            return None
+
+        def write():
+            copy_filters_between_views(self.doc, source, targets, filter_ids)
+
+        def steps():
+            rows = read_source(source, filter_ids)
+            yield
+            for view in targets:
+                copy_into_view(view, rows)
+                yield
+        return Work([(v, filter_ids) for v in targets], write, steps, len(targets) + 1)
+
+    def _plan_copy_overrides(self, profile, result):
+        work = []
+        for view in self.resolve_views(profile.get("targets")):
+            source_id = self.filter_id(view, profile["source_filter"])
+            if source_id is None:
+                continue
+            fids = self.resolve_filters(view, profile.get("filters"), exclude=id_value(source_id))
+            if fids:
+                work.append((view, source_id, fids))
+        result["targets"] = len(work)
+        result["filters"] = sum(len(w[2]) for w in work)
+        if not work:
+            result["message"] = "No view carries '{}' and matching target filters".format(profile["source_filter"])
+            return None
+        parts = profile["parts"]
+        fills = (profile.get("projection_fill", "both"), profile.get("cut_fill", "both"))
+
+        def write():
+            copy_overrides_in_views(self.doc, work, parts, *fills)
+
+        def steps():
+            for view, source_id, fids in work:
+                copy_parts_in_view(view, source_id, fids, parts, *fills)
+                yield
+        return Work([(w[0], w[2]) for w in work], write, steps, len(work))
+
+    def _plan_reset(self, profile, result):
+        actions = []
+        views = 0
+        for view in self.resolve_views(profile.get("targets")):
+            fids = self.resolve_filters(view, profile["filters"])
+            changed = [fid for fid in fids if read_state(view.GetFilterOverrides(fid)) != DEFAULT_STATE]
+            metrics.count("View.GetFilterOverrides", len(fids))
+            actions.extend((view, fid, "overrides", DEFAULT_STATE) for fid in changed)
+            views += 1 if changed else 0
+        result["targets"], result["filters"] = views, len(actions)
+        if not actions:
+            result["message"] = "No matching filter carries overrides"
+            return None
+        return Work.from_actions(self.doc, actions, profile["name"])
+
+    def _plan_standard(self, profile, result):
+        templates = None
+        if profile.get("targets"):
+            templates = [v for v in self.resolve_views(profile["targets"]) if v.IsTemplate]
+        plan = standards.plan(self.doc, standards.Standard.load(profile["standard"]), templates)
+        result["targets"] = len(plan.rows) - plan.compliant_templates
+        result["filters"] = len(plan.actions)
+        if plan.problems:
+            result["message"] = "; ".join(plan.problems[:3])
+        if not plan.actions:
+            result["message"] = result["message"] or "All templates already comply"
+            return None
+        return Work.from_actions(self.doc, plan.actions, profile["name"])
+
+class Work(object):
+    """
+    A planned profile: the (view, filter ids) pairs it touches (for the
+    snapshot), its write as one transaction, and the same write as a step
+    generator for the job queue (ludarp.jobs; total = number of steps).
+    """
+    def __init__(self, targets, write, steps, total):
+        self.targets = targets
+        self.write = write
+        self.steps = steps
+        self.total = total
+
+    @classmethod
+    def from_actions(cls, doc, actions, tool):
+        size = snapshots.ACTION_STEP
+        return cls(snapshots.action_targets(actions),
+                   lambda: snapshots.apply_actions(doc, actions, "LUDARP: " + tool),
+                   lambda: snapshots.write_actions_in_steps(actions, size),
+                   (len(actions) + size - 1) // size)
+
+def new_result(profile):
+    return OrderedDict([("name", profile.get("name")), ("operation", profile.get("operation")),
+                        ("targets", 0), ("filters", 0), ("status", "ok"), ("message", ""), ("ms", 0.0)])
+
+def run_profiles(doc, profiles, snapshot=True):
+    """
+    Replay profiles in order inside one transaction group (one undo step).
+
+    Returns:
+        list[dict]: One result per profile (see Replayer.run).
+    """
+    replayer = Replayer(doc)
+    group = TransactionGroup(doc, "LUDARP: Replay {} Profile(s)".format(len(profiles)))
+    group.Start()
+    results = []
+    try:
+        for profile in profiles:
+            results.append(replayer.run(profile, snapshot))
+    finally:
+        if any(r["status"] == "ok" for r in results):
+            group.Assimilate()
+        else:
+            group.RollBack()
+    metrics.note("profiles", len(profiles))
+    return results
+
+# ---------------------------------------------------------------------------------
+# QUEUED JOBS
+# ---------------------------------------------------------------------------------
+
+class ProfileJob(jobs.Job):
+    """
+    A profile run slice by slice in a job queue (see ludarp.jobs), one
+    transaction per slice. The first step plans the profile against the model
+    as it is when the job starts, the second snapshots the touched pairs, then
+    the Work steps write one target view or one batch of actions each.
+    """
+    def __init__(self, doc, profile, snapshot=True):
+        jobs.Job.__init__(self, u"{} ({})".format(profile.get("name"), doc.Title), self._steps)
+        self.doc = doc
+        self.profile = profile
+        self.snapshot = snapshot
+        self._transaction = None
+
+    def _steps(self):
+        result = new_result(self.profile)
+        # The queue outlives button runs: plan against the views as they are now
+        get_view_index(self.doc, refresh=True)
+        work = Replayer(self.doc).plan(self.profile, result)
+        if work is None:
+            self.total = 1
+            self.message = u"Skipped: " + result["message"]
+            return
+        self.total = 1 + work.total + (1 if self.snapshot else 0)
+        self.message = u"{} target(s), {} filter(s)".format(result["targets"], result["filters"])
+        yield
+        if self.snapshot:
+            snapshots.safe_capture_targets(self.doc, self.profile["name"], work.targets)
+            yield
+        for _step in work.steps():
+            yield
+
+    def begin_slice(self):
+        if not self.doc.IsValidObject:
+            raise RuntimeError("The model was closed")
+        self._transaction = Transaction(self.doc, "LUDARP Job: " + self.profile["name"])
+        self._transaction.Start()
+
+    def end_slice(self):
+        self._transaction.Commit()
+        self._transaction = None
+
+    def abort_slice(self):
+        if self._transaction is not None:
+            try:
+                self._transaction.RollBack()
+            except Exception:
+                pass
+        self._transaction = None
+
+    def close(self):
+        jobs.Job.close(self)
+        if metrics.is_enabled():
+            # One record per job: its slices run outside any button run, and
+            # the name keeps them apart from the button's own "Job Queue" runs
+            run = metrics.Run("Job Queue: job", self.doc)
+            run.info.update(job=self.name, steps=self.done, slices=self.slices)
+            run.write(self.seconds, "ok" if self.status == jobs.DONE else self.status)
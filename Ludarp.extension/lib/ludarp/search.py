@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""
+🔎 LUDARP Library: Name Search Index
+Author: PRADUL P
+
+A precomputed token/prefix index over item names for type-ahead pickers
+(pure Python, no Revit imports). Names are normalized (lower case, accents
+removed) and split into alphanumeric tokens; every token prefix up to
+PREFIX_LENGTH characters maps to the items carrying it.
+
+A query matches items whose tokens start with every query token, in any order
+("flo 02" finds "02 - Floor Plan"); numbers also match without their
+leading zeros ("level 3" finds "Level 003"). Results are ranked: exact name, then name
+prefix, then tokens in query order, then shorter names. When no item matches
+by token, a plain substring search is used instead ("plan" still finds
+"FloorPlan"). Facets narrow both searches, so the fallback also runs when
+every token match is filtered out.
+"""
+import re
+import unicodedata
+
+# Longest indexed prefix; longer query tokens are checked against the tokens
+PREFIX_LENGTH = 8
+
+_TOKEN = re.compile(u"[0-9a-z]+")
+
+def normalize(text):
+    """Lower case, accents removed, runs of other characters collapsed to one space."""
+    text = text if isinstance(text, type(u"")) else text.decode("utf-8")
+    try:
+        text = u"".join(c for c in unicodedata.normalize("NFKD", text) if not unicodedata.combining(c))
+    except Exception:
+        pass
+    return u" ".join(_TOKEN.findall(text.lower()))
+
+def tokenize(text):
+    return normalize(text).split()
+
+def _with_numbers(tokens):
+    """Tokens plus numbers without leading zeros ("003" is also found as "3")."""
+    for token in tokens:
+        yield token
+        if token[0] == u"0" and token.isdigit() and token.strip(u"0"):
+            yield token.lstrip(u"0")
+
+class SearchIndex(object):
+    """
+    Token and prefix index over items.
+
+    Args:
+        items (list): Items to search.
+        key (callable): Item -> searchable name.
+    """
+    def __init__(self, items, key):
+        self.items = list(items)
+        self.names = [normalize(key(item)) for item in self.items]
+        self.tokens = [name.split() for name in self.names]
+        self.prefixes = {}
+        for i, tokens in enumerate(self.tokens):
+            seen = set()
+            for token in _with_numbers(tokens):
+                for n in range(1, min(len(token), PREFIX_LENGTH) + 1):
+                    seen.add(token[:n])
+            for prefix in seen:
+                self.prefixes.setdefault(prefix, []).append(i)
+
+    def _token_matches(self, token):
+        ids = self.prefixes.get(token[:PREFIX_LENGTH], ())
+        if len(token) <= PREFIX_LENGTH:
+            return ids
+        return [i for i in ids if any(t.startswith(token) for t in _with_numbers(self.tokens[i]))]
+
+    def _candidates(self, qtokens):
+        sets = sorted((self._token_matches(t) for t in qtokens), key=len)
+        if not sets[0]:
+            return set()
+        result = set(sets[0])
+        for ids in sets[1:]:
+            result.intersection_update(ids)
+            if not result:
+                break
+        return result
+
+    def _rank(self, i, query, qtokens):
+        name = self.names[i]
+        if name == query:
+            exact = 0
+        elif name.startswith(query):
+            exact = 1
+        else:
+            exact = 2
+        # Query tokens appearing in the same order as in the name rank higher
+        positions = []
+        for q in qtokens:
+            positions.append(next((n for n, t in enumerate(self.tokens[i])
+                                   if t.startswith(q) or t.lstrip(u"0").startswith(q)), 99))
+        in_order = 0 if positions == sorted(positions) else 1
+        return (exact, in_order, len(name), name)
+
+    def search(self, query, allowed=None):
+        """
+        Items matching the query, best first.
+
+        Args:
+            query (str): Free text; an empty query returns every allowed item in order.
+            allowed (callable): Optional item -> bool facet predicate, applied to
+                the token matches and, when none are allowed, to the substring matches.
+        """
+        query = normalize(query)
+        if not query:
+            return [item for item in self.items if allowed is None or allowed(item)]
+
+        qtokens = query.split()
+        ids = [i for i in self._candidates(qtokens) if allowed is None or allowed(self.items[i])]
+        if not ids:
+            compact = query.replace(u" ", u"")
+            ids = [i for i, name in enumerate(self.names)
+                   if compact in name.replace(u" ", u"") and (allowed is None or allowed(self.items[i]))]
+        ranked = sorted(ids, key=lambda i: self._rank(i, query, qtokens))
+        return [self.items[i] for i in ranked]
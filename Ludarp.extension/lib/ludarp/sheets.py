@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""
+🗂️ LUDARP Library: Sheet Targets
+Author: PRADUL P
+
+Target selection by sheet instead of view by view: "every view on sheets
+A-201..A-299", "every view in sheet set Issue 04", or the view templates
+governing them. Built on the cached view index (ludarp.views): the sheets are
+already among its views and one Viewport sweep maps sheets to the views
+placed on them, so resolving a selector is a dictionary walk:
+
+    index = get_view_index(doc).sheet_index()
+    views = index.resolve({"sheets": ["A-201..A-299", "A-3*"]})
+    templates = index.resolve({"sheet_set": "Issue 04", "apply_to": "templates"})
+
+Sheet specs: "A-201..A-299" (inclusive range, sheet numbers compared
+naturally, so A-299 < A-1000), a glob or "re:" pattern on the sheet number or
+name ("A-2*"), or an exact sheet number. "sheet_set" names one or more
+sheet sets (their sheets' views and any views printed directly). The same
+keys work in the "targets" of a sync profile (see ludarp.profiles).
+"""
+import re
+from collections import OrderedDict
+from Autodesk.Revit.DB import FilteredElementCollector, ViewSheetSet, ViewType
+from ludarp import metrics
+from ludarp.compat import id_value
+from ludarp.standards import compile_pattern
+from ludarp.views import VALID_VIEW_TYPES
+
+SHEET_KEYS = ("sheets", "sheet_set")
+APPLY_TO = ("views", "templates")
+
+_RANGE = re.compile(u"\\s*(.+?)\\s*(?:\\.\\.|…)\\s*(.+?)\\s*$")
+_DIGITS = re.compile("(\\d+)")
+
+def is_sheet_selector(selector):
+    """True when a target selector scopes by sheet or sheet set."""
+    return bool(selector) and any(selector.get(key) for key in SHEET_KEYS)
+
+def sheet_key(number):
+    """Natural sort key of a sheet number: A-99 < A-100 < A-100a < B-1."""
+    parts = _DIGITS.split(number.strip().upper())
+    return tuple(int(p) if i % 2 else p for i, p in enumerate(parts))
+
+def _as_list(value):
+    if not value:
+        return []
+    if isinstance(value, (list, tuple)):
+        return list(value)
+    return [value]
+
+# ---------------------------------------------------------------------------------
+# INDEX
+# ---------------------------------------------------------------------------------
+
+class SheetIndex(object):
+    """Sheets in number order and the views placed on each (see get_view_index().sheet_index())."""
+    def __init__(self, view_index):
+        self.index = view_index
+        sheets = [v for v in view_index.views if v.ViewType == ViewType.DrawingSheet and not v.IsTemplate]
+        self.sheets = sorted(sheets, key=lambda s: sheet_key(s.SheetNumber))
+        self.keys = [sheet_key(s.SheetNumber) for s in self.sheets]
+        self.placed = {}            # sheet id value -> view id values, in viewport order
+        for sheet_id, view_id in view_index.viewports():
+            self.placed.setdefault(sheet_id, []).append(view_id)
+        self._sets = None
+
+    def sheet_sets(self):
+        """Sheet set name -> id values of its sheets and views (one sweep, cached)."""
+        if self._sets is None:
+            sets = OrderedDict()
+            with metrics.phase("collect"):
+                for sheet_set in FilteredElementCollector(self.index.doc).OfClass(ViewSheetSet):
+                    sets[sheet_set.Name] = [id_value(v.Id) for v in sheet_set.Views]
+            metrics.count("FilteredElementCollector")
+            self._sets = OrderedDict(sorted(sets.items(), key=lambda item: item[0].lower()))
+        return self._sets
+
+    # ---- Sheets ----
+    def match_sheets(self, specs):
+        """Sheets matching any of the sheet specs, in number order."""
+        matchers = [self._matcher(spec) for spec in _as_list(specs)]
+        return [s for s, key in zip(self.sheets, self.keys)
+                if any(match(s, key) for match in matchers)]
+
+    def _matcher(self, spec):
+        spec = spec.strip()
+        found = _RANGE.match(spec)
+        if found and not spec.startswith("re:"):
+            low, high = sorted([sheet_key(found.group(1)), sheet_key(found.group(2))])
+            return lambda sheet, key: low <= key <= high
+        if "*" in spec or "?" in spec or spec.startswith("re:"):
+            match = compile_pattern(spec)
+            return lambda sheet, key: bool(match(sheet.SheetNumber)) or bool(match(sheet.Name))
+        wanted = sheet_key(spec)
+        return lambda sheet, key: key == wanted
+
+    def _views(self, view_ids):
+        # Only the view types the filter tools handle (no legends or drafting views)
+        by_id = self.index.by_id
+        seen = set()
+        views = []
+        for view_id in view_ids:
+            view = by_id.get(view_id)
+            if view is None or view_id in seen or view.ViewType not in VALID_VIEW_TYPES:
+                continue
+            seen.add(view_id)
+            views.append(view)
+        return views
+
+    # ---- Selectors ----
+    def resolve(self, selector):
+        """
+        Target views of a sheet selector.
+
+        Args:
+            selector (dict): "sheets" (spec or list of specs), "sheet_set" (name
+                or list of names) and "apply_to" ("views", the default, or
+                "templates": the distinct templates governing those views).
+
+        Returns:
+            list[View]: Unique views (or templates), in sheet order.
+        """
+        sheets = self.match_sheets(selector.get("sheets"))
+        view_ids = [view_id for s in sheets for view_id in self.placed.get(id_value(s.Id), ())]
+        if selector.get("sheet_set"):
+            sets = self.sheet_sets()
+            for name in _as_list(selector["sheet_set"]):
+                if name not in sets:
+                    raise ValueError("No sheet set named '{}'".format(name))
+                for member_id in sets[name]:
+                    # A set lists sheets (use what is placed on them) and plain views
+                    view_ids.extend(self.placed.get(member_id, [member_id]))
+        views = self._views(view_ids)
+        if selector.get("apply_to", "views") == "templates":
+            return self.index.governing_templates(views)
+        return views
+
+def describe(selector):
+    """Short label of a sheet selector, e.g. 'templates of views on sheets A-201..A-299'."""
+    scope = []
+    if selector.get("sheets"):
+        scope.append("sheets " + ", ".join(_as_list(selector["sheets"])))
+    if selector.get("sheet_set"):
+        scope.append("sheet set " + ", ".join(_as_list(selector["sheet_set"])))
+    label = "views on " + " + ".join(scope)
+    if selector.get("apply_to") == "templates":
+        label = "templates of " + label
+    return label
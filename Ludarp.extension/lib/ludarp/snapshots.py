@@ -0,0 +1,343 @@
+# -*- coding: utf-8 -*-
+"""
+📸 LUDARP Library: Override Snapshots
+Author: PRADUL P
+
+Before a bulk tool writes filter overrides it captures the prior state of
+exactly the (view, filter) pairs it is about to touch: whether the filter was
+applied, its visibility and its overrides. Snapshots are kept per document in
+%TEMP%/ludarp_snapshots/<document key>/ as gzipped JSON; identical override
+states are stored once (palette + index per pair). The oldest snapshots are
+evicted when a document's store grows past MAX_STORE_BYTES.
+
+restore() puts any earlier snapshot back as one minimal diff: only pairs whose
+current state differs are written, in a single transaction.
+"""
+import os
+import io
+import gzip
+import json
+import tempfile
+from collections import OrderedDict
+from datetime import datetime
+from Autodesk.Revit.DB import Transaction
+from ludarp import metrics, parallel
+from ludarp.compat import set_filter_visibility
+from ludarp.docs import document_key
+from ludarp.ogsstate import build_ogs, load_state, id_value, make_id
+from ludarp.overridestore import NOT_APPLIED, collect, filter_visibility
+
+SNAPSHOT_ROOT = os.path.join(tempfile.gettempdir(), "ludarp_snapshots")
+INDEX_FILE = "index.json"
+
+# Per-document store size limit; oldest snapshots are evicted beyond it
+MAX_STORE_BYTES = 100 * 1024 * 1024
+
+FORMAT_VERSION = 1
+
+# Actions written per step when a plan runs in the job queue (see ludarp.jobs)
+ACTION_STEP = 50
+
+# ---------------------------------------------------------------------------------
+# STORE
+# ---------------------------------------------------------------------------------
+
+class SnapshotStore(object):
+    """Snapshot files of one document plus a small index (newest last)."""
+    def __init__(self, doc, root=SNAPSHOT_ROOT, max_bytes=MAX_STORE_BYTES):
+        self.title = doc.Title
+        self.folder = os.path.join(root, document_key(doc))
+        self.max_bytes = max_bytes
+
+    # ---- Index ----
+    def _index_path(self):
+        return os.path.join(self.folder, INDEX_FILE)
+
+    def entries(self):
+        """Index entries (dicts with file, tool, timestamp, pairs, bytes), oldest first."""
+        path = self._index_path()
+        if not os.path.exists(path):
+            return []
+        try:
+            with io.open(path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+        except ValueError:
+            return []
+        return [e for e in entries if os.path.exists(os.path.join(self.folder, e["file"]))]
+
+    def _write_index(self, entries):
+        data = json.dumps(entries, indent=1).encode("utf-8")
+        with open(self._index_path(), "wb") as f:
+            f.write(data)
+
+    # ---- Files ----
+    def save(self, tool, pairs, states):
+        """Write a snapshot; returns its index entry."""
+        if not os.path.isdir(self.folder):
+            os.makedirs(self.folder)
+        now = datetime.now()
+        name = now.strftime("%Y%m%d-%H%M%S-%f") + ".json.gz"
+        payload = {
+            "version": FORMAT_VERSION,
+            "document": self.title,
+            "tool": tool,
+            "timestamp": now.strftime("%Y-%m-%d %H:%M:%S"),
+            "states": states,
+            "pairs": pairs,
+        }
+        path = os.path.join(self.folder, name)
+        f = gzip.open(path, "wb")
+        try:
+            f.write(json.dumps(payload, separators=(",", ":")).encode("utf-8"))
+        finally:
+            f.close()
+
+        entry = {
+            "file": name, "tool": tool, "timestamp": payload["timestamp"],
+            "pairs": len(pairs), "bytes": os.path.getsize(path),
+        }
+        entries = self.entries() + [entry]
+        self._write_index(self._evict(entries))
+        return entry
+
+    def load(self, entry):
+        f = gzip.open(os.path.join(self.folder, entry["file"]), "rb")
+        try:
+            return json.loads(f.read().decode("utf-8"))
+        finally:
+            f.close()
+
+    def delete(self, entry):
+        path = os.path.join(self.folder, entry["file"])
+        if os.path.exists(path):
+            os.remove(path)
+        self._write_index([e for e in self.entries() if e["file"] != entry["file"]])
+
+    def _evict(self, entries):
+        """Drop the oldest snapshots until the store fits (the newest one is always kept)."""
+        total = sum(e.get("bytes", 0) for e in entries)
+        while len(entries) > 1 and total > self.max_bytes:
+            oldest = entries.pop(0)
+            total -= oldest.get("bytes", 0)
+            path = os.path.join(self.folder, oldest["file"])
+            if os.path.exists(path):
+                os.remove(path)
+        return entries
+
+# ---------------------------------------------------------------------------------
+# CAPTURE
+# ---------------------------------------------------------------------------------
+
+def _read_pairs(targets):
+    """
+    Current state of (view, filter ids) targets as (pairs, states), read in
+    one sweep into a columnar store (ludarp.overridestore).
+
+    Pairs are [view id, filter id, applied (0/1), visible, state index] against
+    a palette of distinct override states.
+    """
+    store = collect(targets)
+    palette = {}
+    states = []
+    pairs = []
+    for i, (vid, fid, flags) in enumerate(zip(store.view_ids, store.filter_ids, store.flags)):
+        if flags & NOT_APPLIED:
+            pairs.append([int(vid), int(fid), 0, None, None])
+            continue
+        key = store.key(i)
+        index = palette.get(key)
+        if index is None:
+            index = palette[key] = len(states)
+            states.append(store.state(i))
+        pairs.append([int(vid), int(fid), 1, store.visible(i), index])
+    return pairs, states
+
+def capture_targets(doc, tool, targets, store=None):
+    """
+    Snapshot the current state of the (view, filter ids) targets.
+
+    Returns:
+        dict: The index entry of the saved snapshot.
+    """
+    store = store or SnapshotStore(doc)
+    targets = list(targets)
+    with metrics.phase("plan"):
+        pairs, states = _read_pairs(targets)
+        entry = store.save(tool, pairs, states)
+
+    metrics.note("snapshot_pairs", len(pairs))
+    return entry
+
+def capture(doc, tool, views, filter_ids, store=None):
+    """Snapshot every (view, filter) pair in views x filter_ids."""
+    filter_ids = list(filter_ids)
+    return capture_targets(doc, tool, [(view, filter_ids) for view in views], store)
+
+def action_targets(actions):
+    """(view, filter ids) targets touched by a list of (view, filter id, ...) actions."""
+    targets = OrderedDict()
+    for action in actions:
+        view, fid = action[0], action[1]
+        fids = targets.setdefault(id_value(view.Id), (view, []))[1]
+        if fid not in fids:
+            fids.append(fid)
+    return list(targets.values())
+
+def _warn(ex):
+    try:
+        from pyrevit import script
+        script.get_logger().warning("Override snapshot failed: {}".format(ex))
+    except Exception:
+        pass
+
+def safe_capture(doc, tool, views, filter_ids):
+    """capture() that never blocks the tool: returns None (and logs) on failure."""
+    try:
+        return capture(doc, tool, views, filter_ids)
+    except Exception as ex:
+        _warn(ex)
+        return None
+
+def safe_capture_targets(doc, tool, targets):
+    """capture_targets() that never blocks the tool: returns None (and logs) on failure."""
+    try:
+        return capture_targets(doc, tool, targets)
+    except Exception as ex:
+        _warn(ex)
+        return None
+
+# ---------------------------------------------------------------------------------
+# RESTORE
+# ---------------------------------------------------------------------------------
+
+def plan_restore(doc, snapshot, progress=None):
+    """
+    Minimal diff from the current model back to a snapshot. The snapshot's
+    views are read once into a store (API thread), the pairs are compared on
+    the worker pool (ludarp.parallel, progress(done, total) in pairs) and only
+    the actions are turned back into Revit objects.
+
+    Returns:
+        (actions, skipped): actions are (view, filter id, kind, payload) with kind
+        "remove", "add" (payload: (ogs state, visible)), "overrides" (state) or
+        "visibility" (bool); skipped counts pairs whose view or filter is gone.
+    """
+    states = [load_state(s) for s in snapshot["states"]]
+    views = {}
+    filters = {}
+    targets = OrderedDict()
+    live = []
+    skipped = 0
+    for pair in snapshot["pairs"]:
+        vid, fid_value = pair[0], pair[1]
+        if vid not in views:
+            views[vid] = doc.GetElement(make_id(vid))
+        if fid_value not in filters:
+            fid = make_id(fid_value)
+            filters[fid_value] = fid if doc.GetElement(fid) is not None else None
+        view, fid = views[vid], filters[fid_value]
+        if view is None or fid is None:
+            skipped += 1
+            continue
+        # Only pairs that were applied need their state read; for the others
+        # the view's applied filters tell whether to remove them
+        fids = targets.setdefault(vid, (view, []))[1]
+        if pair[2]:
+            fids.append(fid)
+        live.append(pair)
+
+    applied = {}
+    store = collect(targets.values(), applied_out=applied)
+    store.positions()
+    chunks = parallel.map_chunks(lambda pairs: _diff_pairs(store, applied, states, pairs), live, progress)
+    actions = [(views[vid], filters[fid_value], kind, payload)
+               for chunk in chunks for vid, fid_value, kind, payload in chunk]
+    metrics.note("plan_workers", parallel.worker_count())
+    return actions, skipped
+
+def _diff_pairs(store, applied, states, pairs):
+    """Snapshot pairs vs. the current store -> (view id, filter id, kind, payload) (no Revit API)."""
+    positions = store.positions()
+    actions = []
+    for vid, fid_value, was_applied, visible, index in pairs:
+        is_applied = fid_value in applied[vid]
+        i = positions.get((vid, fid_value))
+        if not was_applied:
+            if is_applied:
+                actions.append((vid, fid_value, "remove", None))
+            continue
+        if not is_applied:
+            actions.append((vid, fid_value, "add", (states[index], visible)))
+            continue
+        if store.state(i) != states[index]:
+            actions.append((vid, fid_value, "overrides", states[index]))
+        current = store.visible(i)
+        if visible is not None and current is not None and current != visible:
+            actions.append((vid, fid_value, "visibility", visible))
+    return actions
+
+def write_actions(actions):
+    """Write actions inside an open transaction."""
+    with metrics.phase("apply"):
+        for view, fid, kind, payload in actions:
+            if kind == "remove":
+                view.RemoveFilter(fid)
+            elif kind == "add":
+                state, visible = payload
+                view.AddFilter(fid)
+                view.SetFilterOverrides(fid, build_ogs(state))
+                if visible is not None:
+                    set_filter_visibility(view, fid, visible)
+            elif kind == "overrides":
+                view.SetFilterOverrides(fid, build_ogs(payload))
+            elif kind == "visibility":
+                set_filter_visibility(view, fid, payload)
+
+def write_actions_in_steps(actions, size=ACTION_STEP):
+    """Generator writing `size` actions per step (for ludarp.jobs; no transaction of its own)."""
+    for start in range(0, len(actions), size):
+        write_actions(actions[start:start + size])
+        yield
+
+def apply_actions(doc, actions, title="LUDARP: Restore Override Snapshot"):
+    """Write a list of actions in one transaction (rolled back on failure)."""
+    if not actions:
+        return 0
+    t = Transaction(doc, title)
+    t.Start()
+    try:
+        write_actions(actions)
+        with metrics.phase("commit"):
+            t.Commit()
+    except Exception:
+        t.RollBack()
+        raise
+    metrics.count("Transaction.Commit")
+    return len(actions)
+
+def apply_with_snapshot(doc, actions, tool, snapshot=True):
+    """Snapshot the pairs a plan touches (never blocking), then write it in one transaction."""
+    if not actions:
+        return 0
+    if snapshot:
+        safe_capture_targets(doc, tool, action_targets(actions))
+    return apply_actions(doc, actions, "LUDARP: " + tool)
+
+def restore(doc, entry, store=None, snapshot_first=True, progress=None):
+    """
+    Restore a snapshot as a minimal diff. With snapshot_first the pairs about to
+    change are snapshotted first, so the restore itself can be restored.
+    progress(done, total) follows the planning (see plan_restore).
+
+    Returns:
+        (changed, skipped)
+    """
+    store = store or SnapshotStore(doc)
+    snapshot = store.load(entry)
+    with metrics.phase("plan"):
+        actions, skipped = plan_restore(doc, snapshot, progress)
+    if actions and snapshot_first:
+        # Snapshot exactly the pairs the restore touches, so it can be undone too
+        capture_targets(doc, "Before restore of {}".format(entry["timestamp"]),
+                        action_targets(actions), store)
+    return apply_actions(doc, actions), skipped
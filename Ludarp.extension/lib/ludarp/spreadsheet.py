@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+"""
+📑 LUDARP Library: Override Spreadsheet
+Author: PRADUL P
+
+Round-trips every (template, filter) override state through a flat CSV or TSV
+file, so coordinators can bulk-edit filter graphics outside Revit:
+
+    Template | Filter | Visible | <one column per ogsstate.KEYS> | Template Id | Filter Id
+
+Export reads every pair in one sweep into a columnar store
+(ludarp.overridestore), formats each distinct state once and streams the rows
+to disk. Import parses the sheet, diffs every row
+against the current model and returns only the changed pairs as
+snapshots-style actions, written afterwards in a single transaction.
+
+Values use the ogsstate text forms: colors "#RRGGBB", patterns by name,
+"yes" / blank for halftone and visibility. A blank override cell means no
+override; a column missing from the sheet is left untouched. Rows are matched
+on the id columns when present and valid, else on the names.
+"""
+import io
+import csv
+from Autodesk.Revit.DB import FilteredElementCollector, FilterElement
+from ludarp import metrics, snapshots
+from ludarp.ogsstate import (
+    KEYS, KEY_FIELDS, FIELD_NAMES, FIELD_INDEX, PatternNames,
+    read_state, to_text, from_text, id_value, make_id
+)
+from ludarp.overridestore import collect_views
+from ludarp.views import ViewIndex
+
+try:
+    text_type = unicode
+except NameError:
+    text_type = str
+
+# Number of rows buffered before each write to disk
+CHUNK_ROWS = 500
+
+TEMPLATE, FILTER, VISIBLE, TEMPLATE_ID, FILTER_ID = (
+    "Template", "Filter", "Visible", "Template Id", "Filter Id")
+KEY_HEADERS = [k.replace("_", " ").title() for k in KEYS]
+HEADERS = [TEMPLATE, FILTER, VISIBLE] + KEY_HEADERS + [TEMPLATE_ID, FILTER_ID]
+
+def _normalize(header):
+    return header.strip().lower().replace(" ", "_")
+
+def delimiter_for(path):
+    """Tab for .tsv / .txt files, comma otherwise."""
+    return u"\t" if path.lower().endswith((".tsv", ".txt")) else u","
+
+# ---------------------------------------------------------------------------------
+# EXPORT
+# ---------------------------------------------------------------------------------
+
+def _cell(value, delimiter):
+    value = value if isinstance(value, text_type) else text_type(value)
+    if any(c in value for c in (delimiter, u'"', u"\r", u"\n")):
+        return u'"' + value.replace(u'"', u'""') + u'"'
+    return value
+
+def _filter_names(doc):
+    metrics.count("FilteredElementCollector")
+    return dict((id_value(f.Id), f.Name) for f in FilteredElementCollector(doc).OfClass(FilterElement))
+
+def iter_rows(doc, templates=None):
+    """Cell rows (text) of every filter applied to the templates, template by template."""
+    with metrics.phase("collect"):
+        names = PatternNames(doc)
+        filters = _filter_names(doc)
+        if templates is None:
+            templates = sorted(ViewIndex(doc).templates(), key=lambda t: t.Name)
+        store = collect_views(templates)
+    template_names = dict((id_value(t.Id), t.Name) for t in templates)
+
+    # Templates share few distinct states: format each one once
+    formatted = {}
+    for i in range(len(store)):
+        key = store.key(i)
+        cells = formatted.get(key)
+        if cells is None:
+            cells = formatted[key] = [to_text(f, v, names) for f, v in zip(FIELD_NAMES, store.state(i))]
+        visible = store.visible(i)
+        tid, fid_value = int(store.view_ids[i]), int(store.filter_ids[i])
+        yield ([template_names[tid], filters.get(fid_value, u""),
+                u"" if visible is None else (u"yes" if visible else u"no")]
+               + cells + [text_type(tid), text_type(fid_value)])
+
+def export_overrides(doc, path, templates=None, delimiter=None):
+    """
+    Stream the override state of every (template, filter) pair to a CSV/TSV file.
+
+    Returns:
+        int: Number of exported rows.
+    """
+    delimiter = delimiter or delimiter_for(path)
+    count = 0
+    with metrics.phase("apply"):
+        with open(path, "wb") as f:
+            buf = [u"\ufeff" + delimiter.join(HEADERS) + u"\r\n"]   # BOM: Excel reads UTF-8
+            for row in iter_rows(doc, templates):
+                buf.append(delimiter.join(_cell(v, delimiter) for v in row) + u"\r\n")
+                count += 1
+                if len(buf) >= CHUNK_ROWS:
+                    f.write(u"".join(buf).encode("utf-8"))
+                    buf = []
+            f.write(u"".join(buf).encode("utf-8"))
+    metrics.note("rows", count)
+    return count
+
+# ---------------------------------------------------------------------------------
+# IMPORT
+# ---------------------------------------------------------------------------------
+
+class ImportPlan(object):
+    """
+    Result of diffing a sheet against the model.
+
+    actions    snapshots-style actions for the changed pairs
+    rows       data rows read
+    changed    rows that differ from the model
+    problems   (row number, message) for rows that were skipped
+    """
+    def __init__(self):
+        self.actions = []
+        self.rows = 0
+        self.changed = 0
+        self.problems = []
+
+def _read_sheet(path):
+    with io.open(path, "r", encoding="utf-8-sig", newline="") as f:
+        header_line = f.readline()
+        delimiter = u"\t" if u"\t" in header_line else delimiter_for(path)
+        f.seek(0)
+        reader = csv.reader(f, delimiter=str(delimiter))
+        for row in reader:
+            yield row
+
+class _Lookup(object):
+    """Templates and filters by id value or (lower-case) name."""
+    def __init__(self, doc):
+        templates = ViewIndex(doc).templates()
+        self.templates = dict((id_value(t.Id), t) for t in templates)
+        self.template_names = dict((t.Name.lower(), t) for t in templates)
+        filters = _filter_names(doc)
+        self.filters = filters
+        self.filter_names = dict((n.lower(), v) for v, n in filters.items())
+
+    def template(self, id_text, name):
+        if id_text.isdigit() and int(id_text) in self.templates:
+            return self.templates[int(id_text)]
+        return self.template_names.get(name.strip().lower())
+
+    def filter(self, id_text, name):
+        if id_text.isdigit() and int(id_text) in self.filters:
+            return int(id_text)
+        return self.filter_names.get(name.strip().lower())
+
+def plan_import(doc, path):
+    """
+    Diff a CSV/TSV sheet against the model.
+
+    Raises:
+        ValueError: the sheet has no Template/Filter columns.
+    """
+    result = ImportPlan()
+    rows = _read_sheet(path)
+    try:
+        header = next(rows)
+    except StopIteration:
+        raise ValueError("The sheet is empty")
+    columns = dict((_normalize(h), i) for i, h in enumerate(header))
+    col_template = columns.get(_normalize(TEMPLATE))
+    col_filter = columns.get(_normalize(FILTER))
+    if col_template is None or col_filter is None:
+        raise ValueError("The sheet needs '{}' and '{}' columns".format(TEMPLATE, FILTER))
+    col_tid = columns.get(_normalize(TEMPLATE_ID))
+    col_fid = columns.get(_normalize(FILTER_ID))
+    col_visible = columns.get(_normalize(VISIBLE))
+    field_cols = [(FIELD_INDEX[KEY_FIELDS[k]], KEY_FIELDS[k], columns[k]) for k in KEYS if k in columns]
+
+    with metrics.phase("collect"):
+        lookup = _Lookup(doc)
+        names = PatternNames(doc)
+    applied = {}
+    parsed = {}     # (field, text) -> state value: sheets repeat the same few values
+    seen = set()
+    reads = 0
+
+    def cell(row, index):
+        return row[index] if index is not None and index < len(row) else u""
+
+    with metrics.phase("plan"):
+        for number, row in enumerate(rows, 2):
+            if not any(c.strip() for c in row):
+                continue
+            result.rows += 1
+            template = lookup.template(cell(row, col_tid), cell(row, col_template))
+            fid_value = lookup.filter(cell(row, col_fid), cell(row, col_filter))
+            if template is None or fid_value is None:
+                result.problems.append((number, "Unknown {} '{}'".format(
+                    "template" if template is None else "filter",
+                    cell(row, col_template) if template is None else cell(row, col_filter))))
+                continue
+            pair = (id_value(template.Id), fid_value)
+            if pair in seen:
+                result.problems.append((number, "Duplicate row for this template and filter (skipped)"))
+                continue
+            seen.add(pair)
+
+            values = {}
+            bad = False
+            for index, field, col in field_cols:
+                text = cell(row, col).strip()
+                key = (field, text)
+                if key not in parsed:
+                    try:
+                        parsed[key] = from_text(field, text, names)
+                    except KeyError:
+                        result.problems.append((number, "No pattern named '{}'".format(text)))
+                        bad = True
+                        continue
+                    except (ValueError, TypeError) as ex:
+                        result.problems.append((number, "{}: {}".format(KEYS[index], ex)))
+                        bad = True
+                        continue
+                values[index] = parsed[key]
+            if bad:
+                continue
+            visible = None
+            if col_visible is not None and cell(row, col_visible).strip():
+                visible = cell(row, col_visible).strip().lower() in ("yes", "y", "true", "1", "on", "x")
+
+            if pair[0] not in applied:
+                applied[pair[0]] = set(id_value(f) for f in template.GetFilters())
+            fid = make_id(fid_value)
+            if fid_value not in applied[pair[0]]:
+                state = tuple(values.get(i) for i in range(len(FIELD_NAMES)))
+                result.actions.append((template, fid, "add", (state, visible)))
+                result.changed += 1
+                continue
+
+            current = read_state(template.GetFilterOverrides(fid))
+            reads += 1
+            desired = list(current)
+            for index, value in values.items():
+                desired[index] = value
+            desired = tuple(desired)
+            changed = False
+            if desired != current:
+                result.actions.append((template, fid, "overrides", desired))
+                changed = True
+            if visible is not None and snapshots.filter_visibility(template, fid) != visible:
+                result.actions.append((template, fid, "visibility", visible))
+                changed = True
+            result.changed += changed
+
+    metrics.count("View.GetFilters", len(applied))
+    metrics.count("View.GetFilterOverrides", reads)
+    metrics.note("rows", result.rows)
+    metrics.note("actions", len(result.actions))
+    return result
+
+def apply_import(doc, plan, tool="Import Override Spreadsheet", snapshot=True):
+    """Write the changed rows in one transaction (snapshotting them first)."""
+    return snapshots.apply_with_snapshot(doc, plan.actions, tool, snapshot)
@@ -0,0 +1,347 @@
+# -*- coding: utf-8 -*-
+"""
+📐 LUDARP Library: Graphics Standards
+Author: PRADUL P
+
+A graphics standard is a JSON file that maps filter name patterns to filter
+visibility and override graphics:
+
+    {
+      "name": "Office Standard 2026",
+      "templates": "*",
+      "rules": [
+        {"filter": "A-Wall*", "visible": true, "surface_pattern": "<Solid fill>",
+         "surface_color": "#C8C8C8", "projection_line_weight": 3},
+        {"filter": "re:Existing$", "halftone": true, "transparency": 50},
+        {"filter": "Demolition", "templates": "*Plan*", "add": true, "visible": false}
+      ]
+    }
+
+Patterns are case-insensitive globs (* and ?) matched against the whole name,
+or regular expressions searched in the name when prefixed with "re:". The first
+rule matching a filter (and, when given, the template via "templates") wins.
+Override keys are the ones in ogsstate.KEYS: keys present in a rule are
+enforced, absent keys are left alone and null clears an override. With
+"add": true the filter is also added to in-scope templates that lack it.
+
+plan() matches a standard against every view template and computes the minimal
+diff (over one read of the templates, on the worker pool: see ludarp.parallel);
+apply() writes it in one transaction (after a snapshot, see Restore
+Snapshot).
+"""
+import io
+import re
+import json
+from collections import OrderedDict
+from Autodesk.Revit.DB import FilteredElementCollector, FilterElement
+from ludarp import metrics, parallel, snapshots
+from ludarp.ogsstate import (
+    KEYS, KEY_FIELDS, FIELD_NAMES, DEFAULT_STATE, PatternNames,
+    read_state, merge, to_text, from_text, id_value, make_id
+)
+from ludarp.overridestore import collect_views
+from ludarp.views import ViewIndex
+
+# Rule keys besides the override keys
+RULE_OPTIONS = ("filter", "templates", "add", "visible", "comment")
+
+# ---------------------------------------------------------------------------------
+# PATTERNS
+# ---------------------------------------------------------------------------------
+
+def compile_pattern(pattern):
+    """Compiled matcher for a glob or "re:" pattern (both case-insensitive)."""
+    if pattern.startswith("re:"):
+        return re.compile(pattern[3:], re.IGNORECASE).search
+    parts = [".*" if c == "*" else "." if c == "?" else re.escape(c) for c in pattern]
+    return re.compile("^" + "".join(parts) + "$", re.IGNORECASE | re.DOTALL).match
+
+def exact_pattern(name):
+    """Pattern matching exactly one name."""
+    if "*" in name or "?" in name or name.startswith("re:"):
+        return "re:^" + re.escape(name) + "$"
+    return name
+
+# ---------------------------------------------------------------------------------
+# STANDARD FILE
+# ---------------------------------------------------------------------------------
+
+class Rule(object):
+    """One rule of a standard: filter/template patterns and the values to enforce."""
+    def __init__(self, index, data):
+        if not isinstance(data, dict) or not data.get("filter"):
+            raise ValueError("Rule {}: a \"filter\" pattern is required".format(index + 1))
+        self.index = index
+        self.pattern = data["filter"]
+        self.label = "Rule {} ({})".format(index + 1, self.pattern)
+        unknown = [k for k in data if k not in RULE_OPTIONS and k not in KEY_FIELDS]
+        if unknown:
+            raise ValueError("{}: unknown key(s) {}".format(self.label, ", ".join(sorted(unknown))))
+        try:
+            self.match_filter = compile_pattern(self.pattern)
+            self.match_template = compile_pattern(data["templates"]) if data.get("templates") else None
+        except re.error as ex:
+            raise ValueError("{}: bad pattern ({})".format(self.label, ex))
+        self.add = bool(data.get("add", False))
+        visible = data.get("visible")
+        if visible is not None and not isinstance(visible, bool):
+            raise ValueError("{}: \"visible\" must be true or false".format(self.label))
+        self.visible = visible
+        self.values = OrderedDict((k, data[k]) for k in KEYS if k in data)
+
+    def resolve(self, names):
+        """
+        Field name -> state value for this rule in one document.
+
+        Returns:
+            (fields, problems): problems lists values that could not be used
+            (unknown pattern names, malformed values); those fields are skipped.
+        """
+        fields = OrderedDict()
+        problems = []
+        for key, raw in self.values.items():
+            field = KEY_FIELDS[key]
+            try:
+                fields[field] = from_text(field, raw, names)
+            except KeyError:
+                problems.append("{}: no pattern named '{}' for {}".format(self.label, raw, key))
+            except (ValueError, TypeError) as ex:
+                problems.append("{}: {} ({})".format(self.label, key, ex))
+        return fields, problems
+
+class Standard(object):
+    """A parsed graphics standard."""
+    def __init__(self, data, source=None):
+        if not isinstance(data, dict) or not isinstance(data.get("rules"), list):
+            raise ValueError("A standard needs a \"rules\" list")
+        self.source = source
+        self.name = data.get("name") or source or "Graphics Standard"
+        try:
+            self.match_template = compile_pattern(data["templates"]) if data.get("templates") else None
+        except re.error as ex:
+            raise ValueError("Bad \"templates\" pattern ({})".format(ex))
+        self.rules = [Rule(i, r) for i, r in enumerate(data["rules"])]
+
+    @classmethod
+    def load(cls, path):
+        with io.open(path, "r", encoding="utf-8-sig") as f:
+            try:
+                data = json.load(f, object_pairs_hook=OrderedDict)
+            except ValueError as ex:
+                raise ValueError("Not valid JSON: {}".format(ex))
+        return cls(data, source=path)
+
+def write_standard(data, path):
+    text = json.dumps(data, indent=2, ensure_ascii=False)
+    with open(path, "wb") as f:
+        f.write(text.encode("utf-8"))
+
+def standard_from_view(doc, view, name=None):
+    """
+    Standard data (dict) reproducing a view/template's filters exactly: one rule
+    per applied filter with its visibility (omitted where the view or Revit
+    version has none: the standard then leaves it alone) and every override key.
+    """
+    names = PatternNames(doc)
+    rules = []
+    for fid in view.GetFilters():
+        rule = OrderedDict([("filter", exact_pattern(doc.GetElement(fid).Name))])
+        visible = snapshots.filter_visibility(view, fid)
+        if visible is not None:
+            rule["visible"] = visible
+        state = read_state(view.GetFilterOverrides(fid))
+        for key, field, value in zip(KEYS, FIELD_NAMES, state):
+            rule[key] = to_text(field, value, names) or None
+        if rule["halftone"]:
+            rule["halftone"] = True
+        for key in ("projection_line_weight", "cut_line_weight", "transparency"):
+            if rule[key] is not None:
+                rule[key] = int(rule[key])
+        rules.append(rule)
+    return OrderedDict([
+        ("name", name or "Standard from {}".format(view.Name)),
+        ("templates", "*"),
+        ("rules", rules),
+    ])
+
+# ---------------------------------------------------------------------------------
+# MATCHING
+# ---------------------------------------------------------------------------------
+
+class Matcher(object):
+    """
+    First-matching-rule lookup. Filter names are matched against the rules once
+    and cached, so a model with many templates sharing the same filters costs
+    one regex pass per distinct filter name.
+    """
+    def __init__(self, rules):
+        self.rules = rules
+        self._candidates = {}
+        self._in_scope = {}
+
+    def candidates(self, filter_name):
+        found = self._candidates.get(filter_name)
+        if found is None:
+            found = self._candidates[filter_name] = [r for r in self.rules if r.match_filter(filter_name)]
+        return found
+
+    def _scoped(self, rule, template_name):
+        if rule.match_template is None:
+            return True
+        key = (rule.index, template_name)
+        ok = self._in_scope.get(key)
+        if ok is None:
+            ok = self._in_scope[key] = bool(rule.match_template(template_name))
+        return ok
+
+    def rule_for(self, template_name, filter_name):
+        for rule in self.candidates(filter_name):
+            if self._scoped(rule, template_name):
+                return rule
+        return None
+
+# ---------------------------------------------------------------------------------
+# PLAN & APPLY
+# ---------------------------------------------------------------------------------
+
+class Plan(object):
+    """
+    Result of matching a standard against the model.
+
+    actions  snapshots-style actions (view, filter id, kind, payload)
+    rows     one compliance row per template (dict)
+    problems values that could not be resolved and rules that matched nothing
+    """
+    def __init__(self, standard):
+        self.standard = standard
+        self.actions = []
+        self.rows = []
+        self.problems = []
+
+    @property
+    def compliant_templates(self):
+        return sum(1 for r in self.rows if not r["changed"] and not r["added"])
+
+def _in_standard_scope(standard, template):
+    return standard.match_template is None or bool(standard.match_template(template.Name))
+
+def plan(doc, standard, templates=None, progress=None):
+    """
+    Match a standard against view templates (default: every template in the
+    model; e.g. the templates governing a set of sheets, see ludarp.sheets)
+    within the standard's "templates" scope and compute the minimal diff.
+
+    The templates' filter states are read once into an OverrideStore; the
+    matching and diff run over that data on the worker pool (ludarp.parallel,
+    progress(done, total) in templates) and only the resulting actions are
+    turned back into Revit objects.
+    """
+    result = Plan(standard)
+    with metrics.phase("collect"):
+        names = PatternNames(doc)
+        filters = dict((id_value(f.Id), f.Name) for f in FilteredElementCollector(doc).OfClass(FilterElement))
+        if templates is None:
+            templates = ViewIndex(doc).templates()
+        templates = [t for t in templates if _in_standard_scope(standard, t)]
+    metrics.count("FilteredElementCollector", 3)
+
+    resolved = {}
+    for rule in standard.rules:
+        fields, problems = rule.resolve(names)
+        resolved[rule.index] = fields
+        result.problems.extend(problems)
+
+    with metrics.phase("collect"):
+        # Visibility is only compared when a rule enforces it
+        store = collect_views(templates, visibility=any(r.visible is not None for r in standard.rules))
+        spans = store.spans()
+    planner = _TemplatePlanner(standard, store, spans, filters, resolved)
+    jobs = [(id_value(t.Id), t.Name) for t in templates]
+    with metrics.phase("plan"):
+        chunks = parallel.map_chunks(planner.plan, jobs, progress)
+
+    # Back on the API thread: ids -> Revit objects, in template order
+    hits = set()
+    position = 0
+    for chunk in chunks:
+        for row, actions, chunk_hits in chunk:
+            template = templates[position]
+            position += 1
+            hits.update(chunk_hits)
+            result.rows.append(row)
+            result.actions.extend((template, make_id(fid_value), kind, payload)
+                                  for fid_value, kind, payload in actions)
+
+    metrics.note("templates", len(templates))
+    metrics.note("actions", len(result.actions))
+    metrics.note("plan_workers", parallel.worker_count())
+
+    for rule in standard.rules:
+        if rule.index not in hits:
+            result.problems.append("{}: matched no filter in any template".format(rule.label))
+    return result
+
+class _TemplatePlanner(object):
+    """The pure-data part of plan(): one template's compliance row and actions (no Revit API)."""
+    def __init__(self, standard, store, spans, filters, resolved):
+        self.store = store
+        self.spans = spans
+        self.filters = filters
+        self.resolved = resolved
+        self.matcher = Matcher(standard.rules)
+        self.addable = [(fid_value, name) for fid_value, name in sorted(filters.items())
+                        if any(r.add for r in self.matcher.candidates(name))]
+
+    def plan(self, jobs):
+        """[(template id value, name)] -> [(row, actions (filter id value, kind, payload), rule hits)]."""
+        return [self.plan_template(vid, tname) for vid, tname in jobs]
+
+    def plan_template(self, vid, tname):
+        store, matcher = self.store, self.matcher
+        row = {"template": tname, "matched": 0, "compliant": 0, "changed": 0, "added": 0, "unmatched": []}
+        actions = []
+        hits = set()
+        applied_values = set()
+        start, end = self.spans.get(vid, (0, 0))
+        for i in range(start, end):
+            fid_value = int(store.filter_ids[i])
+            applied_values.add(fid_value)
+            fname = self.filters.get(fid_value, "#{}".format(fid_value))
+            rule = matcher.rule_for(tname, fname)
+            if rule is None:
+                row["unmatched"].append(fname)
+                continue
+            hits.add(rule.index)
+            row["matched"] += 1
+            changed = False
+            fields = self.resolved[rule.index]
+            if fields:
+                current = store.state(i)
+                desired = merge(current, fields)
+                if desired != current:
+                    actions.append((fid_value, "overrides", desired))
+                    changed = True
+            # Unknown visibility (view type or version without it) is left alone
+            current = store.visible(i)
+            if rule.visible is not None and current is not None and current != rule.visible:
+                actions.append((fid_value, "visibility", rule.visible))
+                changed = True
+            if changed:
+                row["changed"] += 1
+            else:
+                row["compliant"] += 1
+
+        for fid_value, fname in self.addable:
+            if fid_value in applied_values:
+                continue
+            rule = matcher.rule_for(tname, fname)
+            if rule is not None and rule.add:
+                hits.add(rule.index)
+                state = merge(DEFAULT_STATE, self.resolved[rule.index])
+                actions.append((fid_value, "add", (state, rule.visible)))
+                row["added"] += 1
+        return row, actions, hits
+
+def apply(doc, plan, tool="Apply Graphics Standard", snapshot=True):
+    """Write a plan in one transaction (snapshotting the touched pairs first)."""
+    return snapshots.apply_with_snapshot(doc, plan.actions, tool, snapshot)
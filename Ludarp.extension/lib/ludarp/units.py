@@ -0,0 +1,262 @@
+# -*- coding: utf-8 -*-
+"""
+📏 LUDARP Library: Unit Engine
+Version: 1.0 | Author: PRADUL P
+
+Exact length conversion and Revit-equivalent formatting in pure Python (no
+Revit imports). Conversion factors are exact rationals (1 ft = 0.3048 m by
+definition), rounding is half away from zero on the exact value, and feet and
+fractional inches round to 1/2^n of an inch.
+
+The output matches UnitFormatUtils.Format with FormatOptions(unit) and the
+accuracies in UNIT_DEFS: no unit symbol, no digit grouping, trailing zeros
+kept, and feet-fractional-inches written as 12' - 6 1/2".
+
+Example:
+    format_length(12.5, "fi")          # u"12' - 6\\""
+    format_length(10.0, "mm")          # u"3048"
+    parse_length(u"12' - 6 1/2\\"")     # Fraction(301, 24) (decimal feet)
+"""
+import re
+from fractions import Fraction
+from collections import OrderedDict
+
+# Display units: key -> (label, feet per unit, default accuracy in display units)
+# "fi" displays in feet, so its accuracy is in feet: 1/256" = 1/3072 ft.
+UNIT_DEFS = OrderedDict([
+    ("m", ("Meters", Fraction(1250, 381), Fraction(1, 1000))),
+    ("cm", ("Centimeters", Fraction(25, 762), Fraction(1))),
+    ("mm", ("Millimeters", Fraction(5, 1524), Fraction(1))),
+    ("ft", ("Feet", Fraction(1), Fraction(1, 100))),
+    ("fi", ("Fractional Inches", Fraction(1), Fraction(1, 3072))),
+])
+
+# Feet per unit for every accepted unit suffix (exact)
+FEET_PER_UNIT = {
+    "m": Fraction(1250, 381),
+    "cm": Fraction(25, 762),
+    "mm": Fraction(5, 1524),
+    "ft": Fraction(1),
+    "'": Fraction(1),
+    "in": Fraction(1, 12),
+    '"': Fraction(1, 12),
+}
+
+class UnitError(ValueError):
+    """Raised for unknown units, invalid accuracies and unparseable length strings."""
+
+def _exact(value):
+    """Exact rational of an int, float, Fraction or numeric string."""
+    if isinstance(value, Fraction):
+        return value
+    return Fraction(value)
+
+def _accuracy(value):
+    """Exact accuracy step; float steps such as 0.001 or 1/3072 are recovered exactly."""
+    if isinstance(value, float):
+        return Fraction(value).limit_denominator(10 ** 9)
+    return _exact(value)
+
+def accuracy_for(unit_key):
+    """Default accuracy of a display unit (a Fraction in display units)."""
+    try:
+        return UNIT_DEFS[unit_key][2]
+    except KeyError:
+        raise UnitError("Unknown unit: {0}".format(unit_key))
+
+# ---------------------------------------------------------------------------------
+# CONVERSION
+# ---------------------------------------------------------------------------------
+
+def to_unit(value_feet, unit):
+    """Exact conversion of decimal feet into the given unit (returns a Fraction)."""
+    try:
+        return _exact(value_feet) / FEET_PER_UNIT[unit]
+    except KeyError:
+        raise UnitError("Unknown unit: {0}".format(unit))
+
+def to_feet(value, unit):
+    """Exact conversion of a value in the given unit into decimal feet (a Fraction)."""
+    try:
+        return _exact(value) * FEET_PER_UNIT[unit]
+    except KeyError:
+        raise UnitError("Unknown unit: {0}".format(unit))
+
+def convert(value_feet, unit):
+    """Convert decimal feet into the given unit as a float."""
+    return float(to_unit(value_feet, unit))
+
+def round_to(value, accuracy):
+    """Round an exact value to the nearest multiple of accuracy, half away from zero."""
+    accuracy = _accuracy(accuracy)
+    if accuracy <= 0:
+        raise UnitError("Accuracy must be positive")
+    steps = abs(_exact(value)) / accuracy
+    n = steps.numerator // steps.denominator
+    if steps - n >= Fraction(1, 2):
+        n += 1
+    return n * accuracy if value >= 0 else -n * accuracy
+
+# ---------------------------------------------------------------------------------
+# FORMATTING
+# ---------------------------------------------------------------------------------
+
+def _decimals(accuracy):
+    """Digits after the decimal point for an accuracy such as 0.001 or 1."""
+    digits = 0
+    while (accuracy * 10 ** digits).denominator != 1:
+        digits += 1
+        if digits > 12:
+            raise UnitError("Accuracy {0} is not a decimal step".format(accuracy))
+    return digits
+
+def format_decimal(value, accuracy):
+    """Format an exact value rounded to a decimal accuracy (e.g. 0.001 -> 3 places)."""
+    accuracy = _accuracy(accuracy)
+    digits = _decimals(accuracy)
+    scaled = round_to(value, accuracy) * 10 ** digits  # an integer-valued Fraction
+    n = abs(scaled.numerator // scaled.denominator)
+    sign = u"-" if scaled < 0 and n else u""
+    text = u"{0}".format(n)
+    if digits:
+        text = text.rjust(digits + 1, u"0")
+        text = text[:-digits] + u"." + text[-digits:]
+    return sign + text
+
+def format_feet_inches(value_feet, accuracy=Fraction(1, 3072)):
+    """
+    Format decimal feet as feet and fractional inches, e.g. 12' - 6 1/2".
+    accuracy is in feet and must be 1/2^n of an inch (1/3072 ft = 1/256").
+    """
+    inch_step = _accuracy(accuracy) * 12
+    if inch_step.numerator != 1 or inch_step.denominator & (inch_step.denominator - 1):
+        raise UnitError("Fractional inch accuracy must be 1/2^n of an inch")
+
+    inches = round_to(_exact(value_feet) * 12, inch_step)
+    sign = u"-" if inches < 0 else u""
+    inches = abs(inches)
+    whole = inches.numerator // inches.denominator
+    feet, whole_in = divmod(whole, 12)
+    frac = inches - whole
+
+    text = u"{0}{1}' - {2}".format(sign, feet, whole_in)
+    if frac:
+        text += u" {0}/{1}".format(frac.numerator, frac.denominator)
+    return text + u'"'
+
+def format_length(value_feet, unit_key, accuracy=None):
+    """
+    Format decimal feet into a display unit the way Revit does for the
+    Calculator's FormatOptions (see module docstring).
+    """
+    if accuracy is None:
+        accuracy = accuracy_for(unit_key)
+    if unit_key == "fi":
+        return format_feet_inches(value_feet, accuracy)
+    return format_decimal(to_unit(value_feet, unit_key), accuracy)
+
+def formatter(unit_key, accuracy=None):
+    """A reusable single-unit formatter for bulk formatting."""
+    if accuracy is None:
+        accuracy = accuracy_for(unit_key)
+    accuracy = _accuracy(accuracy)
+    if unit_key == "fi":
+        return lambda value_feet: format_feet_inches(value_feet, accuracy)
+    factor = FEET_PER_UNIT[unit_key]
+    return lambda value_feet: format_decimal(_exact(value_feet) / factor, accuracy)
+
+# ---------------------------------------------------------------------------------
+# PARSING
+# ---------------------------------------------------------------------------------
+
+_NUMBER = r"\d+(?:\.\d*)?|\.\d+"
+_FRACTION = r"(?:(?P<{0}whole>\d+)\s+)?(?P<{0}num>\d+)\s*/\s*(?P<{0}den>\d+)|(?P<{0}dec>" + _NUMBER + r")"
+
+_FEET_INCHES_RE = re.compile(
+    r"^(?P<sign>[-+])?\s*"
+    r"(?:(?P<ft>" + _NUMBER + r")\s*(?:'|ft)\s*-?\s*)?"
+    r"(?:(?:" + _FRACTION.format("i") + r")\s*(?:\"|in))?$"
+)
+_VALUE_UNIT_RE = re.compile(
+    r"^(?P<sign>[-+])?\s*(?P<value>" + _NUMBER + r")\s*(?P<unit>mm|cm|m|ft|in|'|\")?$"
+)
+
+def _fraction_group(m, prefix):
+    if m.group(prefix + "dec") is not None:
+        return Fraction(m.group(prefix + "dec"))
+    if m.group(prefix + "num") is None:
+        return Fraction(0)
+    den = int(m.group(prefix + "den"))
+    if den == 0:
+        raise UnitError("Zero denominator")
+    value = Fraction(int(m.group(prefix + "num")), den)
+    if m.group(prefix + "whole"):
+        value += int(m.group(prefix + "whole"))
+    return value
+
+def parse_length(text, default_unit="ft"):
+    """
+    Parse a length string into exact decimal feet (a Fraction).
+
+    Accepts "1200mm", "1.2 m", "4ft", "12' - 6 1/2\\"", "12'6\\"", "6 1/2\\"",
+    "-1' - 6\\"" and plain numbers (interpreted in default_unit).
+    """
+    text = (text or u"").strip()
+    if not text:
+        raise UnitError("Empty length")
+
+    m = _VALUE_UNIT_RE.match(text)
+    if m:
+        value = to_feet(Fraction(m.group("value")), m.group("unit") or default_unit)
+        return -value if m.group("sign") == "-" else value
+
+    m = _FEET_INCHES_RE.match(text)
+    if m and (m.group("ft") or m.group("inum") or m.group("idec")):
+        value = Fraction(m.group("ft") or 0) + _fraction_group(m, "i") / 12
+        return -value if m.group("sign") == "-" else value
+
+    raise UnitError("Cannot parse length: {0}".format(text))
+
+# ---------------------------------------------------------------------------------
+# CONFORMANCE
+# ---------------------------------------------------------------------------------
+
+# Pinned Revit output for the Calculator's UNITS table:
+# (decimal feet, unit key, expected UnitFormatUtils.Format text)
+REVIT_REFERENCE = [
+    (0.0, "m", u"0.000"),
+    (1.0, "m", u"0.305"),
+    (10.0, "m", u"3.048"),
+    (100.0, "m", u"30.480"),
+    (-3.5, "m", u"-1.067"),
+    (1.0, "cm", u"30"),
+    (10.0, "cm", u"305"),
+    (-10.0, "cm", u"-305"),
+    (1.0, "mm", u"305"),
+    (10.0, "mm", u"3048"),
+    (1000.0, "mm", u"304800"),
+    (0.5, "mm", u"152"),
+    (12.5, "ft", u"12.50"),
+    (0.125, "ft", u"0.13"),
+    (-2.0, "ft", u"-2.00"),
+    (0.0, "fi", u"0' - 0\""),
+    (12.5, "fi", u"12' - 6\""),
+    (12.0 + 6.5 / 12, "fi", u"12' - 6 1/2\""),
+    (0.5 / 12, "fi", u"0' - 0 1/2\""),
+    (1.0 + 0.25 / 12, "fi", u"1' - 0 1/4\""),
+    (-1.5, "fi", u"-1' - 6\""),
+    (11.999 / 12, "fi", u"1' - 0\""),
+    (3.0 / 256 / 12, "fi", u"0' - 0 3/256\""),
+]
+
+def conformance_mismatches(format_fn=format_length, cases=REVIT_REFERENCE):
+    """
+    Compare a formatter against the pinned cases.
+    Returns a list of (value_feet, unit_key, expected, actual) for every mismatch.
+    """
+    mismatches = []
+    for value_feet, unit_key, expected in cases:
+        actual = format_fn(value_feet, unit_key)
+        if actual != expected:
+            mismatches.append((value_feet, unit_key, expected, actual))
+    return mismatches
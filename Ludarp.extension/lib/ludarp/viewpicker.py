@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+"""
+🔎 LUDARP Library: Type-Ahead View Picker
+Author: PRADUL P
+
+A WPF view/template picker for large models: a search box backed by the
+precomputed name index of the view records (ludarp.search), quick facets
+(templates or views, view type, sheet placement, template assigned) and a
+virtualized result list, so narrowing thousands of views stays instant while
+typing. Multi-pick rows carry check boxes that keep their state while the
+search and facets change.
+"""
+import os
+from pyrevit import forms
+
+XAML_PATH = os.path.join(os.path.dirname(__file__), "viewpicker.xaml")
+
+KIND_ALL, KIND_TEMPLATES, KIND_VIEWS = "🌍 Views & Templates", "⭐ Templates", "📄 Views"
+TYPE_ALL = "📁 All View Types"
+SHEET_ANY, SHEET_ON, SHEET_OFF = "🗂️ Any Placement", "On a Sheet", "Not on a Sheet"
+TEMPLATE_ANY, TEMPLATE_SET, TEMPLATE_NONE = "🎨 Any Template", "Template Assigned", "No Template"
+
+class ViewPickItem(forms.TemplateListItem):
+    """List row for a view record (name = emoji label, checked = multi-pick state)."""
+    def __init__(self, record):
+        forms.TemplateListItem.__init__(self, record, checkable=True, name_attr="label")
+        self.record = record
+
+class ViewPickerWindow(forms.WPFWindow):
+    def __init__(self, view_index, title, multiselect=False, exclude_id=None):
+        forms.WPFWindow.__init__(self, XAML_PATH)
+        self.Title = "LUDARP: " + title
+        self.HeaderText.Text = title
+        self.multiselect = multiselect
+        self.exclude_id = exclude_id
+        self.index = view_index.search_index()
+        self.items = dict((id(r), ViewPickItem(r)) for r in self.index.items)
+        self.shown = []
+        self.result = None
+
+        # Facets
+        self._set_choices(self.KindFacet, [KIND_ALL, KIND_TEMPLATES, KIND_VIEWS])
+        self._set_choices(self.TypeFacet, [TYPE_ALL] + view_index.type_labels())
+        self._set_choices(self.SheetFacet, [SHEET_ANY, SHEET_ON, SHEET_OFF])
+        self._set_choices(self.TemplateFacet, [TEMPLATE_ANY, TEMPLATE_SET, TEMPLATE_NONE])
+        for facet in (self.KindFacet, self.TypeFacet, self.SheetFacet, self.TemplateFacet):
+            facet.SelectionChanged += self.refresh
+
+        self.ViewList.ItemTemplate = self.FindResource("CheckItem" if multiselect else "PlainItem")
+        if multiselect:
+            from System.Windows import RoutedEventHandler
+            from System.Windows.Controls.Primitives import ButtonBase
+            self.ViewList.AddHandler(ButtonBase.ClickEvent, RoutedEventHandler(self.row_checked))
+        else:
+            self.CheckShownBtn.Visibility = self.UncheckAllBtn.Visibility = self._collapsed()
+            self.ViewList.MouseDoubleClick += self.accept
+
+        # Events
+        self.SearchBox.TextChanged += self.refresh
+        self.SearchBox.PreviewKeyDown += self.search_key
+        self.CheckShownBtn.Click += self.check_shown
+        self.UncheckAllBtn.Click += self.uncheck_all
+        self.OkBtn.Click += self.accept
+        self.CancelBtn.Click += self.cancel
+
+        self.refresh()
+        self.SearchBox.Focus()
+
+    @staticmethod
+    def _collapsed():
+        from System.Windows import Visibility
+        return Visibility.Collapsed
+
+    @staticmethod
+    def _set_choices(combo, choices):
+        combo.ItemsSource = choices
+        combo.SelectedIndex = 0
+
+    # ---- Filtering ----
+    def _allowed(self):
+        kind = self.KindFacet.SelectedItem
+        vtype = self.TypeFacet.SelectedItem
+        sheet = self.SheetFacet.SelectedItem
+        template = self.TemplateFacet.SelectedItem
+        exclude = self.exclude_id
+        checks = []
+        if exclude is not None:
+            checks.append(lambda r: r.view.Id != exclude)
+        if kind == KIND_TEMPLATES:
+            checks.append(lambda r: r.is_template)
+        elif kind == KIND_VIEWS:
+            checks.append(lambda r: not r.is_template)
+        if vtype and vtype != TYPE_ALL:
+            checks.append(lambda r: not r.is_template and r.type_label == vtype)
+        if sheet == SHEET_ON:
+            checks.append(lambda r: r.on_sheet)
+        elif sheet == SHEET_OFF:
+            checks.append(lambda r: not r.on_sheet)
+        if template == TEMPLATE_SET:
+            checks.append(lambda r: r.has_template)
+        elif template == TEMPLATE_NONE:
+            checks.append(lambda r: not r.is_template and not r.has_template)
+        if not checks:
+            return None
+        return lambda r: all(check(r) for check in checks)
+
+    def refresh(self, sender=None, e=None):
+        records = self.index.search(self.SearchBox.Text or "", allowed=self._allowed())
+        self.shown = [self.items[id(r)] for r in records]
+        self.ViewList.ItemsSource = self.shown
+        if self.shown and not self.multiselect:
+            self.ViewList.SelectedIndex = 0
+        self._update_count()
+
+    def _update_count(self):
+        text = "{:,} of {:,} shown".format(len(self.shown), len(self.items))
+        if self.multiselect:
+            text += " · {:,} checked".format(sum(1 for i in self.items.values() if i.checked))
+        self.CountText.Text = text
+
+    # ---- Events ----
+    def search_key(self, sender, e):
+        from System.Windows.Input import Key
+        if e.Key == Key.Down and self.shown:
+            # Continue with the arrow keys in the list
+            if self.ViewList.SelectedIndex < 0:
+                self.ViewList.SelectedIndex = 0
+            self.ViewList.Focus()
+            e.Handled = True
+        elif e.Key == Key.Enter:
+            self.accept()
+            e.Handled = True
+
+    def row_checked(self, sender, e):
+        self._update_count()
+
+    def check_shown(self, sender, e):
+        for item in self.shown:
+            item.checked = True
+        self._update_count()
+
+    def uncheck_all(self, sender, e):
+        for item in self.items.values():
+            item.checked = False
+        self._update_count()
+
+    def accept(self, sender=None, e=None):
+        if self.multiselect:
+            checked = [r for r in self.index.items if self.items[id(r)].checked]
+            if not checked and self.ViewList.SelectedItems.Count:
+                checked = [i.record for i in self.ViewList.SelectedItems]
+            self.result = [r.view for r in checked] or None
+        else:
+            selected = self.ViewList.SelectedItem
+            self.result = selected.record.view if selected is not None else None
+        if self.result is not None:
+            self.Close()
+
+    def cancel(self, sender=None, e=None):
+        self.result = None
+        self.Close()
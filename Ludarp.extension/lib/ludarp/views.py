@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+"""
+🗂️ LUDARP Library: View Index
+Author: PRADUL P
+
+Collects the document's views once per run and builds the categorized,
+emoji-labelled view lists shown by the pickers, plus the searchable view
+records (with sheet placement and template facets) behind the type-ahead
+view picker. Sheets, viewports and sheet sets behind the sheet-scoped target
+selectors are indexed on demand (see ludarp.sheets).
+"""
+from collections import OrderedDict
+from Autodesk.Revit.DB import FilteredElementCollector, View, ViewType, Viewport, ElementId
+from ludarp import metrics
+from ludarp.compat import id_value
+
+# View types supported for filter processing
+VALID_VIEW_TYPES = [
+    ViewType.FloorPlan, ViewType.CeilingPlan, ViewType.Elevation,
+    ViewType.ThreeD, ViewType.Section, ViewType.Detail,
+    ViewType.EngineeringPlan, ViewType.AreaPlan
+]
+
+def view_type_label(view):
+    """Clean view type label, e.g. 'FloorPlan' or '3D'."""
+    return str(view.ViewType).replace("ViewType.", "").replace("ThreeD", "3D")
+
+class ViewItem(object):
+    """Wrapper class for Revit View elements to display with custom labels/emojis."""
+    def __init__(self, view):
+        self.view = view
+        self.Id = view.Id
+        # Premium labeling based on whether it's a template or a specific view type
+        if view.IsTemplate:
+            self.Name = "   🎨 [Template] " + view.Name
+        else:
+            self.Name = "   📄 [" + view_type_label(view) + "] " + view.Name
+
+class SeparatorItem(object):
+    """Used to create non-clickable category headers in the selection list."""
+    def __init__(self, title):
+        self.Name = "💠 " + title.upper() + " 💠"
+        self.view = None
+        self.Id = None
+
+def build_view_dict(all_views, exclude_id=None):
+    """
+    Builds a categorized and searchable dictionary of views for pyRevit's UI.
+
+    Returns:
+        OrderedDict: Categorized views (Templates, Plans, Sections, etc.)
+    """
+    all_valid = []
+    templates = []
+    by_type = {}
+
+    for v in all_views:
+        # Exclude the source view if we are picking targets
+        if exclude_id and v.Id == exclude_id:
+            continue
+
+        if v.IsTemplate:
+            templates.append(ViewItem(v))
+        elif v.ViewType in VALID_VIEW_TYPES:
+            item = ViewItem(v)
+            # Create a category name (e.g., "📁 Floor Plans")
+            cat_name = "📁 " + view_type_label(v) + "s"
+            if cat_name not in by_type:
+                by_type[cat_name] = []
+            by_type[cat_name].append(item)
+
+    # Sort templates and each category alphabetically
+    templates.sort(key=lambda x: x.Name)
+    for cat in by_type:
+        by_type[cat].sort(key=lambda x: x.Name)
+
+    # Construct the master list with visual separators
+    if templates:
+        all_valid.append(SeparatorItem("VIEW TEMPLATES"))
+        all_valid.extend(templates)
+
+    for cat in sorted(by_type.keys()):
+        if by_type[cat]:
+            all_valid.append(SeparatorItem(cat.replace("📁 ", "")))
+            all_valid.extend(by_type[cat])
+
+    # Map data to the pyRevit SelectFromList tabs
+    d = OrderedDict()
+    d[" 🌍 ALL VIEWS & TEMPLATES"] = all_valid
+    d["⭐ VIEW TEMPLATES"] = templates
+    for cat in sorted(by_type.keys()):
+        d[cat] = by_type[cat]
+    return d
+
+class ViewRecord(object):
+    """A pickable view with its search facets."""
+    __slots__ = ("view", "name", "type_label", "is_template", "on_sheet", "has_template")
+
+    def __init__(self, view, on_sheet):
+        self.view = view
+        self.name = view.Name
+        self.type_label = view_type_label(view)
+        self.is_template = view.IsTemplate
+        self.on_sheet = on_sheet
+        template_id = getattr(view, "ViewTemplateId", None)
+        self.has_template = template_id is not None and template_id != ElementId.InvalidElementId
+
+    @property
+    def label(self):
+        if self.is_template:
+            return "🎨 [Template] " + self.name
+        return "📄 [" + self.type_label + "] " + self.name
+
+class ViewIndex(object):
+    """All views of a document, collected in one sweep and reused by every picker."""
+    def __init__(self, doc):
+        self.doc = doc
+        with metrics.phase("collect"):
+            self.views = list(FilteredElementCollector(doc).OfClass(View))
+        metrics.count("FilteredElementCollector")
+        self.by_id = dict((id_value(v.Id), v) for v in self.views)
+        self._viewports = None
+        self._placed = None
+        self._records = None
+        self._search = None
+        self._dependents = None
+        self._sheets = None
+
+    def templates(self):
+        return [v for v in self.views if v.IsTemplate]
+
+    def view_dict(self, exclude_id=None):
+        return build_view_dict(self.views, exclude_id)
+
+    def viewports(self):
+        """(sheet id value, view id value) of every viewport (one Viewport sweep, cached)."""
+        if self._viewports is None:
+            with metrics.phase("collect"):
+                self._viewports = [(id_value(vp.SheetId), id_value(vp.ViewId))
+                                   for vp in FilteredElementCollector(self.doc).OfClass(Viewport)]
+            metrics.count("FilteredElementCollector")
+        return self._viewports
+
+    def placed_view_ids(self):
+        """Id values of the views placed on sheets."""
+        if self._placed is None:
+            self._placed = set(view_id for _sheet_id, view_id in self.viewports())
+        return self._placed
+
+    def dependent_views(self, template):
+        """Views that use a view template (one pass over the views, cached)."""
+        if self._dependents is None:
+            dependents = {}
+            for v in self.views:
+                template_id = getattr(v, "ViewTemplateId", None)
+                if not v.IsTemplate and template_id is not None and template_id != ElementId.InvalidElementId:
+                    dependents.setdefault(id_value(template_id), []).append(v)
+            self._dependents = dependents
+        return self._dependents.get(id_value(template.Id), [])
+
+    def governing_templates(self, views):
+        """The distinct templates assigned to views, in first-use order (templates stay themselves)."""
+        templates = OrderedDict()
+        for v in views:
+            if v.IsTemplate:
+                templates[id_value(v.Id)] = v
+                continue
+            template_id = getattr(v, "ViewTemplateId", None)
+            if template_id is not None and template_id != ElementId.InvalidElementId:
+                template = self.by_id.get(id_value(template_id))
+                if template is not None:
+                    templates[id_value(template_id)] = template
+        return list(templates.values())
+
+    def records(self):
+        """
+        ViewRecords of the pickable views: templates first, then views by type
+        and name (the same set the categorized lists show).
+        """
+        if self._records is None:
+            placed = self.placed_view_ids()
+            records = [ViewRecord(v, id_value(v.Id) in placed) for v in self.views
+                       if v.IsTemplate or v.ViewType in VALID_VIEW_TYPES]
+            records.sort(key=lambda r: (not r.is_template, r.type_label, r.name))
+            self._records = records
+        return self._records
+
+    def search_index(self):
+        """Type-ahead name index over records() (built once)."""
+        if self._search is None:
+            from ludarp.search import SearchIndex
+            self._search = SearchIndex(self.records(), key=lambda r: r.name)
+        return self._search
+
+    def sheet_index(self):
+        """Sheets, viewports and sheet sets for the sheet target selectors (built once)."""
+        if self._sheets is None:
+            from ludarp.sheets import SheetIndex
+            self._sheets = SheetIndex(self)
+        return self._sheets
+
+    def type_labels(self):
+        return sorted(set(r.type_label for r in self.records() if not r.is_template))
+
+_INDEXES = {}
+
+def get_view_index(doc, refresh=False):
+    """View index for the document (built once per run unless refresh=True)."""
+    key = (doc.Title, doc.PathName)
+    index = _INDEXES.get(key)
+    if index is None or refresh:
+        index = _INDEXES[key] = ViewIndex(doc)
+    return index
+
+def forget_view_index(doc):
+    """Drop the cached index of a document (before it is closed)."""
+    _INDEXES.pop((doc.Title, doc.PathName), None)
@@ -0,0 +1,306 @@
+# -*- coding: utf-8 -*-
+"""
+⏱️ LUDARP Dev: Filter Tools Throughput Benchmark
+Author: PRADUL P
+
+Runs the FilterOverride operations from ludarp.overrides and the view index
+build against the in-memory Revit stand-in (fakerevit.py) and reports wall time
+and Revit API call counts per case.
+
+    python dev/bench_filters.py                          # 10k views x 200 filters
+    python dev/bench_filters.py --views 1000 --filters 50
+    python dev/bench_filters.py --out bench.json         # save results
+    python dev/bench_filters.py --baseline bench.json    # compare, exit 1 on regression
+
+API call counts are deterministic, so any change in them against a baseline is
+reported as a regression; wall time regresses when it exceeds the baseline by
+more than --tolerance (default 25%).
+"""
+import os
+import io
+import sys
+import json
+import time
+import shutil
+import tempfile
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, HERE)
+sys.path.insert(0, os.path.join(os.path.dirname(HERE), "Ludarp.extension", "lib"))
+
+import fakerevit
+fakerevit.install()
+
+from Autodesk.Revit.DB import Color, FilteredElementCollector, FillPatternElement, View, ViewType
+from ludarp.views import ViewIndex
+from ludarp.overrides import (
+    copy_filters_between_views, copy_overrides_to_filters, recolor_filters, reset_filters
+)
+from ludarp import batch, matchcounts, snapshots, standards, spreadsheet
+
+# ---------------------------------------------------------------------------------
+# CASES (each returns the number of operations it performed)
+# ---------------------------------------------------------------------------------
+
+def case_view_index(doc, ctx):
+    """Collect all views and build the categorized picker dictionary."""
+    index = ViewIndex(doc)
+    index.view_dict()
+    return len(index.views)
+
+def case_view_search(doc, ctx):
+    """Type-ahead picker: build the name index, then run every keystroke of a few queries."""
+    index = ViewIndex(doc).search_index()
+    queries = 0
+    for text in ("view 0042", "00 vi", "template 01", "plan", "zzz"):
+        for n in range(1, len(text) + 1):
+            index.search(text[:n], allowed=lambda r: not r.is_template or r.on_sheet)
+            queries += 1
+    return queries
+
+def case_sheet_targets(doc, ctx):
+    """Sheet target selectors: ranges, patterns and the sheet set, as views and as their templates."""
+    sheets = ViewIndex(doc).sheet_index()
+    last = sheets.sheets[-1].SheetNumber
+    selectors = [{"sheets": "A-101..A-120"}, {"sheets": ["A-1*", "A-105"]}, {"sheet_set": "Issue Set"},
+                 {"sheets": "A-101.." + last, "apply_to": "templates"}]
+    return sum(len(sheets.resolve(selector)) for selector in selectors)
+
+def case_snapshot(doc, ctx):
+    """Snapshot every target x source filter pair before Copy Between Views."""
+    ctx["snapshot"] = snapshots.capture(
+        doc, "Copy Between Views", ctx["targets"], ctx["filter_ids"], store=ctx["store"])
+    return ctx["snapshot"]["pairs"]
+
+def case_copy_between(doc, ctx):
+    """Copy Between Views: every filter of the source template to every other view."""
+    copy_filters_between_views(doc, ctx["source"], ctx["targets"], ctx["filter_ids"])
+    return len(ctx["targets"]) * len(ctx["filter_ids"])
+
+def case_copy_specific(doc, ctx):
+    """Copy Specific Overrides: one source filter's fills and lines onto all others."""
+    fids = ctx["filter_ids"]
+    copy_overrides_to_filters(
+        doc, ctx["source"], fids[0], fids[1:],
+        ["Projection Lines", "Projection Fills", "Cut Fills", "Halftone"]
+    )
+    return len(fids) - 1
+
+def case_copy_all(doc, ctx):
+    """Copy Specific Overrides with "Copy ALL"."""
+    fids = ctx["filter_ids"]
+    copy_overrides_to_filters(doc, ctx["source"], fids[0], fids[1:], ["Copy ALL"])
+    return len(fids) - 1
+
+def case_change_colors(doc, ctx):
+    """Change Colors: recolor every filter of every view that carries filters."""
+    pattern = FilteredElementCollector(doc).OfClass(FillPatternElement).ToElements()[0]
+    count = 0
+    for view in ctx["targets"]:
+        fids = list(view.GetFilters())
+        recolor_filters(doc, view, fids, "Projection", Color(255, 0, 0), pattern.Id)
+        count += len(fids)
+    return count
+
+def case_reset(doc, ctx):
+    """Reset Filters: clear the overrides of every filter of every view."""
+    count = 0
+    for view in ctx["targets"]:
+        fids = list(view.GetFilters())
+        reset_filters(doc, view, fids)
+        count += len(fids)
+    return count
+
+def case_restore(doc, ctx):
+    """Restore the Copy Between Views snapshot (minimal diff, one transaction)."""
+    if "snapshot" not in ctx:
+        return 0
+    changed, _skipped = snapshots.restore(doc, ctx["snapshot"], ctx["store"], snapshot_first=False)
+    return changed
+
+def case_standard(doc, ctx):
+    """Graphics Standard: match a standard against every template and apply the diff."""
+    standard = standards.Standard({"rules": [
+        {"filter": "Filter 00*", "visible": True, "surface_color": "#C8C8C8", "projection_line_weight": 3},
+        {"filter": "re:5$", "halftone": True, "transparency": 50},
+        {"filter": "*", "surface_pattern": "Pattern 01", "cut_line_pattern": "Dash"},
+    ]})
+    plan = standards.plan(doc, standard)
+    standards.apply(doc, plan, snapshot=False)
+    return len(plan.actions)
+
+def case_sheet_export(doc, ctx):
+    """Export / Import: stream every template filter override to a TSV file."""
+    ctx["sheet"] = os.path.join(ctx["store"].folder, "overrides.tsv")
+    if not os.path.isdir(ctx["store"].folder):
+        os.makedirs(ctx["store"].folder)
+    return spreadsheet.export_overrides(doc, ctx["sheet"])
+
+def case_sheet_import(doc, ctx):
+    """Export / Import: diff the exported sheet against the model (no changes expected)."""
+    if "sheet" not in ctx:
+        return 0
+    plan = spreadsheet.plan_import(doc, ctx["sheet"])
+    if plan.actions or plan.problems:
+        # The sheet was just exported, so it must round-trip unchanged
+        raise RuntimeError("Import of the exported sheet planned {0} action(s), {1} problem(s)".format(
+            len(plan.actions), len(plan.problems)))
+    spreadsheet.apply_import(doc, plan, snapshot=False)
+    return plan.rows
+
+BATCH_MODELS = 20
+
+def case_batch(doc, ctx):
+    """Batch runner: open, replay three profiles, save as and close a folder of small models."""
+    folder = os.path.join(ctx["store"].folder, "models")
+    out = os.path.join(ctx["store"].folder, "out")
+    os.makedirs(folder)
+    for i in range(BATCH_MODELS):
+        path = os.path.join(folder, "Model {0:02d}.rvt".format(i))
+        open(path, "wb").close()
+        fakerevit.MODEL_FILES[path] = {"workshared": i % 2 == 0}
+    standard_path = os.path.join(ctx["store"].folder, "standard.json")
+    standards.write_standard({"rules": [{"filter": "*", "halftone": True}]}, standard_path)
+    profile_list = [
+        {"name": "Sync", "operation": "copy_between", "source": {"name": "Template 000"},
+         "targets": {"kind": "views", "pattern": "View 000*"}, "filters": {"pattern": "Filter 000*"}},
+        {"name": "Reset", "operation": "reset", "targets": {"kind": "templates"}, "filters": {"pattern": "*"}},
+        {"name": "Standard", "operation": "standard", "standard": standard_path},
+    ]
+    app = fakerevit.Application()
+    results = batch.run_batch(app, batch.collect_models([folder]), profile_list, output_folder=out)
+    if app.Documents or any(r["status"] != "ok" for r in results):
+        raise RuntimeError("Batch left {0} document(s) open or failed".format(len(app.Documents)))
+    return len(results)
+
+def case_match_counts(doc, ctx):
+    """Filter Usage: count every source filter in 20 views of 5,000 elements, then again from the cache."""
+    views = [v for v in ctx["targets"] if not v.IsTemplate][:20]
+    fakerevit.add_elements(doc, 5000, views=views)
+    filters = [doc.GetElement(fid) for fid in ctx["filter_ids"]]
+    cache = matchcounts.MatchCountCache()
+    for _ in range(2):
+        for view in views:
+            for f in filters:
+                matchcounts.count_matches(doc, view, f, cache)
+    return len(cache)
+
+# Order matters: copy_between runs first so the later cases work on full views,
+# and restore undoes everything since the snapshot
+CASES = [
+    ("view_index", case_view_index),
+    ("view_search", case_view_search),
+    ("sheet_targets", case_sheet_targets),
+    ("snapshot", case_snapshot),
+    ("copy_between", case_copy_between),
+    ("copy_specific", case_copy_specific),
+    ("copy_all", case_copy_all),
+    ("change_colors", case_change_colors),
+    ("reset", case_reset),
+    ("restore", case_restore),
+    ("standard", case_standard),
+    ("sheet_export", case_sheet_export),
+    ("sheet_import", case_sheet_import),
+    ("batch", case_batch),
+    ("match_counts", case_match_counts),   # adds model elements: keep last
+]
+
+# ---------------------------------------------------------------------------------
+# RUNNER
+# ---------------------------------------------------------------------------------
+
+def run(views, filters, only=None):
+    build_start = time.time()
+    doc = fakerevit.build_model(views=views, filters=filters)
+    build_s = time.time() - build_start
+
+    all_views = [v for v in FilteredElementCollector(doc).OfClass(View) if v.ViewType != ViewType.DrawingSheet]
+    source = all_views[0]
+    store_root = tempfile.mkdtemp(prefix="ludarp_bench_")
+    ctx = {
+        "source": source,
+        "targets": all_views[1:],
+        "filter_ids": list(source.GetFilters()),
+        "store": snapshots.SnapshotStore(doc, root=store_root),
+    }
+
+    results = []
+    for name, fn in CASES:
+        if only and name not in only:
+            continue
+        fakerevit.reset_calls()
+        start = time.time()
+        ops = fn(doc, ctx)
+        elapsed = time.time() - start
+        calls = fakerevit.calls_snapshot()
+        results.append({
+            "case": name,
+            "ops": ops,
+            "wall_ms": round(elapsed * 1000, 1),
+            "api_calls": sum(calls.values()),
+            "calls": calls,
+        })
+    shutil.rmtree(store_root, ignore_errors=True)
+    return {"views": views, "filters": filters, "build_ms": round(build_s * 1000, 1), "results": results}
+
+def print_report(report, verbose=False):
+    print("Filter tools benchmark: {0} views x {1} filters (model built in {2} ms)".format(
+        report["views"], report["filters"], report["build_ms"]))
+    print("{0:<16} {1:>10} {2:>12} {3:>12} {4:>12}".format("Case", "Ops", "Wall ms", "API calls", "us/op"))
+    for r in report["results"]:
+        per_op = r["wall_ms"] * 1000.0 / r["ops"] if r["ops"] else 0.0
+        print("{0:<16} {1:>10} {2:>12} {3:>12} {4:>12.2f}".format(
+            r["case"], r["ops"], r["wall_ms"], r["api_calls"], per_op))
+        if verbose:
+            for call, n in sorted(r["calls"].items(), key=lambda kv: -kv[1]):
+                print("    {0:<44} {1:>10}".format(call, n))
+
+def compare(report, baseline, tolerance):
+    """Regression messages against a baseline report of the same scale."""
+    problems = []
+    if (report["views"], report["filters"]) != (baseline["views"], baseline["filters"]):
+        return ["Baseline scale differs ({0} x {1}); rerun with the same --views/--filters".format(
+            baseline["views"], baseline["filters"])]
+    base = dict((r["case"], r) for r in baseline["results"])
+    for r in report["results"]:
+        b = base.get(r["case"])
+        if b is None:
+            continue
+        if r["calls"] != b["calls"]:
+            changed = sorted(set(r["calls"]) | set(b["calls"]))
+            diffs = ["{0}: {1} -> {2}".format(c, b["calls"].get(c, 0), r["calls"].get(c, 0))
+                     for c in changed if b["calls"].get(c, 0) != r["calls"].get(c, 0)]
+            problems.append("{0}: API calls changed ({1})".format(r["case"], "; ".join(diffs)))
+        if b["wall_ms"] and r["wall_ms"] > b["wall_ms"] * (1 + tolerance):
+            problems.append("{0}: {1} ms vs baseline {2} ms".format(r["case"], r["wall_ms"], b["wall_ms"]))
+    return problems
+
+def _arg(args, flag, default=None):
+    return args[args.index(flag) + 1] if flag in args else default
+
+def main(args):
+    views = int(_arg(args, "--views", 10000))
+    filters = int(_arg(args, "--filters", 200))
+    only = _arg(args, "--cases")
+    report = run(views, filters, only.split(",") if only else None)
+    print_report(report, verbose="--verbose" in args)
+
+    out = _arg(args, "--out")
+    if out:
+        with io.open(out, "wb") as f:
+            f.write(json.dumps(report, indent=2, sort_keys=True).encode("utf-8"))
+
+    baseline_path = _arg(args, "--baseline")
+    if baseline_path:
+        with io.open(baseline_path, encoding="utf-8") as f:
+            baseline = json.load(f)
+        problems = compare(report, baseline, float(_arg(args, "--tolerance", 0.25)))
+        for p in problems:
+            print("REGRESSION " + p)
+        if problems:
+            return 1
+        print("No regressions against {0}".format(baseline_path))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
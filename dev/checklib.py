@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""
+✅ LUDARP Dev: Check Helpers
+Author: PRADUL P
+
+The PASS/FAIL harness shared by the dev checks, and the fixtures more than
+one of them compares models with:
+
+    from checklib import check, finish
+
+    check("restore: same actions", serial == pooled, "{0} actions".format(n))
+    ...
+    sys.exit(finish())
+
+Importing this module loads nothing from Revit; model_state() imports the
+stand-in names it needs when called, after fakerevit.install().
+"""
+import os
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+LIB = os.path.join(os.path.dirname(HERE), "Ludarp.extension", "lib")
+if LIB not in sys.path:
+    sys.path.insert(0, LIB)
+
+# Labels of the failed checks, in order
+FAILURES = []
+
+def check(label, ok, detail=""):
+    print("{0} {1}{2}".format("PASS" if ok else "FAIL", label, "  ({0})".format(detail) if detail else ""))
+    if not ok:
+        FAILURES.append(label)
+
+def finish():
+    """Print the failure count; returns the process exit code."""
+    print("\n{0} failure(s)".format(len(FAILURES)))
+    return 1 if FAILURES else 0
+
+def model_state(doc):
+    """Fingerprint of every view's filter overrides (sheets excluded), by view name."""
+    from Autodesk.Revit.DB import FilteredElementCollector, View, ViewType
+    from ludarp.overridestore import collect_views
+
+    views = sorted(FilteredElementCollector(doc).OfClass(View), key=lambda v: v.Name)
+    return collect_views(v for v in views if v.ViewType != ViewType.DrawingSheet).fingerprint()
@@ -0,0 +1,750 @@
+# -*- coding: utf-8 -*-
+"""
+🧪 LUDARP Dev: In-Memory Revit API Stand-In
+Author: PRADUL P
+
+A small, counted imitation of the Revit API subset used by the LUDARP library
+(views, parameter filters, filter overrides, collectors, transactions, fill
+patterns and opening/saving model files through Application), so the sync
+logic can be exercised and timed on any machine:
+
+    import fakerevit
+    fakerevit.install()                 # registers Autodesk.Revit.* in sys.modules
+    doc = fakerevit.build_model(views=1000, filters=200)
+
+    from ludarp.overrides import reset_filters
+    fakerevit.reset_calls()
+    reset_filters(doc, view, view.GetFilters())
+    print(fakerevit.CALLS)              # Counter({"View.SetFilterOverrides": 200, ...})
+
+Behaviour mirrors Revit where the scripts depend on it: getters return copies
+(GetFilterOverrides, GetFilters), modifying a document outside a transaction
+raises, and SetFilterOverrides on a filter not added to the view raises.
+Nothing here is used at runtime inside Revit.
+"""
+import sys
+import types
+from collections import Counter
+
+# API calls by "Class.Method" since the last reset_calls()
+CALLS = Counter()
+
+def reset_calls():
+    CALLS.clear()
+
+def calls_snapshot():
+    """Plain dict copy of the counters, sorted by name."""
+    return dict(sorted(CALLS.items()))
+
+class InvalidOperationException(Exception):
+    pass
+
+class ArgumentException(Exception):
+    pass
+
+class OperationCanceledException(Exception):
+    pass
+
+class FileNotFoundException(Exception):
+    pass
+
+# ---------------------------------------------------------------------------------
+# VALUES
+# ---------------------------------------------------------------------------------
+
+class _EnumValue(object):
+    def __init__(self, owner, name):
+        self.owner = owner
+        self.name = name
+
+    def __str__(self):
+        return self.name
+
+    def __repr__(self):
+        return "{0}.{1}".format(self.owner, self.name)
+
+def _enum(owner, names):
+    return type(owner, (object,), dict((n, _EnumValue(owner, n)) for n in names))
+
+ViewType = _enum("ViewType", [
+    "FloorPlan", "CeilingPlan", "Elevation", "ThreeD", "Section", "Detail",
+    "EngineeringPlan", "AreaPlan", "DrawingSheet", "Schedule", "Legend"
+])
+StorageType = _enum("StorageType", ["None", "Integer", "Double", "String", "ElementId"])
+BuiltInParameter = _enum("BuiltInParameter", [
+    "LEVEL_ELEV", "INSTANCE_ELEVATION_PARAM", "INSTANCE_FREE_HOST_OFFSET_PARAM"
+])
+UnitTypeId = _enum("UnitTypeId", [
+    "Meters", "Centimeters", "Millimeters", "Feet", "FeetFractionalInches"
+])
+SpecTypeId = _enum("SpecTypeId", ["Length"])
+ObjectType = _enum("ObjectType", ["Element", "PointOnElement"])
+ViewDetailLevel = _enum("ViewDetailLevel", ["Undefined", "Coarse", "Medium", "Fine"])
+FillPatternTarget = _enum("FillPatternTarget", ["Drafting", "Model"])
+DetachFromCentralOption = _enum("DetachFromCentralOption", [
+    "DoNotDetach", "DetachAndPreserveWorksets", "DetachAndDiscardWorksets"
+])
+WorksetConfigurationOption = _enum("WorksetConfigurationOption", [
+    "OpenAllWorksets", "CloseAllWorksets", "OpenLastViewed"
+])
+
+class ElementId(object):
+    __slots__ = ("IntegerValue",)
+
+    def __init__(self, value):
+        self.IntegerValue = value
+
+    @property
+    def Value(self):
+        return self.IntegerValue
+
+    def __eq__(self, other):
+        return isinstance(other, ElementId) and other.IntegerValue == self.IntegerValue
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash(self.IntegerValue)
+
+    def __repr__(self):
+        return str(self.IntegerValue)
+
+ElementId.InvalidElementId = ElementId(-1)
+
+class Color(object):
+    def __init__(self, red, green, blue, valid=True):
+        self.Red, self.Green, self.Blue = red, green, blue
+        self.IsValid = valid
+
+    def __eq__(self, other):
+        return (isinstance(other, Color) and other.IsValid == self.IsValid and
+                (self.Red, self.Green, self.Blue) == (other.Red, other.Green, other.Blue))
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+Color.InvalidColorValue = Color(0, 0, 0, valid=False)
+
+class IdCollection(list):
+    """ICollection<ElementId> stand-in (a fresh copy per call, as in Revit)."""
+    def Contains(self, item):
+        CALLS["ICollection.Contains"] += 1
+        return item in self
+
+    @property
+    def Count(self):
+        return len(self)
+
+# Properties of OverrideGraphicSettings and their defaults
+_NO_COLOR = Color.InvalidColorValue
+_NO_ID = ElementId.InvalidElementId
+OGS_PROPERTIES = {
+    "ProjectionLineColor": _NO_COLOR, "ProjectionLinePatternId": _NO_ID,
+    "ProjectionLineWeight": -1,
+    "CutLineColor": _NO_COLOR, "CutLinePatternId": _NO_ID, "CutLineWeight": -1,
+    "SurfaceForegroundPatternId": _NO_ID, "SurfaceForegroundPatternColor": _NO_COLOR,
+    "SurfaceBackgroundPatternId": _NO_ID, "SurfaceBackgroundPatternColor": _NO_COLOR,
+    "CutForegroundPatternId": _NO_ID, "CutForegroundPatternColor": _NO_COLOR,
+    "CutBackgroundPatternId": _NO_ID, "CutBackgroundPatternColor": _NO_COLOR,
+    "SurfaceTransparency": 0, "Halftone": False, "DetailLevel": ViewDetailLevel.Undefined,
+}
+
+class OverrideGraphicSettings(object):
+    """Property bag with Revit's Set<Property>(value) setters (which return self)."""
+    def __init__(self, other=None):
+        CALLS["OverrideGraphicSettings.new"] += 1
+        self._values = dict(other._values) if other is not None else {}
+
+    def __eq__(self, other):
+        return isinstance(other, OverrideGraphicSettings) and self._values == other._values
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+def _ogs_property(name, default):
+    def _get(self):
+        return self._values.get(name, default)
+
+    def _set(self, value):
+        CALLS["OverrideGraphicSettings.Set"] += 1
+        self._values[name] = value
+        return self
+    return property(_get), _set
+
+# Class-level properties and setters, as on the Revit type (ludarp.compat probes the class)
+for _name, _default in OGS_PROPERTIES.items():
+    _getter, _setter = _ogs_property(_name, _default)
+    setattr(OverrideGraphicSettings, _name, _getter)
+    setattr(OverrideGraphicSettings, "Set" + _name, _setter)
+
+# ---------------------------------------------------------------------------------
+# ELEMENTS
+# ---------------------------------------------------------------------------------
+
+class Element(object):
+    def __init__(self, doc, name):
+        self.Document = doc
+        self.Name = name
+        self.Category = None
+        self.Id = doc._add(self)
+
+    def GetTypeId(self):
+        return ElementId.InvalidElementId
+
+    def GetType(self):
+        return _NetType(type(self))
+
+class _NetType(object):
+    """The System.Type of an element: only its Name is used."""
+    def __init__(self, cls):
+        self.Name = cls.__name__
+
+class View(Element):
+    def __init__(self, doc, name, view_type=ViewType.FloorPlan, is_template=False):
+        Element.__init__(self, doc, name)
+        self.ViewType = view_type
+        self.IsTemplate = is_template
+        self.ViewTemplateId = ElementId.InvalidElementId
+        self._filters = {}      # filter id -> OverrideGraphicSettings or None (default)
+        self._visible = {}      # filter id -> bool
+        self._order = []
+
+    def GetFilters(self):
+        CALLS["View.GetFilters"] += 1
+        return IdCollection(self._order)
+
+    def AddFilter(self, fid):
+        CALLS["View.AddFilter"] += 1
+        self.Document._check_modifiable()
+        if fid in self._filters:
+            raise ArgumentException("Filter already applied to the view")
+        self._filters[fid] = None
+        self._visible[fid] = True
+        self._order.append(fid)
+
+    def RemoveFilter(self, fid):
+        CALLS["View.RemoveFilter"] += 1
+        self.Document._check_modifiable()
+        self._require(fid)
+        del self._filters[fid]
+        del self._visible[fid]
+        self._order.remove(fid)
+
+    def _require(self, fid):
+        if fid not in self._filters:
+            raise ArgumentException("Filter is not applied to the view")
+
+    def GetFilterOverrides(self, fid):
+        CALLS["View.GetFilterOverrides"] += 1
+        self._require(fid)
+        ogs = self._filters[fid]
+        return OverrideGraphicSettings(ogs) if ogs is not None else OverrideGraphicSettings()
+
+    def SetFilterOverrides(self, fid, ogs):
+        CALLS["View.SetFilterOverrides"] += 1
+        self.Document._check_modifiable()
+        self._require(fid)
+        self._filters[fid] = OverrideGraphicSettings(ogs)
+
+    def GetFilterVisibility(self, fid):
+        CALLS["View.GetFilterVisibility"] += 1
+        self._require(fid)
+        return self._visible[fid]
+
+    def SetFilterVisibility(self, fid, visible):
+        CALLS["View.SetFilterVisibility"] += 1
+        self.Document._check_modifiable()
+        self._require(fid)
+        self._visible[fid] = visible
+
+class ViewSheet(View):
+    def __init__(self, doc, number, name):
+        View.__init__(self, doc, name, ViewType.DrawingSheet)
+        self.SheetNumber = number
+
+class ViewSheetSet(Element):
+    def __init__(self, doc, name, views):
+        Element.__init__(self, doc, name)
+        self.Views = list(views)
+
+class FilterElement(Element):
+    pass
+
+class Viewport(Element):
+    def __init__(self, doc, sheet_id, view_id):
+        Element.__init__(self, doc, "Viewport")
+        self.SheetId = sheet_id
+        self.ViewId = view_id
+
+class ParameterFilterElement(FilterElement):
+    def __init__(self, doc, name, categories=None, element_filter=None):
+        FilterElement.__init__(self, doc, name)
+        self._categories = list(categories or [])
+        self._element_filter = element_filter
+
+    @staticmethod
+    def Create(doc, name, categories, element_filter=None):
+        CALLS["ParameterFilterElement.Create"] += 1
+        doc._check_modifiable()
+        return ParameterFilterElement(doc, name, categories, element_filter)
+
+    def GetCategories(self):
+        CALLS["ParameterFilterElement.GetCategories"] += 1
+        return IdCollection(self._categories)
+
+    def GetElementFilter(self):
+        CALLS["ParameterFilterElement.GetElementFilter"] += 1
+        return self._element_filter
+
+class FillPattern(object):
+    def __init__(self, target):
+        self.Target = target
+
+class FillPatternElement(Element):
+    def __init__(self, doc, name, target=FillPatternTarget.Drafting):
+        Element.__init__(self, doc, name)
+        self._pattern = FillPattern(target)
+
+    def GetFillPattern(self):
+        CALLS["FillPatternElement.GetFillPattern"] += 1
+        return self._pattern
+
+class LinePatternElement(Element):
+    @staticmethod
+    def GetSolidPatternId():
+        return ElementId(-3000010)
+
+class Category(object):
+    def __init__(self, id_value, name=""):
+        self.Id = ElementId(id_value)
+        self.Name = name
+
+class ModelElement(Element):
+    """
+    A model element of a category with plain parameter values, shown in the given
+    views (None: every non-template view).
+    """
+    def __init__(self, doc, name, category_id, views=None, **params):
+        Element.__init__(self, doc, name)
+        self.Category = Category(category_id)
+        self.params = params
+        self._views = None if views is None else set(v.IntegerValue for v in views)
+
+class Level(Element):
+    def __init__(self, doc, name, elevation=0.0):
+        Element.__init__(self, doc, name)
+        self.Elevation = elevation
+
+class SpotDimension(Element):
+    pass
+
+class Dimension(Element):
+    pass
+
+class LocationPoint(object):
+    def __init__(self, point):
+        self.Point = point
+
+# ---------------------------------------------------------------------------------
+# DOCUMENT, COLLECTOR, TRANSACTION
+# ---------------------------------------------------------------------------------
+
+class Document(object):
+    def __init__(self, title="Benchmark Model"):
+        self.Title = title
+        self.PathName = "C:\\Models\\{0}.rvt".format(title)
+        self._elements = {}
+        self._next_id = 1000
+        self._open_transaction = None
+        self.regenerations = 0
+        self.IsWorkshared = False
+        self.IsDetached = False
+        self.IsValidObject = True
+        self._app = None
+
+    def _add(self, element):
+        self._next_id += 1
+        eid = ElementId(self._next_id)
+        self._elements[eid.IntegerValue] = element
+        return eid
+
+    def _check_modifiable(self):
+        if self._open_transaction is None and not getattr(self, "_building", False):
+            raise InvalidOperationException("Modification outside of a transaction")
+
+    def GetElement(self, eid):
+        CALLS["Document.GetElement"] += 1
+        return self._elements.get(getattr(eid, "IntegerValue", eid))
+
+    @property
+    def IsModifiable(self):
+        return self._open_transaction is not None
+
+    def Save(self):
+        CALLS["Document.Save"] += 1
+        if self.IsDetached or not self.PathName:
+            raise InvalidOperationException("A detached or unsaved document needs SaveAs")
+        self._check_closable()
+
+    def SaveAs(self, path, options):
+        CALLS["Document.SaveAs"] += 1
+        self._check_closable()
+        if path in MODEL_FILES and not options.OverwriteExistingFile:
+            raise InvalidOperationException("File exists: " + path)
+        if self.IsWorkshared and not (options.worksharing and options.worksharing.SaveAsCentral):
+            raise InvalidOperationException("A workshared document must be saved as central")
+        MODEL_FILES[path] = {"workshared": self.IsWorkshared}
+        self.PathName = path
+        self.IsDetached = False
+
+    def Close(self, save=True):
+        CALLS["Document.Close"] += 1
+        self._check_closable()
+        if self._app is not None:
+            self._app.Documents.remove(self)
+            self._app = None
+        self._elements = {}
+        self.IsValidObject = False
+
+    def _check_closable(self):
+        if self._open_transaction is not None:
+            raise InvalidOperationException("A transaction is still open")
+
+class ElementMulticategoryFilter(object):
+    def __init__(self, category_ids):
+        self._ids = set(c.IntegerValue for c in category_ids)
+
+    def _passes(self, element):
+        return element.Category is not None and element.Category.Id.IntegerValue in self._ids
+
+class ElementParameterFilter(object):
+    """Parameter rules as a predicate on ModelElement.params (rules are not modelled)."""
+    def __init__(self, predicate):
+        self._predicate = predicate
+
+    def _passes(self, element):
+        return bool(self._predicate(getattr(element, "params", {})))
+
+class FilteredElementCollector(object):
+    def __init__(self, doc, view_id=None):
+        CALLS["FilteredElementCollector.new"] += 1
+        self._doc = doc
+        self._cls = None
+        self._filters = []
+        self._view_id = None
+        if view_id is not None:
+            view = doc._elements.get(view_id.IntegerValue)
+            if not isinstance(view, View) or view.IsTemplate:
+                raise ArgumentException("viewId is not a view that can hold elements")
+            self._view_id = view_id.IntegerValue
+
+    def OfClass(self, cls):
+        CALLS["FilteredElementCollector.OfClass"] += 1
+        self._cls = cls
+        return self
+
+    def WhereElementIsNotElementType(self):
+        return self
+
+    def WherePasses(self, element_filter):
+        CALLS["FilteredElementCollector.WherePasses"] += 1
+        self._filters.append(element_filter)
+        return self
+
+    def _items(self):
+        elements = self._doc._elements.values()
+        if self._view_id is not None:
+            elements = [e for e in elements if isinstance(e, ModelElement)
+                        and (e._views is None or self._view_id in e._views)]
+        if self._cls is not None:
+            elements = [e for e in elements if isinstance(e, self._cls)]
+        for f in self._filters:
+            elements = [e for e in elements if f._passes(e)]
+        return list(elements)
+
+    def __iter__(self):
+        CALLS["FilteredElementCollector.iterate"] += 1
+        return iter(self._items())
+
+    def ToElements(self):
+        CALLS["FilteredElementCollector.ToElements"] += 1
+        return self._items()
+
+    def ToElementIds(self):
+        CALLS["FilteredElementCollector.ToElementIds"] += 1
+        return IdCollection(e.Id for e in self._items())
+
+    def GetElementCount(self):
+        CALLS["FilteredElementCollector.GetElementCount"] += 1
+        return len(self._items())
+
+class Transaction(object):
+    def __init__(self, doc, name=""):
+        self._doc = doc
+        self.name = name
+        self._started = False
+
+    def Start(self):
+        CALLS["Transaction.Start"] += 1
+        if self._doc._open_transaction is not None:
+            raise InvalidOperationException("A transaction is already open")
+        self._doc._open_transaction = self
+        self._started = True
+
+    def Commit(self):
+        CALLS["Transaction.Commit"] += 1
+        self._close()
+        self._doc.regenerations += 1
+
+    def RollBack(self):
+        CALLS["Transaction.RollBack"] += 1
+        self._close()
+
+    def _close(self):
+        if not self._started:
+            raise InvalidOperationException("Transaction was not started")
+        self._doc._open_transaction = None
+        self._started = False
+
+class TransactionGroup(object):
+    """Groups transactions into one undo step (nothing is undone in the stand-in)."""
+    def __init__(self, doc, name=""):
+        self._doc = doc
+        self.name = name
+        self._started = False
+
+    def Start(self):
+        CALLS["TransactionGroup.Start"] += 1
+        self._started = True
+
+    def Assimilate(self):
+        CALLS["TransactionGroup.Assimilate"] += 1
+        self._close()
+
+    def RollBack(self):
+        CALLS["TransactionGroup.RollBack"] += 1
+        self._close()
+
+    def _close(self):
+        if not self._started:
+            raise InvalidOperationException("Transaction group was not started")
+        if self._doc._open_transaction is not None:
+            raise InvalidOperationException("A transaction is still open")
+        self._started = False
+
+# ---------------------------------------------------------------------------------
+# APPLICATION AND MODEL FILES
+# ---------------------------------------------------------------------------------
+
+# Model files the stand-in can open: path -> {"workshared": bool}
+MODEL_FILES = {}
+
+class ModelPath(object):
+    def __init__(self, path):
+        self.path = path
+
+class ModelPathUtils(object):
+    @staticmethod
+    def ConvertUserVisiblePathToModelPath(path):
+        return ModelPath(path)
+
+class BasicFileInfo(object):
+    def __init__(self, path):
+        if path not in MODEL_FILES:
+            raise FileNotFoundException(path)
+        self.IsWorkshared = MODEL_FILES[path]["workshared"]
+
+    @staticmethod
+    def Extract(path):
+        CALLS["BasicFileInfo.Extract"] += 1
+        return BasicFileInfo(path)
+
+class WorksetConfiguration(object):
+    def __init__(self, option=WorksetConfigurationOption.OpenAllWorksets):
+        self.option = option
+
+class OpenOptions(object):
+    def __init__(self):
+        self.DetachFromCentralOption = DetachFromCentralOption.DoNotDetach
+        self.Audit = False
+        self.worksets = WorksetConfiguration()
+
+    def SetOpenWorksetsConfiguration(self, config):
+        self.worksets = config
+
+class WorksharingSaveAsOptions(object):
+    def __init__(self):
+        self.SaveAsCentral = False
+
+class SaveAsOptions(object):
+    def __init__(self):
+        self.OverwriteExistingFile = False
+        self.worksharing = None
+
+    def SetWorksharingOptions(self, options):
+        self.worksharing = options
+
+class Application(object):
+    """
+    Opens MODEL_FILES entries as documents built by factory(path) (default: a
+    small build_model). Documents stay in .Documents until closed.
+    """
+    def __init__(self, factory=None):
+        self.factory = factory or (lambda path: build_model(views=100, filters=20, templates=5))
+        self.Documents = []
+
+    def OpenDocumentFile(self, model_path, options):
+        CALLS["Application.OpenDocumentFile"] += 1
+        path = model_path.path
+        if path not in MODEL_FILES:
+            raise FileNotFoundException(path)
+        counted = Counter(CALLS)      # build_model resets the counters
+        doc = self.factory(path)
+        CALLS.clear()
+        CALLS.update(counted)
+        detached = options.DetachFromCentralOption != DetachFromCentralOption.DoNotDetach
+        doc.Title = path.replace("\\", "/").rsplit("/", 1)[-1].rsplit(".", 1)[0]
+        doc.PathName = "" if detached else path
+        doc.IsWorkshared = MODEL_FILES[path]["workshared"]
+        doc.IsDetached = detached and doc.IsWorkshared
+        doc._app = self
+        self.Documents.append(doc)
+        return doc
+
+# Unit formatting stubs: Format raises so callers fall back to ludarp.units
+class FormatOptions(object):
+    def __init__(self, unit_type_id=None):
+        self.UnitTypeId = unit_type_id
+        self.Accuracy = None
+
+class UnitFormatUtils(object):
+    @staticmethod
+    def Format(*args):
+        raise NotImplementedError("UnitFormatUtils is not available in the stand-in")
+
+class ISelectionFilter(object):
+    pass
+
+# ---------------------------------------------------------------------------------
+# MODULE REGISTRATION
+# ---------------------------------------------------------------------------------
+
+_DB_NAMES = [
+    "ElementId", "Color", "OverrideGraphicSettings", "Element", "View", "ViewType",
+    "FilterElement", "ParameterFilterElement", "FillPatternElement", "FillPatternTarget",
+    "FillPattern", "LinePatternElement", "Level", "SpotDimension", "Dimension",
+    "LocationPoint", "BuiltInParameter", "StorageType", "Document", "FilteredElementCollector",
+    "Transaction", "TransactionGroup", "FormatOptions", "UnitFormatUtils", "UnitTypeId", "SpecTypeId",
+    "ViewDetailLevel", "Viewport", "ModelPathUtils", "BasicFileInfo", "OpenOptions",
+    "DetachFromCentralOption", "WorksetConfiguration", "WorksetConfigurationOption",
+    "SaveAsOptions", "WorksharingSaveAsOptions", "Category", "ElementMulticategoryFilter",
+    "ElementParameterFilter", "ViewSheet", "ViewSheetSet",
+]
+
+def install():
+    """Register Autodesk.Revit.DB / .Exceptions / .UI.Selection in sys.modules."""
+    if "Autodesk.Revit.DB" in sys.modules and getattr(sys.modules["Autodesk.Revit.DB"], "FAKE", False):
+        return
+    this = sys.modules[__name__]
+
+    def _module(name, names):
+        mod = types.ModuleType(name)
+        mod.FAKE = True
+        for n in names:
+            setattr(mod, n, getattr(this, n))
+        sys.modules[name] = mod
+        return mod
+
+    autodesk = _module("Autodesk", [])
+    revit = _module("Autodesk.Revit", [])
+    db = _module("Autodesk.Revit.DB", _DB_NAMES)
+    exceptions = _module("Autodesk.Revit.Exceptions", [
+        "OperationCanceledException", "InvalidOperationException", "ArgumentException",
+        "FileNotFoundException"
+    ])
+    ui = _module("Autodesk.Revit.UI", [])
+    selection = _module("Autodesk.Revit.UI.Selection", ["ObjectType", "ISelectionFilter"])
+    autodesk.Revit = revit
+    revit.DB, revit.Exceptions, revit.UI = db, exceptions, ui
+    ui.Selection = selection
+
+# ---------------------------------------------------------------------------------
+# MODEL BUILDER
+# ---------------------------------------------------------------------------------
+
+# Categories used for model elements and filters (walls, doors, floors, pipes)
+CATEGORY_IDS = [-2000011, -2000023, -2000032, -2008044]
+
+_VIEW_TYPES = [ViewType.FloorPlan, ViewType.CeilingPlan, ViewType.Section,
+               ViewType.Elevation, ViewType.ThreeD, ViewType.Detail]
+
+def build_model(views=1000, filters=200, templates=50, patterns=20, applied=None, sheets=None):
+    """
+    A document with the given number of views, view templates, parameter filters,
+    fill patterns, three line patterns and sheets (default: one per 30 views,
+    numbered A-101 up, the first half in sheet set "Issue Set"; add model
+    elements with add_elements). The first template carries every filter with
+    distinct overrides (the usual sync source); other views carry `applied`
+    filters (default: a tenth of them) with default overrides.
+    """
+    doc = Document()
+    doc._building = True
+    if applied is None:
+        applied = filters // 10
+
+    # One category each; every other filter also has a rule (Mark below a threshold)
+    filter_elems = [ParameterFilterElement(
+        doc, "Filter {0:04d}".format(i), [ElementId(CATEGORY_IDS[i % len(CATEGORY_IDS)])],
+        ElementParameterFilter(lambda p, limit=i % 100: p.get("Mark", 0) < limit) if i % 2 else None)
+        for i in range(filters)]
+    for i in range(patterns):
+        FillPatternElement(doc, "Pattern {0:02d}".format(i))
+    for name in ("Dash", "Dot", "Hidden"):
+        LinePatternElement(doc, name)
+
+    all_views = []
+    for i in range(templates):
+        all_views.append(View(doc, "Template {0:03d}".format(i), ViewType.FloorPlan, True))
+    for i in range(views):
+        all_views.append(View(doc, "View {0:05d}".format(i), _VIEW_TYPES[i % len(_VIEW_TYPES)]))
+
+    source = all_views[0]
+    for i, f in enumerate(filter_elems):
+        source.AddFilter(f.Id)
+        ogs = OverrideGraphicSettings()
+        ogs.SetSurfaceForegroundPatternColor(Color(i % 256, (i * 7) % 256, (i * 13) % 256))
+        ogs.SetProjectionLineWeight(1 + i % 16)
+        ogs.SetHalftone(i % 2 == 0)
+        source.SetFilterOverrides(f.Id, ogs)
+    for v in all_views[1:]:
+        for f in filter_elems[:applied]:
+            v.AddFilter(f.Id)
+
+    # Every other view follows a template; every third one is placed on a sheet,
+    # ten views per sheet
+    if sheets is None:
+        sheets = max(1, views // 30)
+    sheet_elems = [ViewSheet(doc, "A-{0}".format(101 + i), "Sheet {0:03d}".format(i)) for i in range(sheets)]
+    ViewSheetSet(doc, "Issue Set", sheet_elems[:max(1, sheets // 2)])
+    for i, v in enumerate(all_views[templates:]):
+        if i % 2 == 0 and templates:
+            v.ViewTemplateId = all_views[i % templates].Id
+        if i % 3 == 0:
+            Viewport(doc, sheet_elems[(i // 30) % sheets].Id, v.Id)
+
+    doc._building = False
+    reset_calls()
+    return doc
+
+def add_elements(doc, count, views=None, categories=None):
+    """
+    Add model elements spread over the given categories (default CATEGORY_IDS),
+    each with a "Mark" parameter 0..99, shown in the given views (default: all).
+    """
+    categories = categories or CATEGORY_IDS
+    doc._building = True
+    view_ids = [v.Id for v in views] if views is not None else None
+    for i in range(count):
+        ModelElement(doc, "Element {0}".format(i), categories[i % len(categories)], view_ids, Mark=i % 100)
+    doc._building = False
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""
+📊 LUDARP Dev: History Tail Check
+Author: PRADUL P
+
+Checks ludarp.history.HistoryTail, the incremental reader behind the live
+Calc History window, on a temporary log: the first read returns the whole log
+(legacy entries first), later reads return only appended entries, a line
+still being written waits for its newline, and a cleared log starts over.
+
+    python dev/history_tail_check.py
+"""
+import io
+import os
+import sys
+import json
+import shutil
+import tempfile
+
+from checklib import check, finish
+from ludarp import history
+
+def entry(n):
+    return history.make_history_entry(u"Level {0}".format(n), u"{0} mm".format(n), u"Level 0", u"0 mm",
+                                      u"➖ Subtraction (A-B)", u"{0} mm".format(n))
+
+def results(entries):
+    return [e["result"] for e in entries]
+
+def main():
+    folder = tempfile.mkdtemp(prefix="ludarp_history_")
+    path = os.path.join(folder, "calculator_history.jsonl")
+    legacy = os.path.join(folder, "calculator_history.json")
+    try:
+        tail = history.HistoryTail(path, legacy)
+        entries, reset = tail.read()
+        check("missing log: nothing, reset", entries == [] and reset)
+        check("missing log: unchanged", not tail.changed())
+
+        with io.open(legacy, "w", encoding="utf-8") as f:
+            f.write(json.dumps([entry(-1)], ensure_ascii=False))
+        history.append_history([entry(n) for n in range(1000)], path)
+        tail = history.HistoryTail(path, legacy)
+        check("new tail: changed before the first read", tail.changed())
+        entries, reset = tail.read()
+        check("first read: whole log, legacy first", reset and len(entries) == 1001 and
+              entries[0]["result"] == u"-1 mm" and entries[-1]["result"] == u"999 mm", len(entries))
+        check("first read: offset at the end", tail.offset == os.path.getsize(path))
+        check("idle: unchanged", not tail.changed())
+
+        history.append_history([entry(1000), entry(1001)], path)
+        check("append: changed", tail.changed())
+        entries, reset = tail.read()
+        check("append: only the new entries", not reset and results(entries) == [u"1000 mm", u"1001 mm"],
+              results(entries))
+
+        # A line still being written, then finished; a corrupt line is skipped
+        line = json.dumps(entry(1002)).encode("utf-8")
+        with open(path, "ab") as f:
+            f.write(b"{not json\n" + line[:20])
+        entries, reset = tail.read()
+        check("partial line: waits for its newline", entries == [] and not reset, results(entries))
+        with open(path, "ab") as f:
+            f.write(line[20:] + b"\n")
+        entries, reset = tail.read()
+        check("partial line: read whole once finished", results(entries) == [u"1002 mm"], results(entries))
+
+        # Cleared, then new calculations
+        os.remove(path)
+        os.remove(legacy)
+        check("cleared: changed", tail.changed())
+        history.append_history([entry(7)], path)
+        entries, reset = tail.read()
+        check("cleared: starts over", reset and results(entries) == [u"7 mm"], results(entries))
+
+        tail.reset()
+        entries, reset = tail.read()
+        check("reset: whole log again", reset and results(entries) == [u"7 mm"])
+        check("iter_history agrees", results(history.iter_history(path, legacy)) == [u"7 mm"])
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+    return finish()
+
+if __name__ == "__main__":
+    sys.exit(main())
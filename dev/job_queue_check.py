@@ -0,0 +1,240 @@
+# -*- coding: utf-8 -*-
+"""
+⏳ LUDARP Dev: Job Queue Check
+Author: PRADUL P
+
+Drives ludarp.jobs with a fake event loop and a fake clock (no Revit, no
+waiting) and checks the scheduling: slices respect the time budget, jobs run
+in order, pause / resume / cancel act between slices, and a failing step
+rolls its slice back without stopping the queue. Profile jobs then run
+slice by slice against the fakerevit.py stand-in and must leave the model in
+the same state as the one-transaction Sync Profiles replay.
+
+    python dev/job_queue_check.py
+"""
+import sys
+
+from checklib import check, finish, model_state
+
+import fakerevit
+fakerevit.install()
+
+from ludarp import jobs, profiles
+
+# ---------------------------------------------------------------------------------
+# FAKE EVENT LOOP
+# ---------------------------------------------------------------------------------
+
+class FakeClock(object):
+    """Integer milliseconds, so budgets and step costs add up exactly."""
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+class FakeLoop(object):
+    """
+    Revit's idle loop in miniature: each turn runs the UI events scheduled for
+    it, then the raised external event (if any). Records how long each turn
+    kept the loop busy, i.e. how long Revit would not answer the user.
+    """
+    def __init__(self, clock):
+        self.clock = clock
+        self.raised = False
+        self.pump = None
+        self.turn = 0
+        self.busy = []          # clock time of each turn that ran the event
+
+    def raise_event(self):
+        self.raised = True
+
+    def run(self, ui_events=None, max_turns=10000):
+        ui_events = ui_events or {}
+        while self.turn < max_turns:
+            for event in ui_events.pop(self.turn, []):
+                event()
+            if self.raised:
+                self.raised = False
+                start = self.clock()
+                self.pump.tick()
+                self.busy.append(self.clock() - start)
+            elif not ui_events:
+                break
+            self.turn += 1
+        return self.turn
+
+class CountingJob(jobs.Job):
+    """A job of fixed-cost steps that records its slice hooks and finishing order."""
+    def __init__(self, name, clock, steps, cost, finished, fail_at=None):
+        jobs.Job.__init__(self, name, self._steps, steps)
+        self.clock = clock
+        self.count = steps
+        self.cost = cost
+        self.fail_at = fail_at
+        self.finished_order = finished
+        self.hooks = {"begin": 0, "end": 0, "abort": 0}
+
+    def _steps(self):
+        for i in range(self.count):
+            if i == self.fail_at:
+                raise ValueError("step {0} failed".format(i))
+            self.clock.now += self.cost
+            yield
+
+    def begin_slice(self):
+        self.hooks["begin"] += 1
+
+    def end_slice(self):
+        self.hooks["end"] += 1
+
+    def abort_slice(self):
+        self.hooks["abort"] += 1
+
+    def close(self):
+        jobs.Job.close(self)
+        self.finished_order.append(self.name)
+
+def make_queue(budget=50):
+    clock = FakeClock()
+    queue = jobs.JobQueue(budget=budget, clock=clock)
+    loop = FakeLoop(clock)
+    loop.pump = jobs.Pump(queue, loop.raise_event)
+    return clock, queue, loop
+
+# ---------------------------------------------------------------------------------
+# SCHEDULING CHECKS
+# ---------------------------------------------------------------------------------
+
+def check_slicing():
+    clock, queue, loop = make_queue()
+    finished = []
+    job = queue.add(CountingJob("A", clock, 100, 10, finished))
+    loop.run()
+    # 20 full slices of 5 steps, then one that only finds the end
+    check("slicing: job done", job.status == jobs.DONE and job.done == 100)
+    check("slicing: 5 steps per 50 ms slice", job.slices == 21, "{0} slices".format(job.slices))
+    check("slicing: no turn over budget", max(loop.busy) <= 50, "max {0} ms".format(max(loop.busy)))
+    check("slicing: one transaction per slice", job.hooks == {"begin": 21, "end": 21, "abort": 0}, job.hooks)
+
+    # A step slower than the budget still makes progress: one step per slice
+    clock, queue, loop = make_queue()
+    job = queue.add(CountingJob("Slow", clock, 4, 200, []))
+    loop.run()
+    check("slicing: slow steps, one per slice", job.status == jobs.DONE and max(loop.busy) == 200,
+          "{0} slices".format(job.slices))
+
+def check_order():
+    clock, queue, loop = make_queue()
+    finished = []
+    for name in ("A", "B", "C"):
+        queue.add(CountingJob(name, clock, 12, 10, finished))
+    loop.run()
+    check("order: jobs finish in queue order", finished == ["A", "B", "C"], finished)
+
+    # A job added while others run goes to the back of the queue
+    clock, queue, loop = make_queue()
+    finished = []
+    queue.add(CountingJob("A", clock, 30, 10, finished))
+    late = {2: [lambda: queue.add(CountingJob("Late", clock, 3, 10, finished))]}
+    queue.add(CountingJob("B", clock, 3, 10, finished))
+    loop.run(late)
+    check("order: late job runs last", finished == ["A", "B", "Late"], finished)
+
+def check_pause_resume():
+    clock, queue, loop = make_queue()
+    finished = []
+    job = queue.add(CountingJob("A", clock, 100, 10, finished))
+    seen = []
+    events = {3: [queue.pause, lambda: seen.append(job.done)],
+              10: [lambda: seen.append(job.done), queue.resume]}
+    loop.run(events)
+    check("pause: no step while paused", seen[0] == seen[1] and 0 < seen[0] < 100, seen)
+    check("pause: resumes and finishes", job.status == jobs.DONE and job.done == 100)
+
+def check_cancel():
+    clock, queue, loop = make_queue()
+    finished = []
+    a = queue.add(CountingJob("A", clock, 100, 10, finished))
+    b = queue.add(CountingJob("B", clock, 100, 10, finished))
+    c = queue.add(CountingJob("C", clock, 10, 10, finished))
+    events = {2: [lambda: queue.cancel(b)], 4: [lambda: queue.cancel(a)]}
+    loop.run(events)
+    check("cancel: running job stops between slices", a.status == jobs.CANCELLED and 0 < a.done < 100,
+          "{0} steps".format(a.done))
+    check("cancel: slices stay balanced", a.hooks["begin"] == a.hooks["end"] and not a.hooks["abort"])
+    check("cancel: queued job never starts", b.status == jobs.CANCELLED and b.done == 0 and not b.hooks["begin"])
+    check("cancel: next job still runs", c.status == jobs.DONE)
+
+    clock, queue, loop = make_queue()
+    pair = [queue.add(CountingJob(name, clock, 100, 10, [])) for name in ("A", "B")]
+    loop.run({1: [queue.cancel]})
+    check("cancel all: queue goes idle", queue.current() is None and loop.turn <= 2,
+          [(j.status, j.done) for j in pair])
+
+def check_failure():
+    clock, queue, loop = make_queue()
+    finished = []
+    bad = queue.add(CountingJob("Bad", clock, 20, 10, finished, fail_at=12))
+    good = queue.add(CountingJob("Good", clock, 5, 10, finished))
+    loop.run()
+    check("failure: job failed with its message", bad.status == jobs.FAILED and "step 12" in bad.message, bad.message)
+    check("failure: failing slice rolled back", bad.hooks["abort"] == 1 and bad.hooks["end"] == bad.hooks["begin"] - 1,
+          bad.hooks)
+    check("failure: queue moves on", good.status == jobs.DONE and finished == ["Bad", "Good"])
+
+# ---------------------------------------------------------------------------------
+# PROFILE JOBS AGAINST THE STAND-IN
+# ---------------------------------------------------------------------------------
+
+PROFILES = [
+    {"name": "Sync", "operation": "copy_between", "source": {"name": "Template 000"},
+     "targets": {"kind": "views", "pattern": "View 00*"}, "filters": {"pattern": "Filter 00*"}},
+    {"name": "Fills", "operation": "copy_overrides", "targets": {"names": ["Template 000"]},
+     "source_filter": "Filter 0000", "filters": {"pattern": "Filter 001*"},
+     "parts": ["Projection Fills", "Halftone"]},
+    {"name": "Reset", "operation": "reset", "targets": {"kind": "views", "pattern": "View 0001*"},
+     "filters": {"pattern": "Filter 000*"}},
+    {"name": "Nothing", "operation": "reset", "targets": {"names": ["No Such View"]}, "filters": {"pattern": "*"}},
+]
+
+def check_profile_jobs():
+    modal = fakerevit.build_model(views=300, filters=40, templates=10)
+    modal.Title = "Modal Model"
+    results = profiles.run_profiles(modal, PROFILES, snapshot=False)
+    check("profiles: modal replay ran", [r["status"] for r in results] == ["ok", "ok", "ok", "skipped"],
+          [r["status"] for r in results])
+
+    doc = fakerevit.build_model(views=300, filters=40, templates=10)
+    doc.Title = "Queued Model"
+    clock, queue, loop = make_queue()
+    # Every override write "costs" a millisecond of fake time
+    original = fakerevit.View.SetFilterOverrides
+
+    def timed(self, fid, ogs):
+        clock.now += 1
+        return original(self, fid, ogs)
+    fakerevit.View.SetFilterOverrides = timed
+    try:
+        queued = [queue.add(profiles.ProfileJob(doc, p, snapshot=False)) for p in PROFILES]
+        loop.run()
+    finally:
+        fakerevit.View.SetFilterOverrides = original
+    check("profiles: every job finished", [j.status for j in queued] == [jobs.DONE] * 4,
+          [(j.status, j.message) for j in queued])
+    check("profiles: nothing-to-do job skipped", queued[-1].message.startswith("Skipped"), queued[-1].message)
+    check("profiles: long job sliced", queued[0].slices > 1, "{0} slices".format(queued[0].slices))
+    check("profiles: no transaction left open", doc._open_transaction is None)
+    check("profiles: same result as modal replay", model_state(doc) == model_state(modal))
+
+def main():
+    check_slicing()
+    check_order()
+    check_pause_resume()
+    check_cancel()
+    check_failure()
+    check_profile_jobs()
+    return finish()
+
+if __name__ == "__main__":
+    sys.exit(main())
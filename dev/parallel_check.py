@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""
+🧵 LUDARP Dev: Parallel Planning Check
+Author: PRADUL P
+
+Checks ludarp.parallel and the planning stages built on it against the
+fakerevit.py stand-in: chunk results come back in item order whatever the
+thread scheduling, errors reach the caller, progress ends at the total, and
+Graphics Standard and Restore Snapshot plans made on the worker pool are
+identical to inline (one thread) plans and leave the model as expected.
+
+    python dev/parallel_check.py
+"""
+import os
+import sys
+import time
+import random
+import tempfile
+
+from checklib import check, finish, model_state
+
+import fakerevit
+fakerevit.install()
+
+from Autodesk.Revit.DB import Color, FilteredElementCollector, FillPatternElement, View, ViewType
+from ludarp import parallel, snapshots, standards
+from ludarp.compat import id_value
+from ludarp.overrides import copy_filters_between_views, recolor_filters
+
+class Mode(object):
+    """Run the planning inline (one thread) or on a pool that takes every input."""
+    def __init__(self, workers):
+        self.workers = workers
+
+    def __enter__(self):
+        self.saved = parallel.WORKERS, parallel.MIN_PARALLEL
+        parallel.WORKERS, parallel.MIN_PARALLEL = self.workers, 0
+        return self
+
+    def __exit__(self, *exc):
+        parallel.WORKERS, parallel.MIN_PARALLEL = self.saved
+        return False
+
+def plain(actions):
+    """Actions with ids instead of Revit objects, for comparison."""
+    return [(id_value(view.Id), id_value(fid), kind, payload) for view, fid, kind, payload in actions]
+
+# ---------------------------------------------------------------------------------
+# POOL
+# ---------------------------------------------------------------------------------
+
+def check_pool():
+    def jittery(chunk):
+        time.sleep(random.random() * 0.002)
+        return [x * x for x in chunk]
+
+    items = list(range(5000))
+    seen = []
+    with Mode(6):
+        chunks = parallel.map_chunks(jittery, items, lambda done, total: seen.append((done, total)))
+    flat = [x for chunk in chunks for x in chunk]
+    check("pool: results in item order", flat == [x * x for x in items])
+    check("pool: progress ends at the total", seen and seen[-1] == (5000, 5000), seen[-1:])
+    check("pool: progress never goes back", all(a[0] <= b[0] for a, b in zip(seen, seen[1:])))
+
+    def failing(chunk):
+        if 4321 in chunk:
+            raise ValueError("bad item 4321")
+        return chunk
+    with Mode(4):
+        try:
+            parallel.map_chunks(failing, items)
+            raised = None
+        except ValueError as ex:
+            raised = str(ex)
+    check("pool: worker error reaches the caller", raised == "bad item 4321", raised)
+
+    with Mode(1):
+        chunks = parallel.map_chunks(jittery, range(10))
+    check("pool: inline run, same results", [x for c in chunks for x in c] == [x * x for x in range(10)])
+    check("pool: empty input", parallel.map_chunks(jittery, []) == [])
+
+# ---------------------------------------------------------------------------------
+# PLANNING STAGES
+# ---------------------------------------------------------------------------------
+
+def check_standard():
+    doc = fakerevit.build_model(views=200, filters=60, templates=40, applied=20)
+    doc.Title = "Standard Check"
+    folder = tempfile.mkdtemp(prefix="ludarp_parallel_")
+    path = os.path.join(folder, "standard.json")
+    standards.write_standard({"rules": [
+        {"filter": "Filter 000*", "visible": False, "transparency": 40},
+        {"filter": "Filter 001*", "templates": "Template 00*", "halftone": True},
+        {"filter": "Filter 005*", "add": True, "projection_line_weight": 5},
+        {"filter": "No Such Filter", "halftone": True},
+    ]}, path)
+    standard = standards.Standard.load(path)
+    with Mode(1):
+        serial = standards.plan(doc, standard)
+    with Mode(5):
+        pooled = standards.plan(doc, standard)
+    check("standard: same actions", plain(serial.actions) == plain(pooled.actions),
+          "{0} actions".format(len(serial.actions)))
+    check("standard: same rows and problems", serial.rows == pooled.rows and serial.problems == pooled.problems)
+    check("standard: found work", serial.actions and serial.problems, serial.problems)
+
+    standards.apply(doc, pooled, snapshot=False)
+    with Mode(5):
+        again = standards.plan(doc, standard)
+    check("standard: compliant after apply", not again.actions, "{0} left".format(len(again.actions)))
+
+def check_restore():
+    doc = fakerevit.build_model(views=600, filters=30, templates=10)
+    doc.Title = "Restore Check"
+    views = [v for v in FilteredElementCollector(doc).OfClass(View) if v.ViewType != ViewType.DrawingSheet]
+    source, targets = views[0], views[1:]
+    filter_ids = list(source.GetFilters())
+    store = snapshots.SnapshotStore(doc, root=tempfile.mkdtemp(prefix="ludarp_parallel_"))
+    before = model_state(doc)
+    entry = snapshots.capture(doc, "Check", targets, filter_ids, store=store)
+    copy_filters_between_views(doc, source, targets, filter_ids)
+    pattern = next(iter(FilteredElementCollector(doc).OfClass(FillPatternElement)))
+    for view in targets[:50]:
+        recolor_filters(doc, view, filter_ids[:5], "Projection", Color(10, 20, 30), pattern.Id)
+
+    snapshot = store.load(entry)
+    with Mode(1):
+        serial, skipped_serial = snapshots.plan_restore(doc, snapshot)
+    with Mode(6):
+        pooled, skipped_pooled = snapshots.plan_restore(doc, snapshot)
+    check("restore: same actions", plain(serial) == plain(pooled), "{0} actions".format(len(serial)))
+    check("restore: same skipped", skipped_serial == skipped_pooled)
+    snapshots.apply_actions(doc, pooled)
+    check("restore: model back to the snapshot", model_state(doc) == before)
+
+def main():
+    random.seed(7)
+    check_pool()
+    check_standard()
+    check_restore()
+    return finish()
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+"""
+⏱️ LUDARP Dev: Button Startup Benchmark
+Author: PRADUL P
+
+Measures how long every button script takes to load (imports + module-level
+code, up to but not including main()) on a cold and a warm start.
+
+    cold   all LUDARP modules (lib/ludarp and bundle-local helpers) are dropped
+           from sys.modules first, so every import is paid again
+    warm   the same script loaded again straight after, with modules cached
+
+Run it inside Revit (pyRevit "Run Script" or RevitPythonShell) so __revit__ and
+the Revit API are available, once on the old tree and once on the new one:
+
+    startup_bench.py --label before --out before.json
+    startup_bench.py --label after --out after.json
+    startup_bench.py --compare before.json after.json
+
+Loaded .NET assemblies cannot be unloaded, so "cold" measures Python-side import
+cost only; the first ever button click in a Revit session is slower still.
+
+Outside Revit, --stand-in loads the scripts against dev/fakerevit.py and inert
+placeholders for pyRevit, clr and System (every name resolves to a do-nothing
+object). That times the same Python-side imports and module-level code, with
+the Revit and .NET side left out. --extension measures another checkout, e.g.
+a worktree of the commit before a change:
+
+    python dev/startup_bench.py --stand-in --extension /tmp/before/Ludarp.extension --out before.json
+
+Recorded on the stand-in (CPython 3, median of 5, one session): the inline
+scripts before the move to lib/ludarp (87cd8d2), the move itself (e65b8e2),
+and the tree after the startup pass that loads each module only where it is
+used (snapshots at the capture point, history export on Export, the
+expression engine for formula runs, metrics reporting in the Metrics button):
+
+    Button             Cold ms (before / move / now)   Warm ms (before / move / now)
+    1_changethetype        0.99 /  2.18 /  5.72            0.85 / 0.33 / 0.36
+    2_duplicate            1.12 /  2.03 /  5.43            1.08 / 0.29 / 0.27
+    3_reset                1.03 /  2.48 /  5.36            1.05 / 0.26 / 0.22
+    Calculator             9.67 / 13.06 / 13.33            4.68 / 3.96 / 3.47
+    CopyBetween            0.84 /  2.04 /  5.32            0.78 / 0.25 / 0.26
+    Copybytype             1.13 /  2.20 /  5.45            1.16 / 0.38 / 0.39
+    History                3.34 /  5.28 /  3.57            1.12 / 1.20 / 0.08
+
+Before the startup pass the filter tools loaded cold in ~15 ms, the
+Calculator in 19 ms and History in 7 ms, because every click pulled in the
+snapshot, export and expression modules whether it used them or not.
+
+Warm loads, the normal case once a session has loaded the shared modules,
+are 3-5x faster for the filter tools, 25% faster for the Calculator and 14x
+for History. Cold loads of the filter tools stay ~5x the old inline scripts:
+what remains is compiling the shared modules they use (pickers, overrides,
+compat, metrics; ~1-2 ms each here), which has no pyc cache under IronPython
+either. History is back to its old cold time; the Calculator is within 4 ms,
+the cost of the value cache and unit formatters added since. The removed star
+import of the Revit API namespaces is free on the stand-in, so an in-Revit run
+is needed to see its share of the cold side.
+"""
+import os
+import io
+import sys
+import json
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+EXTENSION = os.path.join(ROOT, "Ludarp.extension")
+
+# Module prefixes dropped before a cold run (shared library + old bundle-local helpers)
+LOCAL_MODULES = ("ludarp", "calc_", "history_export")
+RUNS = 5
+
+# Modules replaced by inert placeholders in --stand-in mode
+STAND_IN_PACKAGES = ("pyrevit", "clr", "System")
+
+def find_scripts(extension=EXTENSION):
+    """(button name, script path) for every pushbutton of the extension."""
+    scripts = []
+    for base, _dirs, files in os.walk(extension):
+        if base.endswith(".pushbutton") and "script.py" in files:
+            name = os.path.basename(base).replace(".pushbutton", "")
+            scripts.append((name, os.path.join(base, "script.py")))
+    return sorted(scripts)
+
+def _drop_local_modules():
+    for name in list(sys.modules):
+        if name.startswith(LOCAL_MODULES):
+            del sys.modules[name]
+
+def load_script(path, host, lib):
+    """Execute a button script as pyRevit would, without running main(). Returns seconds."""
+    bundle = os.path.dirname(path)
+    with io.open(path, "rb") as f:
+        source = f.read()
+    namespace = {"__name__": "__startup_bench__", "__file__": path, "__revit__": host}
+    sys.path[:0] = [bundle, lib]
+    try:
+        start = time.time()
+        exec(compile(source, path, "exec"), namespace)
+        return time.time() - start
+    finally:
+        del sys.path[:2]
+
+def bench(host, runs=RUNS, extension=EXTENSION):
+    """Median cold and warm load time (ms) per button."""
+    lib = os.path.join(extension, "lib")
+    results = {}
+    for name, path in find_scripts(extension):
+        cold, warm = [], []
+        for _ in range(runs):
+            _drop_local_modules()
+            cold.append(load_script(path, host, lib))
+            warm.append(load_script(path, host, lib))
+        results[name] = {
+            "cold_ms": round(sorted(cold)[len(cold) // 2] * 1000, 2),
+            "warm_ms": round(sorted(warm)[len(warm) // 2] * 1000, 2),
+        }
+    return results
+
+# ---------------------------------------------------------------------------------
+# STAND-IN HOST (outside Revit)
+# ---------------------------------------------------------------------------------
+
+class _StandInType(type):
+    def __getattr__(cls, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return StandIn
+
+class StandIn(_StandInType("_StandInBase", (object,), {})):
+    """Any attribute, call, item or iteration of it gives another inert stand-in (falsy)."""
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return StandIn()
+
+    def __call__(self, *args, **kwargs):
+        return StandIn()
+
+    def __getitem__(self, key):
+        return StandIn()
+
+    def __iter__(self):
+        return iter(())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def __bool__(self):
+        return False
+    __nonzero__ = __bool__
+
+def _stand_in_attr(attr):
+    # Dunder lookups (__all__, __file__...) must fail as on a real module
+    if attr.startswith("__"):
+        raise AttributeError(attr)
+    return StandIn
+
+def _stand_in_module(name):
+    import types
+    module = types.ModuleType(name)
+    module.__path__ = []
+    module.__getattr__ = _stand_in_attr
+    return module
+
+class _StandInFinder(object):
+    """Import hook creating placeholder modules for STAND_IN_PACKAGES."""
+    def find_spec(self, name, path=None, target=None):
+        if name.split(".")[0] not in STAND_IN_PACKAGES:
+            return None
+        from importlib.machinery import ModuleSpec
+        return ModuleSpec(name, self)
+
+    def create_module(self, spec):
+        return _stand_in_module(spec.name)
+
+    def exec_module(self, module):
+        pass
+
+def install_stand_in():
+    """Fake Revit API (dev/fakerevit.py) plus placeholders for pyRevit and .NET. Returns a host."""
+    sys.path.insert(0, HERE)
+    import fakerevit
+    fakerevit.install()
+    for name, module in list(sys.modules.items()):
+        if name.startswith("Autodesk") and getattr(module, "FAKE", False):
+            # API names the stand-in does not implement resolve to placeholders
+            module.__getattr__ = _stand_in_attr
+    sys.meta_path.insert(0, _StandInFinder())
+    return StandIn()
+
+# ---------------------------------------------------------------------------------
+# REPORTS
+# ---------------------------------------------------------------------------------
+
+def print_results(results, label):
+    print("Startup benchmark ({0})".format(label))
+    print("{0:<20} {1:>10} {2:>10}".format("Button", "Cold ms", "Warm ms"))
+    for name in sorted(results):
+        r = results[name]
+        print("{0:<20} {1:>10} {2:>10}".format(name, r["cold_ms"], r["warm_ms"]))
+
+def compare(before_path, after_path):
+    with io.open(before_path, encoding="utf-8") as f:
+        before = json.load(f)
+    with io.open(after_path, encoding="utf-8") as f:
+        after = json.load(f)
+    print("{0:<20} {1:>16} {2:>16}".format("Button", "Cold ms (b -> a)", "Warm ms (b -> a)"))
+    for name in sorted(set(before["results"]) | set(after["results"])):
+        b = before["results"].get(name, {})
+        a = after["results"].get(name, {})
+        print("{0:<20} {1:>16} {2:>16}".format(
+            name,
+            "{0} -> {1}".format(b.get("cold_ms", "-"), a.get("cold_ms", "-")),
+            "{0} -> {1}".format(b.get("warm_ms", "-"), a.get("warm_ms", "-"))))
+
+def _arg(args, flag, default=None):
+    return args[args.index(flag) + 1] if flag in args else default
+
+def main(args):
+    if "--compare" in args:
+        i = args.index("--compare")
+        compare(args[i + 1], args[i + 2])
+        return
+    if "--stand-in" in args:
+        host = install_stand_in()
+    else:
+        try:
+            host = __revit__
+        except NameError:
+            print("Run this benchmark inside Revit (pyRevit Run Script / RevitPythonShell), "
+                  "or pass --stand-in.")
+            return
+    label = _arg(args, "--label", "run")
+    extension = os.path.abspath(_arg(args, "--extension", EXTENSION))
+    results = bench(host, int(_arg(args, "--runs", RUNS)), extension)
+    print_results(results, label)
+    out = _arg(args, "--out")
+    if out:
+        with io.open(out, "wb") as f:
+            f.write(json.dumps({"label": label, "results": results}, indent=2).encode("utf-8"))
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""
+📏 LUDARP Dev: Unit Engine Conformance
+Author: PRADUL P
+
+Checks the pure-Python unit engine (ludarp.units) against the pinned Revit
+output for the Calculator's UNITS table.
+
+    python dev/units_conformance.py
+
+When run inside Revit (pyRevit "Run Script" or RevitPythonShell) the same
+cases are also formatted live with UnitFormatUtils.Format, so a Revit version
+that changes its formatting shows up as a mismatch against the pinned table.
+"""
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "Ludarp.extension", "lib"))
+
+from ludarp import units
+
+def revit_formatter():
+    """Live UnitFormatUtils formatter with the Calculator's options, or None outside Revit."""
+    try:
+        from Autodesk.Revit.DB import (
+            Units, UnitSystem, UnitTypeId, SpecTypeId, FormatOptions, UnitFormatUtils
+        )
+    except ImportError:
+        return None
+
+    unit_ids = {
+        "m": UnitTypeId.Meters, "cm": UnitTypeId.Centimeters, "mm": UnitTypeId.Millimeters,
+        "ft": UnitTypeId.Feet, "fi": UnitTypeId.FeetFractionalInches,
+    }
+    doc_units = Units(UnitSystem.Metric)
+
+    def _format(value_feet, unit_key):
+        fo = FormatOptions(unit_ids[unit_key])
+        fo.Accuracy = float(units.accuracy_for(unit_key))
+        return UnitFormatUtils.Format(doc_units, SpecTypeId.Length, value_feet, False, fo)
+    return _format
+
+def report(name, mismatches):
+    total = len(units.REVIT_REFERENCE)
+    print("{0}: {1}/{2} cases match".format(name, total - len(mismatches), total))
+    for value_feet, unit_key, expected, actual in mismatches:
+        print(u"  {0!r} ft -> {1}: expected {2!r}, got {3!r}".format(
+            value_feet, unit_key, expected, actual))
+
+def main():
+    failed = False
+    mismatches = units.conformance_mismatches()
+    report("Unit engine", mismatches)
+    failed = failed or bool(mismatches)
+
+    live = revit_formatter()
+    if live is not None:
+        mismatches = units.conformance_mismatches(live)
+        report("Revit UnitFormatUtils", mismatches)
+        failed = failed or bool(mismatches)
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
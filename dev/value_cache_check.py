@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+"""
+📍 LUDARP Dev: Element Value Cache Check
+Author: PRADUL P
+
+Checks the per-document extraction cache of ludarp.extract against the
+fakerevit.py stand-in: repeat picks of the same elements (by reference id or
+resolved element) skip GetElement and the strategy chain, the cache is shared
+by every caller of the document, and document changes drop exactly the
+entries they can affect (changed and deleted elements, instances of a changed
+type, and every non-Level value when a Level moves).
+
+    python dev/value_cache_check.py
+"""
+import sys
+
+from checklib import check, finish
+
+import fakerevit
+fakerevit.install()
+
+from Autodesk.Revit.DB import ElementId, Level, LocationPoint, SpotDimension
+from ludarp import extract
+from ludarp.compat import id_value
+
+class XYZ(object):
+    def __init__(self, z):
+        self.Z = z
+
+class Spot(SpotDimension):
+    """A spot elevation whose origin follows a level."""
+    def __init__(self, doc, name, level, offset):
+        SpotDimension.__init__(self, doc, name)
+        self.level, self.offset = level, offset
+
+    @property
+    def Origin(self):
+        return XYZ(self.level.Elevation + self.offset)
+
+class Instance(fakerevit.Element):
+    """A family instance of a given type with a location point."""
+    def __init__(self, doc, name, type_id, z):
+        fakerevit.Element.__init__(self, doc, name)
+        self.type_id = type_id
+        self.Location = LocationPoint(XYZ(z))
+
+    def GetTypeId(self):
+        return self.type_id
+
+def get_elements():
+    return fakerevit.CALLS["Document.GetElement"]
+
+def build(title):
+    doc = fakerevit.Document(title)
+    levels = [Level(doc, "Level {0:02d}".format(i), elevation=i * 12.0) for i in range(40)]
+    spots = [Spot(doc, "Spot {0}".format(i), levels[i], 0.5) for i in range(10)]
+    family_type = fakerevit.Element(doc, "Column Type")
+    instances = [Instance(doc, "Column {0}".format(i), family_type.Id, i * 1.0) for i in range(5)]
+    return doc, levels, spots, family_type, instances
+
+# ---------------------------------------------------------------------------------
+# CHECKS
+# ---------------------------------------------------------------------------------
+
+def check_repeat_picks():
+    doc, levels, spots, _, _ = build("Repeat Picks")
+    ids = [l.Id for l in levels]
+    cache = extract.get_value_cache(doc)
+    fakerevit.reset_calls()
+    first = [cache.value(doc, eid) for eid in ids]
+    check("repeat: first pass reads every element", get_elements() == len(ids), get_elements())
+    check("repeat: values match the strategies", first == [extract.extract_value(l) for l in levels])
+
+    fakerevit.reset_calls()
+    again = [extract.get_value_cache(doc).value(doc, eid) for eid in ids]
+    names = [extract.get_ref_info(doc, eid) for eid in ids]
+    check("repeat: values shared across callers", again == first)
+    check("repeat: first names read the elements", get_elements() == len(ids), get_elements())
+    fakerevit.reset_calls()
+    names_again = [extract.get_ref_info(doc, eid) for eid in ids]
+    check("repeat: no GetElement on repeat picks", get_elements() == 0, get_elements())
+    check("repeat: same names", names == names_again and names[0] == "Level: Level 00", names[0])
+
+    fakerevit.reset_calls()
+    batch = extract.get_value_cache(doc).values_of(spots)
+    check("repeat: resolved elements skip GetElement", get_elements() == 0, get_elements())
+    check("repeat: spot values", batch == [i * 12.0 + 0.5 for i in range(10)])
+    check("repeat: hits counted", cache.stats()["hits"] >= 2 * len(ids), cache.stats())
+
+    other, other_levels = build("Another Model")[:2]
+    check("repeat: documents kept apart",
+          extract.get_value_cache(other).value(other, other_levels[1].Id) == 12.0 and
+          len(extract.get_value_cache(other)) == 1)
+
+def check_manual_points():
+    doc = build("Manual Points")[0]
+    cache = extract.get_value_cache(doc)
+    missing = ElementId(999999)
+    check("manual: unknown element", extract.get_ref_info(doc, missing) == extract.MANUAL_POINT)
+    check("manual: no value", cache.value(doc, missing) is None)
+    check("manual: nothing cached", len(cache) == 0, len(cache))
+
+    empty = fakerevit.Element(doc, "No Value")
+    cache.value(doc, empty.Id)
+    misses = cache.stats()["misses"]
+    check("manual: element without a value cached as None",
+          cache.value(doc, empty.Id) is None and cache.stats()["misses"] == misses)
+
+def check_invalidation():
+    doc, levels, spots, family_type, instances = build("Invalidation")
+    cache = extract.get_value_cache(doc)
+    for element in levels + spots + instances:
+        cache.value(doc, element.Id)
+        extract.get_ref_info(doc, element.Id)
+
+    # A moved level: its own value, and every value that may follow it
+    levels[3].Elevation = 100.0
+    extract.on_document_changed(doc, [], [levels[3].Id])
+    check("invalidate: moved level re-read", cache.value(doc, levels[3].Id) == 100.0)
+    check("invalidate: spots re-read after a level moves",
+          cache.value(doc, spots[3].Id) == 100.5 and id_value(spots[3].Id) in cache.values)
+    check("invalidate: other levels kept", id_value(levels[4].Id) in cache.values)
+    check("invalidate: names kept", id_value(spots[5].Id) in cache.infos)
+
+    # A renamed element
+    levels[5].Name = "Roof"
+    extract.on_document_changed(doc, [], [levels[5].Id])
+    check("invalidate: renamed element", extract.get_ref_info(doc, levels[5].Id) == "Level: Roof")
+
+    # A changed type drops its instances
+    for instance in instances:
+        instance.Location = LocationPoint(XYZ(50.0))
+    extract.on_document_changed(doc, [], [family_type.Id])
+    check("invalidate: instances of a changed type",
+          [cache.value(doc, i.Id) for i in instances] == [50.0] * len(instances))
+
+    # A deleted element
+    extract.on_document_changed(doc, [levels[7].Id], [])
+    check("invalidate: deleted element dropped", id_value(levels[7].Id) not in cache.values)
+
+    fakerevit.reset_calls()
+    extract.on_document_changed(doc, [], [ElementId(424242)])
+    check("invalidate: no API reads in the handler", get_elements() == 0)
+    untouched = build("Untouched")[0]
+    extract.on_document_changed(untouched, [], [ElementId(1)])
+    check("invalidate: empty document is a no-op", len(extract.get_value_cache(untouched)) == 0)
+
+    extract.forget(doc)
+    check("invalidate: forget clears the document", len(extract.get_value_cache(doc)) == 0)
+
+def main():
+    check_repeat_picks()
+    check_manual_points()
+    check_invalidation()
+    return finish()
+
+if __name__ == "__main__":
+    sys.exit(main())